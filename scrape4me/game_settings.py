@@ -0,0 +1,96 @@
+"""Contains the GameSettings class and the SettingsPlanner class, which chooses the settings that scrape the most words."""
+
+from dataclasses import dataclass
+
+# The options skribbl.io offers for a private room
+DRAW_TIMES = (15, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150, 160, 170, 180, 190, 200, 210, 220, 230, 240)
+ROUND_COUNTS = tuple(range(2, 11))
+WORD_COUNTS = tuple(range(1, 6))
+# How many sets of words the drawer chooses a word from in each word mode
+WORD_SETS = {'Normal': 1, 'Hidden': 1, 'Combination': 2}
+
+
+@dataclass(frozen=True)
+class GameSettings:
+    draw_time: int
+    rounds: int
+    word_count: int
+    word_mode: str
+
+    def get_word_sets(self) -> int:
+        return WORD_SETS[self.word_mode]
+
+    def get_words_per_turn(self) -> int:
+        return self.word_count * self.get_word_sets()
+
+    def get_select_values(self) -> dict[str, str]:
+        """Returns the option to choose in each of the room's settings dropdowns, by element ID."""
+        return {
+            'item-settings-drawtime': str(self.draw_time),
+            'item-settings-rounds': str(self.rounds),
+            'item-settings-wordcount': str(self.word_count),
+            'item-settings-mode': self.word_mode,
+        }
+
+    def __str__(self) -> str:
+        return f'{self.word_mode} mode, {self.word_count} words, {self.rounds} rounds, {self.draw_time} s draw time'
+
+
+# Combination mode, which has two sets of words to choose from, with as many words and rounds as possible and the
+# shortest draw time. Every turn logs all its words however long it lasts, so these are hosted until games are measured.
+DEFAULT_SETTINGS = GameSettings(draw_time=DRAW_TIMES[0], rounds=ROUND_COUNTS[-1], word_count=WORD_COUNTS[-1], word_mode='Combination')
+
+# Every word mode and word count, with the shortest draw time and the most rounds, as a turn that is guessed ends however
+# long its draw time is and more rounds spread the lobby between games over more turns. Whether more words to choose
+# from, or two words to guess at once, makes turns slower is what the planner measures.
+CANDIDATE_SETTINGS = (DEFAULT_SETTINGS,) + tuple(
+    settings for settings in (
+        GameSettings(draw_time=DRAW_TIMES[0], rounds=ROUND_COUNTS[-1], word_count=word_count, word_mode=word_mode)
+        for word_mode in WORD_SETS for word_count in reversed(WORD_COUNTS)
+    ) if settings != DEFAULT_SETTINGS
+)
+
+
+class SettingsPlanner:
+    """Chooses the room settings that log the most words per minute, from how many words games with them have logged.
+
+    Each candidate is hosted for one game before any candidate is hosted again, and after that every game is hosted with
+    the candidate that has logged the most words per minute over its games so far, so a candidate that gets slower is
+    dropped for the next best. Whether a logged word is new does not depend on the settings, so the settings that log
+    the most words per minute also see the most unique words per minute.
+    """
+
+    def __init__(self, candidates: tuple[GameSettings, ...] = CANDIDATE_SETTINGS):
+        self.candidates = candidates
+        self._games = {settings: 0 for settings in candidates}
+        self._words = {settings: 0 for settings in candidates}
+        self._seconds = {settings: 0.0 for settings in candidates}
+
+    def record_game(self, settings: GameSettings, words: int, seconds: float):
+        """Records the words logged by a game hosted with the settings, and how long it took."""
+        if settings not in self._games or seconds <= 0:
+            return
+
+        self._games[settings] += 1
+        self._words[settings] += words
+        self._seconds[settings] += seconds
+
+    def get_words_per_minute(self, settings: GameSettings) -> float | None:
+        """Returns the words per minute logged by the games hosted with the settings, or None if there have been none."""
+        if not self._games.get(settings):
+            return None
+
+        return 60 * self._words[settings] / self._seconds[settings]
+
+    def plan(self) -> GameSettings:
+        """Returns the settings to host the next game with."""
+        for settings in self.candidates:
+            if not self._games[settings]:
+                return settings
+
+        return max(self.candidates, key=self.get_words_per_minute)
+
+    def get_summary(self) -> list[str]:
+        """Returns a line for each candidate that has been hosted, best first."""
+        hosted = sorted((settings for settings in self.candidates if self._games[settings]), key=self.get_words_per_minute, reverse=True)
+        return [f'{settings}: {self.get_words_per_minute(settings):.0f} words/min over {self._games[settings]} games' for settings in hosted]
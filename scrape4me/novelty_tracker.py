@@ -0,0 +1,88 @@
+"""Contains the NoveltyTracker class."""
+
+from collections import Counter, deque
+from threading import Lock
+from time import monotonic
+
+
+class NoveltyTracker:
+    """Tracks how many of the scraped words are new, and estimates how much of the vocabulary is still unseen.
+
+    It is seeded with the encounter count of every word seen so far. The Good-Turing estimate of the chance that the
+    next encounter is of an unseen word is f1 / n, where f1 is the number of words seen exactly once and n is the number
+    of encounters. The Chao1 estimate of the number of unseen words is f1^2 / 2f2, where f2 is the number of words seen
+    exactly twice. The encounters recorded in the last window seconds give the current encounter and discovery rates.
+    """
+
+    WINDOW = 600
+
+    def __init__(self, word_frequencies: dict[str, int], window: float = WINDOW):
+        self.window = window
+        self.word_frequencies = dict(word_frequencies)
+        self.total_encounters = sum(word_frequencies.values())
+        # encounter count -> number of words encountered that many times
+        self.frequency_counts = Counter(word_frequencies.values())
+        self.start_time = monotonic()
+
+        # (time, encounters, new words) for every recorded word selection in the window
+        self._recent: deque[tuple[float, int, int]] = deque()
+        self._lock = Lock()
+
+    def record(self, words: list[str]) -> int:
+        """Counts the encounter of every word. Returns the number of words that had never been seen before."""
+        with self._lock:
+            new_words = 0
+
+            for word in words:
+                frequency = self.word_frequencies.get(word, 0)
+
+                if frequency:
+                    self.frequency_counts[frequency] -= 1
+                else:
+                    new_words += 1
+
+                self.word_frequencies[word] = frequency + 1
+                self.frequency_counts[frequency + 1] += 1
+
+            self.total_encounters += len(words)
+
+            now = monotonic()
+            self._recent.append((now, len(words), new_words))
+            while self._recent[0][0] < now - self.window:
+                self._recent.popleft()
+
+            return new_words
+
+    def get_unique_words(self) -> int:
+        return len(self.word_frequencies)
+
+    def get_missing_mass(self) -> float:
+        """Returns the Good-Turing estimate of the chance that the next encounter is of a word never seen before."""
+        with self._lock:
+            return self.frequency_counts[1] / self.total_encounters if self.total_encounters else 1.0
+
+    def estimate_unseen_words(self) -> float:
+        """Returns the Chao1 estimate of the number of words that have never been seen."""
+        with self._lock:
+            singletons, doubletons = self.frequency_counts[1], self.frequency_counts[2]
+
+        # the bias-corrected form, which stays finite when no word has been seen exactly twice
+        return singletons ** 2 / (2 * doubletons) if doubletons else singletons * (singletons - 1) / 2
+
+    def get_rates(self) -> tuple[float, float]:
+        """Returns the encounters and new words per hour over the window (or since starting, if that is shorter)."""
+        with self._lock:
+            now = monotonic()
+            while self._recent and self._recent[0][0] < now - self.window:
+                self._recent.popleft()
+
+            encounters = sum(recent[1] for recent in self._recent)
+            new_words = sum(recent[2] for recent in self._recent)
+
+        hours = max(min(now - self.start_time, self.window), 1) / 3600
+        return encounters / hours, new_words / hours
+
+    def estimate_new_words_per_hour(self) -> float:
+        """Returns the rate at which new words are expected to be found at the current encounter rate."""
+        encounters_per_hour, _ = self.get_rates()
+        return encounters_per_hour * self.get_missing_mass()
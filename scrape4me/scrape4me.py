@@ -3,152 +3,306 @@
 # for ever. Write for me copilot
 
 import argparse
+import asyncio
+import atexit
+import re
+import sys
+from functools import partial
+from multiprocessing import Event, Process, Queue
+from multiprocessing.synchronize import Event as EventType
 from os import path
-from threading import Thread
-from time import sleep
-from typing import Literal
+from queue import Empty
+from threading import Lock, Thread
+from time import monotonic, perf_counter, sleep, time
+from typing import Callable, Literal
 
-from selenium import webdriver
-from selenium.common.exceptions import (ElementClickInterceptedException,
-                                        ElementNotInteractableException,
+from selenium.common.exceptions import (ElementNotInteractableException,
                                         NoSuchElementException,
-                                        StaleElementReferenceException,
-                                        TimeoutException)
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
+                                        WebDriverException)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
+# Shared code (page probes, browser profiles, driver pool, word store) lives alongside the skribbler
+SKRIBBL4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..', 'skribbl4me')
+sys.path.append(SKRIBBL4ME_PATH)
+
+from async_webdriver import AsyncWebDriver
+from browser import BROWSER_PROFILES, SKRIBBL_URL, BrowserProfile, create_driver, get_window_size, load_skribbl
+from dom_probe import PageChangeWaiter, take_snapshot, take_snapshot_async
+from driver_pool import DriverPool
+from element_cache import ElementCache
+from encounter_log import EncounterLog
+from game_settings import DEFAULT_SETTINGS, GameSettings, SettingsPlanner
+from novelty_tracker import NoveltyTracker
+from metrics import Metrics
+from word_store import WordStore
+
 LOOP_DELAY = 0.4
-WORD_SELECT_DELAY = 0.25
+# The word choices are read and clicked in the page, which polls for them this often and gives up after the timeout
+WORD_SELECT_POLL_INTERVAL = 0.05
+WORD_SELECT_TIMEOUT = 2.5
 OVERLAY_WAIT_DELAY = 0.25
+# Block for up to this long waiting for the page to change; LOOP_DELAY polling is only used if the observer can't be installed
+CHANGE_WAIT_TIMEOUT = 1
+CHANGE_OBSERVER_RETRY_DELAY = 2
+# A browser that can't be read this many times in a row is treated as crashed
+MAX_FAILED_SNAPSHOTS = 10
+METRICS_DUMP_INTERVAL = 5
+# How often the main process reports the discovery rate, and decides whether to stop a room
+DISCOVERY_REPORT_INTERVAL = 60
 
 # Normal values are 10 and 3. For a slow PC (like a raspberry pi) use 20 and 10
 PAGE_LOAD_TIMEOUT = 10
 ELEMENT_SEARCH_TIMEOUT = 3
+# How long a scraper waits for a warm browser from the pool, which includes launching one if none are spare
+DRIVER_ACQUIRE_TIMEOUT = 60
+# How often the host checks whether the room is ready for its settings, and whether the player has joined
+ROOM_POLL_INTERVAL = 0.1
 
 RAW_WORD_ENCOUNTERS_FILE_NAME = 'word_encounters.txt'
 RAW_WORD_ENCOUNTERS_FILE_PATH = path.join(path.dirname(path.abspath(__file__)), RAW_WORD_ENCOUNTERS_FILE_NAME)
+WORD_STORE_FILE_NAME = 'word_data.sqlite3'
+WORD_STORE_FILE_PATH = path.join(path.dirname(path.abspath(__file__)), WORD_STORE_FILE_NAME)
+
+# Chooses every room setting in one go. Returns null until the room has been created (so has an invite link) and all of
+# the settings dropdowns are shown, and the invite link after that.
+GAME_SETTINGS_SCRIPT = '''
+const invite = document.getElementById('input-invite');
+const inviteLink = invite ? (invite.value || invite.innerText).trim() : '';
+if (!inviteLink) {
+    return null;
+}
+
+const options = [];
+for (const [id, text] of Object.entries(arguments[0])) {
+    const select = document.getElementById(id);
+    const option = select ? Array.from(select.options).find((option) => option.text.trim() === text) : null;
+    if (!option) {
+        return null;
+    }
+    options.push([select, option]);
+}
+
+for (const [select, option] of options) {
+    if (select.value !== option.value) {
+        select.value = option.value;
+        select.dispatchEvent(new Event('input', {bubbles: true}));
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+}
+
+return inviteLink;
+'''
+
+START_GAME_SCRIPT = '''
+const players = document.querySelectorAll('#game-players .players-list .player');
+if (players.length < 2) {
+    return false;
+}
+document.getElementById('start-game').click();
+return true;
+'''
+
+# There are arguments[2] sets of words to choose from (two for combination word mode, one otherwise), all in the word
+# select element and interlaced, i.e. WS1-1, WS2-1, WS1-2, WS2-2, etc. Records every displayed word with its set and
+# clicks the first word of each set, polling every arguments[1] milliseconds until one is chosen from every set or
+# arguments[0] milliseconds have passed.
+WORD_CHOICE_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const timeout = arguments[0];
+const pollInterval = arguments[1];
+const wordSets = arguments[2];
+const startTime = performance.now();
+
+const isDisplayed = (element) => {
+    const style = window.getComputedStyle(element);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') {
+        return false;
+    }
+    return element.getClientRects().length > 0;
+};
+
+const words = new Map();
+const chosen = [];
+
+const poll = () => {
+    const buttons = document.querySelectorAll('#game-canvas .overlay-content .words .word');
+    let clicked = false;
+
+    buttons.forEach((button, index) => {
+        const text = isDisplayed(button) ? button.innerText.trim() : '';
+        if (!text) {
+            return;
+        }
+        if (!words.has(text)) {
+            words.set(text, index % wordSets);
+        }
+        // the first displayed word of the set that still needs a choice
+        if (!clicked && chosen.length < wordSets && index % wordSets === chosen.length) {
+            button.click();
+            chosen.push(text);
+            clicked = true;
+        }
+    });
+
+    if (chosen.length < wordSets && performance.now() - startTime < timeout) {
+        setTimeout(poll, clicked ? 0 : pollInterval);
+        return;
+    }
+
+    done({words: Array.from(words, ([text, set]) => ({text: text, set: set})), chosen: chosen});
+};
+
+poll();
+'''
+
+# Only the main process writes encounters, so the store and log are opened there
+word_store: WordStore | None = None
+encounter_log: EncounterLog | None = None
+
+
+def log_words(words: list[str], round_number: int | None = None, room: int | None = None, timestamp: float | None = None) -> None:
+    """Queues the words to be appended to the encounters log by its writer thread, starting it if needed."""
+    global encounter_log
 
-# between 2 and 10 (inclusive) - 10 is most efficient
-ROUND_COUNT = 10
+    words = [word.strip() for word in words if word.strip()] # Remove empty strings
 
-global_stop_flag = False
+    print(f'Logging {len(words)} words: {words}')
 
+    if encounter_log is None:
+        encounter_log = EncounterLog(RAW_WORD_ENCOUNTERS_FILE_PATH, on_flush=sync_word_store)
+        encounter_log.start()
+        atexit.register(encounter_log.close)
 
-def log_words(words: list[str]) -> None:
-    words = [word.strip() for word in words if word.strip()] # Remove empty strings
+    encounter_log.record(words, room, round_number, timestamp)
 
-    print(f'Logging {len(words)} words: {words}')
 
-    with open(RAW_WORD_ENCOUNTERS_FILE_PATH, 'a', encoding='utf-8') as file:
-        file.write('\n'.join(words))
-        file.write('\n')
+def sync_word_store(new_lines: int) -> None:
+    # Count the newly written lines into the running totals
+    if word_store is not None:
+        word_store.sync()
 
 
+def get_round_number(snapshot: dict | None) -> int | None:
+    """Returns the game round shown in a snapshot (from e.g. 'Round 2 of 10'), or None if it isn't shown."""
+    match = re.search(r'\d+', (snapshot or {}).get('round') or '')
+    return int(match.group()) if match else None
 
 
-class Scraper:
+def get_driver_executable(executable_name: str) -> str:
+    return path.join(path.dirname(path.abspath(__file__)), '../', 'lib', 'webdriver', executable_name)
 
-    def __init__(self, role: Literal['host', 'player'], executable_name: str, webdriver_is_on_path: bool = False, headless: bool = False):
-        self.other = None
-        self.role = role
-        self.executable_name = executable_name
-        self.webdriver_is_on_path = webdriver_is_on_path
 
-        self.__init_driver(headless=headless)
+def warm_up_driver(driver: WebDriver, browser_profile: BrowserProfile = 'default', url: str = SKRIBBL_URL):
+    load_skribbl(driver, browser_profile, PAGE_LOAD_TIMEOUT, ELEMENT_SEARCH_TIMEOUT, url)
 
-    def set_other(self, other: 'Scraper'):
-        self.other = other
+    # ActionChains(driver).key_down(Keys.CONTROL).send_keys(Keys.SUBTRACT).key_up(Keys.CONTROL).perform()
+    driver.find_element(By.TAG_NAME, 'html').send_keys(Keys.CONTROL, Keys.SUBTRACT)
+    driver.find_element(By.TAG_NAME, 'html').send_keys(Keys.CONTROL, Keys.SUBTRACT)
 
-    def __init_driver(self, headless: bool = False):
-        driver_executable = path.join(path.dirname(path.abspath(__file__)), '../', 'lib', 'webdriver', self.executable_name)
 
-        browser = 'edge' if 'edgedriver' in driver_executable else 'chrome'
+def recycle_driver(driver: WebDriver, browser_profile: BrowserProfile = 'default', url: str = SKRIBBL_URL):
+    # the zoom level is kept per site, so only the page needs reloading
+    load_skribbl(driver, browser_profile, PAGE_LOAD_TIMEOUT, ELEMENT_SEARCH_TIMEOUT, url)
 
-        if browser == 'edge':
-            options = EdgeOptions()
-            options.headless = headless
-            options.add_argument('--mute-audio')
 
-            if self.webdriver_is_on_path:
-                self.driver = webdriver.Edge(options=options)
-            else:
-                service = EdgeService(executable_path=driver_executable)
-                self.driver = webdriver.Edge(service=service, options=options)
+
+
+class Scraper:
+
+    def __init__(self, role: Literal['host', 'player'], executable_name: str, webdriver_is_on_path: bool = False, headless: bool = False,
+                 stop_event: EventType | None = None, encounter_sink: Callable[[list[str], int | None], None] = log_words, browser_profile: BrowserProfile = 'default',
+                 driver_pool: DriverPool | None = None, metrics: Metrics | None = None, url: str = SKRIBBL_URL, settings: GameSettings = DEFAULT_SETTINGS,
+                 planner: SettingsPlanner | None = None):
+        self.other = None
+        self.role = role
+        self.stop_event = stop_event or Event()
+        self.encounter_sink = encounter_sink
+        self.executable_name = executable_name
+        self.webdriver_is_on_path = webdriver_is_on_path
+        self.browser_profile = browser_profile
+        self.url = url
+        # the room's settings, which the host hosts with and both scrapers choose words for
+        self.settings = settings
+        # if set, the host chooses the settings of every game with it, see host__plan_game
+        self.planner = planner
+        self.next_game_is_planned = False
+        self.words_logged = 0
+        # when the current game was counted as started, and the words both scrapers had logged by then
+        self.game_start_time: float | None = None
+        self.game_start_words = 0
+        self.page_change_waiter = PageChangeWaiter(LOOP_DELAY, CHANGE_OBSERVER_RETRY_DELAY)
+        self.metrics = metrics or Metrics('scrape4me')
+        self.element_cache = ElementCache(metrics=self.metrics)
+        # set once the scraper is attached to an event loop, see run_scrapers_async
+        self.async_driver: AsyncWebDriver | None = None
+        self.tick_start_time = perf_counter()
+        # set when start is clicked, and cleared once the game has begun, see count_game_start
+        self.game_start_requested = False
+        self.is_waiting_for_players = False
+        self.reset_loop_state()
+
+        if driver_pool is None:
+            self.__init_driver(headless=headless)
         else:
-            options = ChromeOptions()
-            options.headless = headless
-            options.add_argument('--mute-audio')
+            # already launched and warmed up, raises queue.Empty if the pool can't provide a browser in time
+            self.driver = driver_pool.acquire(timeout=DRIVER_ACQUIRE_TIMEOUT)
 
-            if self.webdriver_is_on_path:
-                self.driver = webdriver.Chrome(options=options)
-            else:
-                service = ChromeService(executable_path=driver_executable)
-                self.driver = webdriver.Chrome(service=service, options=options)
+        self.metrics.instrument_driver(self.driver)
 
-        self.driver.set_window_size(1200, 800)
         if self.role == 'host':
             self.driver.set_window_position(0, 0)
         else:
-            self.driver.set_window_position(1200, 0)
+            self.driver.set_window_position(get_window_size(self.browser_profile)[0], 0)
 
-        self.driver.get('https://skribbl.io/')
-        WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'home')))
-        assert 'skribbl' in self.driver.title
+    def set_other(self, other: 'Scraper'):
+        self.other = other
+
+    def __init_driver(self, headless: bool = False):
+        driver_executable = get_driver_executable(self.executable_name)
 
-        # ActionChains(self.driver).key_down(Keys.CONTROL).send_keys(Keys.SUBTRACT).key_up(Keys.CONTROL).perform()
-        self.driver.find_element(By.TAG_NAME, 'html').send_keys(Keys.CONTROL, Keys.SUBTRACT)
-        self.driver.find_element(By.TAG_NAME, 'html').send_keys(Keys.CONTROL, Keys.SUBTRACT)
+        self.driver = create_driver(driver_executable, webdriver_is_on_path=self.webdriver_is_on_path, profile=self.browser_profile, headless=headless, arguments=['--mute-audio'])
 
-        try:
-            WebDriverWait(self.driver, ELEMENT_SEARCH_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'cmpwelcomebtnyes')))
-            consent_button = self.driver.find_element(By.ID, 'cmpwelcomebtnyes')
-            consent_button.click()
-        except NoSuchElementException:
-            pass
-        except TimeoutException:
-            pass
+        warm_up_driver(self.driver, self.browser_profile, self.url)
 
     def host__host_game(self) -> str:
-        create_room_button = self.driver.find_element(By.ID, 'home').find_element(By.CLASS_NAME, 'button-create')
-        create_room_button.click()
+        self.element_cache.run(self.driver, 'create_room_button', lambda create_room_button: create_room_button.click())
 
-        WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'game-canvas')))
-        sleep(3)
+        settings = self.host__plan_game() if self.planner is not None else self.settings
 
-        ## Draw time
-        draw_time_dropdown = Select(self.driver.find_element(By.ID, 'item-settings-drawtime'))
-        draw_time_dropdown.select_by_visible_text('15')
+        # chooses every setting in one script call, as soon as the room is ready for them
+        invite_link = WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT, poll_frequency=ROOM_POLL_INTERVAL).until(
+            lambda driver: driver.execute_script(GAME_SETTINGS_SCRIPT, settings.get_select_values()))
 
-        ## Number of rounds
-        number_of_rounds_dropdown = Select(self.driver.find_element(By.ID, 'item-settings-rounds'))
-        number_of_rounds_dropdown.select_by_visible_text(str(ROUND_COUNT))
+        if self.planner is not None:
+            self.host__use_settings(settings, True)
 
-        ## Number of words to choose from
-        number_of_words_dropdown = Select(self.driver.find_element(By.ID, 'item-settings-wordcount'))
-        number_of_words_dropdown.select_by_visible_text('5')
+        return invite_link
 
-        ## Word mode
-        # Choose 'combination' as this allows us to select two words out of two sets of number_of_words. i.e. 10 instead of 5 per drawing
-        word_mode_dropdown = Select(self.driver.find_element(By.ID, 'item-settings-mode'))
-        word_mode_dropdown.select_by_visible_text('Combination')
+    def host__plan_game(self) -> GameSettings:
+        # records the game that has just ended with the planner, and returns the settings to host the next one with
+        if self.game_start_time is not None:
+            self.planner.record_game(self.settings, self.words_logged + self.other.words_logged - self.game_start_words, monotonic() - self.game_start_time)
+            self.game_start_time = None
 
-        ## Get invite link
-        invite_field = self.driver.find_element(By.ID, 'input-invite')
-        invite_link = invite_field.get_attribute('value')
+        self.next_game_is_planned = True
+        return self.planner.plan()
 
-        if not invite_link:
-            invite_link = invite_field.text
+    def host__use_settings(self, settings: GameSettings, applied: bool):
+        # called with whether GAME_SETTINGS_SCRIPT could choose the settings, which the room keeps if it could not
+        if not applied:
+            print(f'{self.role}: could not choose the settings, hosting with {self.settings} again')
+            return
 
-        return invite_link
+        if settings != self.settings:
+            print(f'{self.role}: hosting with {settings}')
+
+        self.settings = settings
+        self.other.settings = settings
 
     def player__join_game(self, link: str):
         self.driver.get(link)
@@ -157,50 +311,75 @@ class Scraper:
 
         sleep(1) # additional time just in case, as previous page also had #home element
 
-        join_button = self.driver.find_element(By.ID, 'home').find_element(By.CLASS_NAME, 'button-play')
-        join_button.click()
+        self.element_cache.run(self.driver, 'play_button', lambda join_button: join_button.click())
 
-    def host__start_game(self):
+    def host__start_game(self) -> bool:
+        # starts the game as soon as the player has joined, which is straight away when it returns to the lobby after a game
+        while not self.stop_event.is_set():
+            if self.handle_start_game(self.driver.execute_script(START_GAME_SCRIPT)):
+                return True
 
-        player_list = self.driver.find_element(By.ID, 'game-players').find_element(By.CLASS_NAME, 'players-list')
-        player_list_items = player_list.find_elements(By.CLASS_NAME, 'player')
+            self.stop_event.wait(ROOM_POLL_INTERVAL)
 
-        while len(player_list_items) < 2:
-            sleep(1)
+        return False
+
+    def handle_start_game(self, started: bool) -> bool:
+        # called with the result of every START_GAME_SCRIPT, so that waiting for players is only reported once per lobby
+        if started:
+            self.game_start_requested = True
+            self.is_waiting_for_players = False
+        elif not self.is_waiting_for_players:
             print('Waiting for players to join...')
-            player_list_items = player_list.find_elements(By.CLASS_NAME, 'player')
+            self.is_waiting_for_players = True
 
-        start_game_button = self.driver.find_element(By.ID, 'start-game')
-        start_game_button.click()
+        return started
 
-    # from skribbl4me.py
-    def detect_state(self):
-        screens : dict[str, WebElement | None] = {}
+    def count_game_start(self, state: str):
+        # the lobby can still be shown for a tick after start is clicked, so a game is only counted once it has begun
+        if self.game_start_requested and state == 'game':
+            self.game_start_requested = False
+            self.metrics.increment('games_started', role=self.role)
 
-        screens['login'] = self.driver.find_element(By.ID, 'home') # initial login screen
+            self.next_game_is_planned = False
+            self.game_start_time = monotonic()
+            self.game_start_words = self.words_logged + self.other.words_logged
 
-        screens['loading'] = self.driver.find_element(By.ID, 'load') # loading screen
-        screens['game'] = self.driver.find_element(By.ID, 'game') # game screen
+    def wait_for_page_change(self):
+        # a tick is everything done between two waits
+        self.metrics.observe('tick_seconds', perf_counter() - self.tick_start_time, role=self.role)
 
-        # must be after game screen
-        try:
-            screens['lobby'] = self.driver.find_element(By.CSS_SELECTOR, '.room.show') # custom lobby screen ('start-game' is a button with that ID which only displays when you're in the lobby - there is no dedicated lobby screen)
-        except NoSuchElementException:
-            screens['lobby'] = None
+        with self.metrics.time('phase_seconds', role=self.role, phase='page_wait'):
+            self.page_change_waiter.wait(self.driver, CHANGE_WAIT_TIMEOUT)
 
-        displayed = []
+        self.tick_start_time = perf_counter()
 
-        for screen_id, screen in screens.items():
-            try:
-                if screen:
-                    if screen.is_displayed():
-                        if screen_id == 'lobby':
-                            displayed.remove('game')
-                        displayed.append(screen_id)
-            except StaleElementReferenceException:
-                pass
+    async def wait_for_page_change_async(self):
+        self.metrics.observe('tick_seconds', perf_counter() - self.tick_start_time, role=self.role)
+
+        with self.metrics.time('phase_seconds', role=self.role, phase='page_wait'):
+            await self.page_change_waiter.wait_async(self.async_driver, CHANGE_WAIT_TIMEOUT)
+
+        self.tick_start_time = perf_counter()
+
+    # from skribbl4me.py
+    def detect_state(self, snapshot: dict) -> str:
+        website = snapshot['website']
 
+        displayed = []
 
+        if website['home']: # initial login screen
+            displayed.append('login')
+        if website['loading']: # loading screen
+            displayed.append('loading')
+        if website['game']: # game screen
+            displayed.append('game')
+
+        # must be after game screen
+        # custom lobby screen ('start-game' is a button with that ID which only displays when you're in the lobby - there is no dedicated lobby screen)
+        if website['room_displayed']:
+            if 'game' in displayed:
+                displayed.remove('game')
+            displayed.append('lobby')
 
         if len(displayed) == 0:
             return 'unknown'
@@ -210,187 +389,514 @@ class Scraper:
             return 'multiple'
 
     # adapted from skribbl4me.py
-    def detect_game_state(self) -> str:
-        try:
-            toolbar = self.driver.find_element(By.ID, 'game-toolbar')
-            if toolbar.is_displayed():
-                return 'drawing'
-        except NoSuchElementException:
-            pass
+    def detect_game_state(self, snapshot: dict) -> str:
+        game = snapshot['game']
 
-        try:
-            overlay = self.driver.find_element(By.ID, 'game-canvas').find_element(By.CLASS_NAME, 'overlay-content')
-            if 'top: 0' in overlay.get_attribute('style'):
-                word_select = self.driver.find_element(By.ID, 'game-canvas').find_element(By.CLASS_NAME, 'overlay-content').find_element(By.CLASS_NAME, 'words')
-                if 'show' in word_select.get_attribute('class'):
-                    return 'drawing__word_select'
-                else:
-                    return 'waiting_for_round'
-        except NoSuchElementException:
-            pass
+        if game['toolbar']:
+            return 'drawing'
 
-        try:
-            my_player = self.driver.find_element(By.ID, 'game-players').find_element(By.CLASS_NAME, 'players-list').find_element(By.CLASS_NAME, 'me')
+        if game['overlay_style'] is not None and 'top: 0' in game['overlay_style']:
+            if game['word_select_shown']:
+                return 'drawing__word_select'
+            else:
+                return 'waiting_for_round'
 
-            if 'guessed' in my_player.find_element(By.XPATH, '..').find_element(By.XPATH, '..').get_attribute('class'):
-                return 'guessed'
-        except NoSuchElementException:
-            pass
+        if game['guessed']:
+            return 'guessed'
 
         return 'guessing'
 
-    def loop(self):
+    def reset_loop_state(self):
+        self.last_game_state = None
+        self.last_chosen_words = []
+        self.failed_snapshots = 0
+        # unlike last_game_state these are updated every tick, for counting state transitions
+        self.last_counted_state = None
+        self.last_counted_game_state = None
 
-        last_game_state = None
-        last_chosen_words = []
+    def process_snapshot(self, snapshot: dict | None) -> Literal['stop', 'plan_game', 'start_game', 'choose_words', 'guess'] | None:
+        # advances the state machine with a snapshot (None if it couldn't be taken) and returns what the loop has to do
+        if snapshot is None:
+            self.failed_snapshots += 1
+            if self.failed_snapshots >= MAX_FAILED_SNAPSHOTS:
+                print(f'{self.role}: browser is not responding')
+                return 'stop'
 
-        while True:
+            return None
 
-            if global_stop_flag:
-                break
+        self.failed_snapshots = 0
 
-            state = self.detect_state()
-            # print(f'{self.role}: {state}')
+        with self.metrics.time('phase_seconds', role=self.role, phase='state_detection'):
+            state = self.detect_state(snapshot)
+            game_state = self.detect_game_state(snapshot) if state == 'game' else None
 
-            match state:
-                case 'lobby':
-                    if self.role == 'host':
-                        try:
-                            self.host__start_game()
-                        except (ElementClickInterceptedException, ElementNotInteractableException):
-                            print('Couldn\'t start game, button is covered by overlay. Retrying...')
-                            pass
+        if state != self.last_counted_state:
+            self.metrics.increment('state_transitions', role=self.role, kind='website', state=state)
+            self.last_counted_state = state
 
+        if game_state is not None and game_state != self.last_counted_game_state:
+            self.metrics.increment('state_transitions', role=self.role, kind='game', state=game_state)
+            self.last_counted_game_state = game_state
 
-                    sleep(LOOP_DELAY)
-                    continue
+        self.count_game_start(state)
 
-                case 'game':
-                    game_state = self.detect_game_state()
-                    # print(f'{self.role}: {state}/{game_state}')
+        if state == 'lobby':
+            if self.role != 'host':
+                return None
 
-                    if game_state == 'drawing__word_select':
-                        if game_state != last_game_state:
-                            last_game_state = game_state
+            # the next game's settings are chosen once per lobby, before it is started
+            return 'plan_game' if self.planner is not None and not self.next_game_is_planned else 'start_game'
 
-                            word_select = self.driver.find_element(By.ID, 'game-canvas').find_element(By.CLASS_NAME, 'overlay-content').find_element(By.CLASS_NAME, 'words')
-                            word_select_buttons = word_select.find_elements(By.CLASS_NAME, 'word')
+        # everything else is only done once per game state
+        if game_state is None or game_state == self.last_game_state:
+            return None
 
-                            # For combination word mode, there are two sets of words to choose from. They are both in the word_select element.
-                            # They are interlaced, i.e. WS1-1, WS2-1, WS1-2, WS2-2, etc.
-                            # We need to log all words, then choose one from the first set, wait, then choose one from the second set.
+        self.last_game_state = game_state
 
-                            last_chosen_words = []
-                            words_to_log = set()
+        match game_state:
+            case 'drawing__word_select':
+                return 'choose_words'
+            case 'drawing':
+                # the other scraper guesses the word this one chose
+                return 'guess'
 
-                            counter = 0
-                            while counter < 10:
-                                if len(last_chosen_words) == 2:
-                                    break
+        return None
 
-                                counter += 1
-                                sleep(WORD_SELECT_DELAY)
+    def loop(self):
+        self.reset_loop_state()
 
-                                visible_word_select_buttons = [button for button in word_select_buttons if button.is_displayed() and button.text.strip()]
-                                if not visible_word_select_buttons:
-                                    continue
+        while not self.stop_event.is_set():
 
-                                for button in visible_word_select_buttons:
-                                    words_to_log.add(button.text)
+            with self.metrics.time('phase_seconds', role=self.role, phase='snapshot'):
+                snapshot = take_snapshot(self.driver)
 
-                                try:
-                                    chosen_word = visible_word_select_buttons[0]
-                                    chosen_word_text = chosen_word.text.strip()
+            match self.process_snapshot(snapshot):
+                case 'stop':
+                    break
 
-                                    if not chosen_word_text:
-                                        continue
-                                    if chosen_word_text in last_chosen_words:
-                                        continue
+                case 'plan_game':
+                    settings = self.host__plan_game()
+                    self.host__use_settings(settings, bool(self.driver.execute_script(GAME_SETTINGS_SCRIPT, settings.get_select_values())))
+                    self.handle_start_game(self.driver.execute_script(START_GAME_SCRIPT))
 
-                                    chosen_word.click()
-                                    last_chosen_words.append(chosen_word_text)
-                                except (ElementNotInteractableException, NoSuchElementException):
-                                    pass
+                case 'start_game':
+                    self.handle_start_game(self.driver.execute_script(START_GAME_SCRIPT))
 
-                            log_words(list(words_to_log))
+                case 'choose_words':
+                    with self.metrics.time('phase_seconds', role=self.role, phase='word_selection'):
+                        self.last_chosen_words = self.choose_words(get_round_number(snapshot))
 
-                            if counter == 10:
-                                print('Error: Could not select word from word select screen. This round will take longer than usual.')
-                        else:
-                            # already logged these words, so just wait for the round to start
-                            pass
+                case 'guess':
+                    sleep(OVERLAY_WAIT_DELAY) # ensure overlay is gone
 
-                    elif game_state == 'drawing':
-                        if game_state != last_game_state:
-                            last_game_state = game_state
+                    with self.metrics.time('phase_seconds', role=self.role, phase='guess_submission'):
+                        self.other.guess('+'.join(self.last_chosen_words))
 
-                            sleep(OVERLAY_WAIT_DELAY) # ensure overlay is gone
+            self.wait_for_page_change()
 
-                            self.other.guess('+'.join(last_chosen_words))
+    def choose_words(self, round_number: int | None = None) -> list[str]:
+        # logs every word choice and chooses one from each set in a single round trip
+        try:
+            word_choices = self.driver.execute_async_script(WORD_CHOICE_SCRIPT, WORD_SELECT_TIMEOUT * 1000, WORD_SELECT_POLL_INTERVAL * 1000, self.settings.get_word_sets())
+        except WebDriverException as e:
+            print(f'{self.role}: could not read the word choices: {e.msg}')
+            word_choices = None
 
+        return self.log_word_choices(word_choices, round_number)
 
+    def log_word_choices(self, word_choices: dict | None, round_number: int | None) -> list[str]:
+        words = [choice['text'] for choice in word_choices['words']] if word_choices else []
+        chosen_words = word_choices['chosen'] if word_choices else []
 
-                    elif game_state == 'waiting_for_round':
-                        if game_state != last_game_state:
-                            last_game_state = game_state
+        self.encounter_sink(words, round_number)
+        self.words_logged += len(words)
 
-                    elif game_state == 'guessed':
-                        if game_state != last_game_state:
-                            last_game_state = game_state
+        if len(chosen_words) < self.settings.get_word_sets():
+            print('Error: Could not select word from word select screen. This round will take longer than usual.')
 
-            sleep(LOOP_DELAY)
-            continue
+        return chosen_words
 
     def guess(self, word):
-        # #game > #game-wrapper #game-chat > .chat-container > form > input
-        guess_input = self.driver.find_element(By.ID, 'game-wrapper').find_element(By.ID, 'game-chat').find_element(By.CLASS_NAME, 'chat-container').find_element(By.TAG_NAME, 'form').find_element(By.TAG_NAME, 'input')
-
         try:
-            guess_input.send_keys(word)
-            guess_input.send_keys('\n')
+            # found once and reused for every guess, and typed and submitted in one round trip
+            self.element_cache.run(self.driver, 'chat_input', lambda guess_input: guess_input.send_keys(word + '\n'))
         except ElementNotInteractableException:
             print('Guess input field is not interactable')
 
 
+    async def loop_async(self):
+        # same as loop, but everything in the page is done with scripts through the async driver
+        self.reset_loop_state()
+
+        while not self.stop_event.is_set():
+
+            with self.metrics.time('phase_seconds', role=self.role, phase='snapshot'):
+                snapshot = await take_snapshot_async(self.async_driver)
+
+            match self.process_snapshot(snapshot):
+                case 'stop':
+                    break
+
+                case 'plan_game':
+                    settings = self.host__plan_game()
+                    self.host__use_settings(settings, bool(await self.async_driver.execute_script(GAME_SETTINGS_SCRIPT, settings.get_select_values())))
+                    self.handle_start_game(await self.async_driver.execute_script(START_GAME_SCRIPT))
+
+                case 'start_game':
+                    self.handle_start_game(await self.async_driver.execute_script(START_GAME_SCRIPT))
+
+                case 'choose_words':
+                    with self.metrics.time('phase_seconds', role=self.role, phase='word_selection'):
+                        self.last_chosen_words = await self.choose_words_async(get_round_number(snapshot))
+
+                case 'guess':
+                    await asyncio.sleep(OVERLAY_WAIT_DELAY) # ensure overlay is gone
+
+                    with self.metrics.time('phase_seconds', role=self.role, phase='guess_submission'):
+                        await self.other.guess_async('+'.join(self.last_chosen_words))
+
+            await self.wait_for_page_change_async()
+
+    async def choose_words_async(self, round_number: int | None = None) -> list[str]:
+        try:
+            word_choices = await self.async_driver.execute_async_script(WORD_CHOICE_SCRIPT, WORD_SELECT_TIMEOUT * 1000, WORD_SELECT_POLL_INTERVAL * 1000, self.settings.get_word_sets())
+        except WebDriverException as e:
+            print(f'{self.role}: could not read the word choices: {e.msg}')
+            word_choices = None
+
+        return self.log_word_choices(word_choices, round_number)
+
+    async def guess_async(self, word):
+        try:
+            await self.element_cache.run_async(self.async_driver, 'chat_input', lambda guess_input: guess_input.send_keys(word + '\n'))
+        except (ElementNotInteractableException, NoSuchElementException):
+            print('Guess input field is not interactable')
+
+
+class RoomStats:
+
+    def __init__(self, room: int):
+        self.room = room
+        self.word_selections = 0
+        self.words_logged = 0
+        self.new_words = 0
+
+
+class SessionStats:
+
+    def __init__(self, encounter_sink: Callable[[list[str], int | None], None]):
+        self.encounter_sink = encounter_sink
+        self.start_time = monotonic()
+        self.word_selections = 0
+        self.words_logged = 0
+        self._lock = Lock()
+
+    def record(self, words: list[str], round_number: int | None):
+        # used as both scrapers' encounter sink, so may be called from two threads at once
+        with self._lock:
+            self.word_selections += 1
+            self.words_logged += len(words)
+
+        self.encounter_sink(words, round_number)
+
+    def get_words_per_minute(self) -> float:
+        return self.words_logged / max((monotonic() - self.start_time) / 60, 1e-9)
+
+
+def run_scraper_loop(room: int, scraper: Scraper, session_stop_event: EventType):
+    try:
+        scraper.loop()
+    except WebDriverException as e:
+        scraper.metrics.increment('exceptions', role=scraper.role, type=type(e).__name__, metric='loop')
+        print(f'Room {room}: {scraper.role} crashed: {e.msg}')
+    finally:
+        # a crashed scraper ends the session for both of them
+        session_stop_event.set()
+
+
+async def run_scraper_loop_async(room: int, scraper: Scraper, session_stop_event: EventType):
+    try:
+        await scraper.loop_async()
+    except WebDriverException as e:
+        scraper.metrics.increment('exceptions', role=scraper.role, type=type(e).__name__, metric='loop')
+        print(f'Room {room}: {scraper.role} crashed: {e.msg}')
+    finally:
+        session_stop_event.set()
+
+
+async def run_scrapers_async(room: int, scrapers: list[Scraper], session_stop_event: EventType):
+    """Runs the scrapers' loops together on one event loop, talking to their browsers with async drivers."""
+    for scraper in scrapers:
+        scraper.async_driver = AsyncWebDriver.from_selenium(scraper.driver, metrics=scraper.metrics)
+
+    try:
+        await asyncio.gather(*(run_scraper_loop_async(room, scraper, session_stop_event) for scraper in scrapers))
+    finally:
+        for scraper in scrapers:
+            await scraper.async_driver.quit()
+            scraper.async_driver = None
+
+
+def run_session(room: int, executable_name: str, driver_pool: DriverPool, browser_profile: BrowserProfile, stop_event: EventType, encounter_sink: Callable[[list[str], int | None], None],
+                metrics: Metrics, metrics_path: str | None = None, use_async: bool = False, planner: SettingsPlanner | None = None):
+    """Hosts and plays private games with browsers from the pool until it fails or the stop event is set.
+
+    The scrapers' loops run on a thread each, or with use_async together on one thread running an event loop. The host
+    starts the next game as soon as the room returns to the lobby, with the settings the planner chooses for it (or the
+    default settings for every game without one). When the session ends, the words it logged per
+    minute (including setting it up) are reported.
+    """
+    session_stop_event = Event()
+    session_stats = SessionStats(encounter_sink)
+    scrapers: list[Scraper] = []
+
+    try:
+        host = Scraper('host', executable_name, stop_event=session_stop_event, encounter_sink=session_stats.record, browser_profile=browser_profile, driver_pool=driver_pool, metrics=metrics, planner=planner)
+        scrapers.append(host)
+        player = Scraper('player', executable_name, stop_event=session_stop_event, encounter_sink=session_stats.record, browser_profile=browser_profile, driver_pool=driver_pool, metrics=metrics)
+        scrapers.append(player)
+
+        host.set_other(player)
+        player.set_other(host)
+
+        host_link = host.host__host_game()
+
+        print(f'Room {room}: host link "{host_link}"')
+
+        player.player__join_game(host_link)
+
+        host.host__start_game()
+
+        if use_async:
+            loop_threads = [Thread(target=asyncio.run, args=(run_scrapers_async(room, [player, host], session_stop_event),))]
+        else:
+            loop_threads = [Thread(target=run_scraper_loop, args=(room, scraper, session_stop_event)) for scraper in (player, host)]
+
+        for loop_thread in loop_threads:
+            loop_thread.start()
+
+        print(f'Room {room}: threads started!')
+
+        next_metrics_dump_time = 0.0
+
+        while not session_stop_event.wait(1):
+            if stop_event.is_set():
+                session_stop_event.set()
+
+            if metrics_path is not None and monotonic() >= next_metrics_dump_time:
+                metrics.dump(metrics_path)
+                next_metrics_dump_time = monotonic() + METRICS_DUMP_INTERVAL
+
+        for loop_thread in loop_threads:
+            loop_thread.join()
+    finally:
+        session_stop_event.set()
+
+        print(f'Room {room}: session logged {session_stats.words_logged} words from {session_stats.word_selections} word selections '
+              f'({session_stats.get_words_per_minute():.0f} words/min)')
+
+        # the pool quits every browser once the room stops, so they are only recycled for the next session
+        if not stop_event.is_set():
+            for scraper in scrapers:
+                driver_pool.release(scraper.driver)
+
+
+def run_room(room: int, executable_name: str, webdriver_is_on_path: bool, headless: bool, browser_profile: BrowserProfile, stop_event: EventType, encounter_queue: Queue,
+             spare_browsers: int = 1, metrics_path: str | None = None, use_async: bool = False, url: str = SKRIBBL_URL):
+    """Runs host/player sessions until the stop event is set, sending every word selection to the encounter queue.
+
+    The browsers come from a pool that keeps them warm, along with spare_browsers extra ones, so a failed session is
+    restarted straight away instead of launching and loading two new browsers. If metrics_path is given, the room's
+    timings and counters are written to it with the room number added, e.g. metrics.json becomes metrics-room1.json.
+    """
+
+    def encounter_sink(words: list[str], round_number: int | None):
+        encounter_queue.put((room, round_number, time(), words))
+
+    driver_pool = DriverPool(
+        partial(create_driver, get_driver_executable(executable_name), webdriver_is_on_path=webdriver_is_on_path, profile=browser_profile, headless=headless, arguments=['--mute-audio']),
+        partial(warm_up_driver, browser_profile=browser_profile, url=url),
+        size=2 + spare_browsers,
+        recycle=partial(recycle_driver, browser_profile=browser_profile, url=url),
+    )
+    driver_pool.start()
+
+    # kept for the whole room, so that every session hosts with what the ones before it measured
+    planner = SettingsPlanner()
+
+    metrics = Metrics('scrape4me')
+    if metrics_path is not None:
+        metrics_path_root, metrics_path_extension = path.splitext(metrics_path)
+        metrics_path = f'{metrics_path_root}-room{room}{metrics_path_extension}'
+
+    try:
+        while not stop_event.is_set():
+            session_start_time = monotonic()
+
+            try:
+                run_session(room, executable_name, driver_pool, browser_profile, stop_event, encounter_sink, metrics, metrics_path, use_async, planner)
+            except Empty:
+                print(f'Room {room}: could not get a browser from the pool, stopping room')
+                break
+            except (WebDriverException, AssertionError) as e:
+                metrics.increment('exceptions', type=type(e).__name__, metric='session_setup')
+                print(f'Room {room}: session failed during setup: {e}')
+
+            if not stop_event.is_set():
+                metrics.increment('session_restarts')
+                print(f'Room {room}: session ended after {monotonic() - session_start_time:.0f} s, restarting with warm browsers')
+    finally:
+        driver_pool.close()
+
+        for line in planner.get_summary():
+            print(f'Room {room}: {line}')
+
+        if metrics_path is not None:
+            metrics.dump(metrics_path)
+
+
+def aggregate_encounters(encounter_queue: Queue, room_stats: dict[int, RoomStats], novelty_tracker: NoveltyTracker):
+    """Queues the encounters from every room for the encounter log until a None sentinel is received."""
+    while True:
+        item = encounter_queue.get()
+        if item is None:
+            break
+
+        room, round_number, timestamp, words = item
+        words = [word.strip() for word in words if word.strip()]
+
+        stats = room_stats[room]
+        stats.word_selections += 1
+        stats.words_logged += len(words)
+        stats.new_words += novelty_tracker.record(words)
+
+        print(f'Room {room}: ', end='')
+        log_words(words, round_number, room=room, timestamp=timestamp)
+
+
+def wait_for_enter(exit_requested: EventType):
+    try:
+        input('>> Press enter at any time to exit <<')
+    except EOFError:
+        # no terminal to read from, so only saturation, the rooms stopping on their own (or an interrupt) stops scraping
+        return
+
+    exit_requested.set()
+
+
+def monitor_discovery(novelty_tracker: NoveltyTracker, room_processes: dict[int, Process], room_stop_events: dict[int, EventType], exit_requested: EventType,
+                      min_new_words_per_hour: float | None = None):
+    """Reports the discovery rate every DISCOVERY_REPORT_INTERVAL seconds until exit is requested or every room has stopped.
+
+    A room has stopped once it has been told to stop or its process has exited, as a room gives up on its own when its
+    sessions cannot be restarted.
+
+    With min_new_words_per_hour, a room is stopped whenever both the new words each room found per hour over the tracker
+    window and the Good-Turing estimate of the new words it will find are below it, at most once per window so that the
+    rates can settle in between. The estimate alone is not enough, as it is near zero whenever the seeded history has no
+    word seen only once, however many new words the rooms are still finding. Once the last room is stopped, scraping is
+    over.
+    """
+    next_scale_down_time = monotonic() + novelty_tracker.window
+
+    while not exit_requested.wait(DISCOVERY_REPORT_INTERVAL):
+        running_rooms = [room for room, room_stop_event in room_stop_events.items() if not room_stop_event.is_set() and room_processes[room].is_alive()]
+        if not running_rooms:
+            print('Every room has stopped')
+            break
+
+        encounters_per_hour, new_words_per_hour = novelty_tracker.get_rates()
+        room_new_words_per_hour = new_words_per_hour / len(running_rooms)
+        estimated_new_words_per_hour = novelty_tracker.estimate_new_words_per_hour() / len(running_rooms)
+
+        print(f'Discovery: {novelty_tracker.get_unique_words()} unique words, {new_words_per_hour:.0f} new words/hour from {encounters_per_hour:.0f} encounters/hour, '
+              f'{novelty_tracker.get_missing_mass():.2%} chance the next word is new, ~{novelty_tracker.estimate_unseen_words():.0f} words unseen, '
+              f'{estimated_new_words_per_hour:.1f} new words/hour expected per room')
+
+        if min_new_words_per_hour is None or monotonic() < next_scale_down_time:
+            continue
+        if room_new_words_per_hour >= min_new_words_per_hour or estimated_new_words_per_hour >= min_new_words_per_hour:
+            continue
+
+        room = running_rooms[-1]
+        print(f'Room {room}: stopping, as each room found {room_new_words_per_hour:.1f} new words/hour and is only expected to find '
+              f'{estimated_new_words_per_hour:.1f}')
+        room_stop_events[room].set()
+        next_scale_down_time = monotonic() + novelty_tracker.window
+
+        if len(running_rooms) == 1:
+            print('New words are too rare to keep scraping')
+            break
+
+
 if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(description='Skribbl.io bot')
     parser.add_argument('-d', '--driver', required=True, help='Name of the webdriver executable (in ../lib or PATH)')
     parser.add_argument('-p', '--path-enable', action='store_true', help='Enable PATH search for webdriver executable (instead of searching ../lib)')
     parser.add_argument('--headless', action='store_true', help='Run webdriver in headless mode')
+    parser.add_argument('--profile', choices=BROWSER_PROFILES, default='default', help='Browser profile to launch the browsers with')
+    parser.add_argument('-r', '--rooms', type=int, default=1, help='Number of host/player pairs to run, each in its own process')
+    parser.add_argument('--metrics-file', help='File to periodically write each room\'s loop timings and counters to, as JSON if it ends in .json and as Prometheus text otherwise')
+    parser.add_argument('--async', dest='use_async', action='store_true', help='Run each room\'s scraping loops on an event loop with async WebDriver clients instead of a thread each')
+    parser.add_argument('--spare-browsers', type=int, default=1, help='Number of extra warm browsers each room keeps ready to restart a failed session with')
+    parser.add_argument('--url', default=SKRIBBL_URL, help='Address of the game to scrape, e.g. a local stand-in for testing')
+    parser.add_argument('--min-new-words-per-hour', type=float, help='Stop a room (and once the last room is stopped, scraping) whenever each room both found and is expected to find fewer new words per hour than this')
     args = parser.parse_args()
 
+    word_store = WordStore(WORD_STORE_FILE_PATH, RAW_WORD_ENCOUNTERS_FILE_PATH)
+    word_store.sync()
+    novelty_tracker = NoveltyTracker(word_store.get_word_frequencies())
+
+    encounter_log = EncounterLog(RAW_WORD_ENCOUNTERS_FILE_PATH, on_flush=sync_word_store)
+    encounter_log.start()
+
     print('Starting drivers and logging in... (this may take a while)')
     print('Once the threads start, you can exit the program by pressing enter in the terminal.')
 
-    host = Scraper('host', args.driver, webdriver_is_on_path=args.path_enable, headless=args.headless)
-    player = Scraper('player', args.driver, webdriver_is_on_path=args.path_enable, headless=args.headless)
+    encounter_queue = Queue()
+    room_stats = {room: RoomStats(room) for room in range(1, args.rooms + 1)}
+    # each room can be stopped on its own when new words get too rare to be worth the browsers
+    room_stop_events = {room: Event() for room in room_stats}
 
-    host.set_other(player)
-    player.set_other(host)
+    aggregator_thread = Thread(target=aggregate_encounters, args=(encounter_queue, room_stats, novelty_tracker))
+    aggregator_thread.start()
 
-    host_link = host.host__host_game()
+    room_processes = {
+        room: Process(target=run_room, args=(room, args.driver, args.path_enable, args.headless, args.profile, room_stop_events[room], encounter_queue, args.spare_browsers, args.metrics_file, args.use_async, args.url))
+        for room in room_stats
+    }
 
-    print(f'Host link: "{host_link}"')
+    start_time = monotonic()
 
-    player.player__join_game(host_link)
+    for room_process in room_processes.values():
+        room_process.start()
 
-    host.host__start_game()
+    exit_requested = Event()
+    Thread(target=wait_for_enter, args=(exit_requested,), daemon=True).start()
 
-    player_thread = Thread(target=player.loop)
-    host_thread = Thread(target=host.loop)
+    monitor_discovery(novelty_tracker, room_processes, room_stop_events, exit_requested, args.min_new_words_per_hour)
+    print('Exiting, please wait...')
 
-    player_thread.start()
-    host_thread.start()
+    for room_stop_event in room_stop_events.values():
+        room_stop_event.set()
 
-    print('Threads started!')
-    input('>> Press enter at any time to exit <<')
-    print('Exiting, please wait...')
+    for room_process in room_processes.values():
+        room_process.join()
+
+    encounter_queue.put(None)
+    aggregator_thread.join()
+
+    # writes out the last batch of encounters (and syncs the store with it) before the store is closed
+    encounter_log.close()
+    word_store.close()
 
-    global_stop_flag = True
+    elapsed_hours = (monotonic() - start_time) / 3600
 
-    player.driver.quit()
-    host.driver.quit()
+    print(f'Scraped for {elapsed_hours * 60:.1f} minutes')
+    for stats in room_stats.values():
+        print(f'Room {stats.room}: {stats.word_selections} word selections, {stats.words_logged} words logged, {stats.new_words} new words ({stats.new_words / elapsed_hours:.0f} new words/hour)')
 
-    player_thread.join()
-    host_thread.join()
\ No newline at end of file
+    total_new_words = sum(stats.new_words for stats in room_stats.values())
+    print(f'Total: {sum(stats.words_logged for stats in room_stats.values())} words logged, {total_new_words} new words ({total_new_words / elapsed_hours:.0f} new words/hour)')
+    print(f'{novelty_tracker.get_unique_words()} unique words seen, ~{novelty_tracker.estimate_unseen_words():.0f} estimated unseen')
@@ -1,20 +1,23 @@
-import json
+import sys
 from os import path
 
 import matplotlib.pyplot as plt
 
-COLLATED_WORD_ENCOUNTERS_FILE = 'word_data.json'
-collated_word_encounters_path = path.join(path.dirname(path.abspath(__file__)), COLLATED_WORD_ENCOUNTERS_FILE)
+SKRIBBL4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..', 'skribbl4me')
+sys.path.append(SKRIBBL4ME_PATH)
 
-with open(collated_word_encounters_path, 'r', encoding='utf-8') as file:
-    json_data = json.load(file)
+from word_store import load_word_frequencies
 
-words = json_data['words']
+RAW_WORD_ENCOUNTERS_FILE = 'word_encounters.txt'
+WORD_STORE_FILE = 'word_data.sqlite3'
+raw_word_encounters_path = path.join(path.dirname(path.abspath(__file__)), RAW_WORD_ENCOUNTERS_FILE)
+word_store_path = path.join(path.dirname(path.abspath(__file__)), WORD_STORE_FILE)
+
+word_frequencies = load_word_frequencies(word_store_path, raw_word_encounters_path)
 
 # plot a bar chart of word against frequency
 
-top_words = sorted(words, key=lambda word: word['frequency'], reverse=True)[:20]
-top_words = [(word['word'], word['frequency']) for word in top_words]
+top_words = sorted(word_frequencies.items(), key=lambda word: word[1], reverse=True)[:20]
 
 # plot
 plt.bar(*zip(*top_words))
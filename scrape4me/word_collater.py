@@ -1,41 +1,51 @@
+import argparse
 import json
+import sys
 from os import path
 
+SKRIBBL4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..', 'skribbl4me')
+sys.path.append(SKRIBBL4ME_PATH)
+
+from word_store import WordStore
+
 RAW_WORD_ENCOUNTERS_FILE = 'word_encounters.txt'
 COLLATED_WORD_ENCOUNTERS_FILE = 'word_data.json'
+WORD_STORE_FILE = 'word_data.sqlite3'
 
 raw_word_encounters_path = path.join(path.dirname(path.abspath(__file__)), RAW_WORD_ENCOUNTERS_FILE)
 collated_word_encounters_path = path.join(path.dirname(path.abspath(__file__)), COLLATED_WORD_ENCOUNTERS_FILE)
+word_store_path = path.join(path.dirname(path.abspath(__file__)), WORD_STORE_FILE)
+
+parser = argparse.ArgumentParser(description='Collates word encounters into the word store')
+parser.add_argument('--export-json', action='store_true', help=f'Also rewrite {COLLATED_WORD_ENCOUNTERS_FILE} from the word store')
+args = parser.parse_args()
 
-word_encounters: dict[str, int] = {}
-total_word_encounters = 0
+word_store = WordStore(word_store_path, raw_word_encounters_path)
 
-with open(raw_word_encounters_path, 'r', encoding='utf-8') as file:
-    for line in file:
-        word = line.strip()
-        if word not in word_encounters:
-            word_encounters[word] = 0
-        
-        word_encounters[word] += 1
-        total_word_encounters += 1
+# Only the lines logged since the last collation are read
+new_word_encounters = word_store.sync()
 
-avg_frequency = total_word_encounters / len(word_encounters)
+word_encounters = word_store.get_word_frequencies()
+total_word_encounters = word_store.get_total_word_encounters()
 
+word_store.close()
+
+avg_frequency = total_word_encounters / len(word_encounters) if word_encounters else 0
+
+print(f'Collated {new_word_encounters} new word encounters')
 print(f'Loaded {len(word_encounters)} unique words out of {total_word_encounters} total word encounters')
 print(f'Each word has been seen on average {avg_frequency:.2f} times')
 
-# sort alphabetically
-word_encounters = dict(sorted(word_encounters.items(), key=lambda item: item[0]))
-
-json_data = {
-    'total_word_encounters': total_word_encounters,
-    'unique_words': len(word_encounters),
-    'words': [
-        {'word': word, 'frequency': encounters} for word, encounters in word_encounters.items()
-    ]
-}
+if args.export_json:
+    json_data = {
+        'total_word_encounters': total_word_encounters,
+        'unique_words': len(word_encounters),
+        'words': [
+            {'word': word, 'frequency': encounters} for word, encounters in word_encounters.items()
+        ]
+    }
 
-with open(collated_word_encounters_path, 'w', encoding='utf-8') as file:
-    json.dump(json_data, file, indent=4)
+    with open(collated_word_encounters_path, 'w', encoding='utf-8') as file:
+        json.dump(json_data, file, indent=4)
 
-print(f'Saved word encounters to {COLLATED_WORD_ENCOUNTERS_FILE}')
+    print(f'Saved word encounters to {COLLATED_WORD_ENCOUNTERS_FILE}')
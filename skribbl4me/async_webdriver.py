@@ -0,0 +1,295 @@
+"""Contains the AsyncWebDriver class, an asyncio client for the W3C WebDriver protocol.
+
+Selenium's blocking client needs a thread per browser to keep several browsers busy at once. AsyncWebDriver speaks the
+same protocol over a small pool of keep-alive HTTP connections using asyncio streams, so one event loop can drive many
+browsers. It only implements the commands the bots send each tick; browsers are still launched (and sessions created)
+with Selenium, and then attached to with AsyncWebDriver.from_selenium.
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import (ElementClickInterceptedException, ElementNotInteractableException,
+                                        InvalidSessionIdException, JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException, WebDriverException)
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from metrics import Metrics
+
+# The key that marks an element reference in W3C WebDriver JSON
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# W3C error codes mapped to the exceptions Selenium raises for them, so callers can handle both clients the same way
+ERRORS: dict[str, type[WebDriverException]] = {
+    'element click intercepted': ElementClickInterceptedException,
+    'element not interactable': ElementNotInteractableException,
+    'invalid session id': InvalidSessionIdException,
+    'javascript error': JavascriptException,
+    'no such element': NoSuchElementException,
+    'script timeout': TimeoutException,
+    'stale element reference': StaleElementReferenceException,
+    'timeout': TimeoutException,
+}
+
+# Locator strategies that W3C WebDriver does not have, translated to CSS selectors the way Selenium does
+CSS_LOCATORS = {
+    'id': '#{}',
+    'class name': '.{}',
+    'name': '[name="{}"]',
+}
+
+
+class HttpConnectionPool:
+    """Sends HTTP/1.1 requests to one server, reusing keep-alive connections and opening at most max_connections."""
+
+    def __init__(self, host: str, port: int, max_connections: int = 4) -> None:
+        """Initializes the HttpConnectionPool class."""
+        self.host = host
+        self.port = port
+
+        self._idle_connections: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore = asyncio.Semaphore(max_connections)
+
+
+    async def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, Any]:
+        """Sends a request with a JSON body and returns the response status and decoded JSON body."""
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+
+        async with self._semaphore:
+            while True:
+                is_reused = bool(self._idle_connections)
+                reader, writer = self._idle_connections.pop() if is_reused else await asyncio.open_connection(self.host, self.port)
+
+                try:
+                    status, response, keep_alive = await self._send(reader, writer, method, path, data)
+                    break
+                except ConnectionResetError:
+                    writer.close()
+
+                    # The server closed an idle connection before reading the request, so it is safe to send it again
+                    if not is_reused:
+                        raise
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    writer.close()
+                    raise
+
+            if keep_alive:
+                self._idle_connections.append((reader, writer))
+            else:
+                writer.close()
+
+        return status, response
+
+
+    async def close(self) -> None:
+        """Closes every idle connection."""
+        while self._idle_connections:
+            _, writer = self._idle_connections.pop()
+            writer.close()
+
+
+    async def _send(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, data: bytes) -> tuple[int, Any, bool]:
+        head = (
+            f'{method} {path} HTTP/1.1\r\n'
+            f'Host: {self.host}:{self.port}\r\n'
+            'Content-Type: application/json;charset=UTF-8\r\n'
+            f'Content-Length: {len(data)}\r\n'
+            'Connection: keep-alive\r\n'
+            '\r\n'
+        )
+
+        writer.write(head.encode('ascii') + data)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('The server closed the connection')
+
+        status = int(status_line.split()[1])
+
+        headers: dict[str, str] = {}
+        while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            content = b''
+            while (chunk_size := int((await reader.readline()).split(b';')[0], 16)) > 0:
+                content += await reader.readexactly(chunk_size)
+                await reader.readline()
+            await reader.readline()
+        else:
+            content = await reader.readexactly(int(headers.get('content-length', 0)))
+
+        keep_alive = headers.get('connection', '').lower() != 'close'
+
+        return status, json.loads(content) if content else None, keep_alive
+
+
+class AsyncWebElement:
+    """A reference to an element in the page of an AsyncWebDriver session."""
+
+    def __init__(self, driver: 'AsyncWebDriver', element_id: str) -> None:
+        """Initializes the AsyncWebElement class."""
+        self.driver = driver
+        self.id = element_id
+
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, AsyncWebElement) and other.id == self.id
+
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+    async def send_keys(self, text: str) -> None:
+        """Types text into the element, which may include Selenium's Keys characters."""
+        await self.driver.execute('sendKeysToElement', 'POST', f'/element/{self.id}/value', {'text': text})
+
+
+    async def click(self) -> None:
+        """Clicks the element."""
+        await self.driver.execute('clickElement', 'POST', f'/element/{self.id}/click', {})
+
+
+    async def get_property(self, name: str) -> Any:
+        """Returns a property of the element."""
+        return await self.driver.execute('getElementProperty', 'GET', f'/element/{self.id}/property/{name}')
+
+
+class AsyncWebDriver:
+    """An asyncio client for one W3C WebDriver session, such as a Chrome or Edge browser launched by Selenium.
+
+    Commands raise the same exceptions as Selenium's client. If metrics are given, every command is timed in them as
+    webdriver_command_seconds, like Metrics.instrument_driver does for Selenium drivers.
+    """
+
+    def __init__(self, server_url: str, session_id: str | None = None, max_connections: int = 4, metrics: 'Metrics | None' = None) -> None:
+        """Initializes the AsyncWebDriver class. Without a session ID, a session must be started with start_session."""
+        url = urlsplit(server_url)
+
+        self.base_path = url.path.rstrip('/')
+        self.session_id = session_id
+        self.metrics = metrics
+        self.owns_session = False
+
+        self._pool = HttpConnectionPool(url.hostname or '127.0.0.1', url.port or 80, max_connections)
+
+
+    @classmethod
+    def from_selenium(cls, driver: 'WebDriver', max_connections: int = 4, metrics: 'Metrics | None' = None) -> 'AsyncWebDriver':
+        """Returns an AsyncWebDriver attached to the session of a Selenium driver. Quitting it leaves the session open."""
+        executor = driver.command_executor
+        client_config = getattr(executor, '_client_config', None)
+        server_url = client_config.remote_server_addr if client_config is not None else getattr(executor, '_url')
+
+        return cls(server_url, driver.session_id, max_connections, metrics)
+
+
+    async def start_session(self, capabilities: dict | None = None) -> None:
+        """Starts a new session with the given capabilities, which is ended when the driver quits."""
+        status, response = await self._pool.request('POST', f'{self.base_path}/session', {'capabilities': {'alwaysMatch': capabilities or {}}})
+        value = self._unwrap(status, response)
+
+        self.session_id = value['sessionId']
+        self.owns_session = True
+
+
+    async def quit(self) -> None:
+        """Ends the session if this driver started it, and closes the driver's connections."""
+        try:
+            if self.owns_session:
+                await self.execute('quit', 'DELETE', '')
+        finally:
+            await self._pool.close()
+
+
+    async def execute(self, command: str, method: str, path: str, body: dict | None = None) -> Any:
+        """Sends a command to the session and returns its value."""
+        if self.session_id is None:
+            raise WebDriverException('No session has been started')
+
+        if self.metrics is None:
+            return await self._execute(method, path, body)
+
+        with self.metrics.time('webdriver_command_seconds', command=command):
+            return await self._execute(method, path, body)
+
+
+    async def get(self, url: str) -> None:
+        """Navigates to a URL."""
+        await self.execute('get', 'POST', '/url', {'url': url})
+
+
+    async def get_title(self) -> str:
+        """Returns the page title."""
+        return await self.execute('getTitle', 'GET', '/title')
+
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        """Runs a script in the page and returns its result, with element references as AsyncWebElements."""
+        return await self.execute('executeScript', 'POST', '/execute/sync', {'script': script, 'args': self._wrap(list(args))})
+
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        """Runs a script in the page that reports its result by calling its last argument, and returns that result."""
+        return await self.execute('executeAsyncScript', 'POST', '/execute/async', {'script': script, 'args': self._wrap(list(args))})
+
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Returns the first element matching a Selenium locator (e.g. By.ID, 'game-chat')."""
+        if by in CSS_LOCATORS:
+            by, value = 'css selector', CSS_LOCATORS[by].format(value)
+
+        return await self.execute('findElement', 'POST', '/element', {'using': by, 'value': value})
+
+
+    async def _execute(self, method: str, path: str, body: dict | None) -> Any:
+        try:
+            status, response = await self._pool.request(method, f'{self.base_path}/session/{self.session_id}{path}', body)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            raise WebDriverException(f'Could not reach the WebDriver server: {e}') from e
+
+        return self._unwrap(status, response)
+
+
+    def _unwrap(self, status: int, response: Any) -> Any:
+        value = response.get('value') if isinstance(response, dict) else None
+
+        if status >= 400 or (isinstance(value, dict) and 'error' in value):
+            error = value.get('error', '') if isinstance(value, dict) else ''
+            message = value.get('message', '') if isinstance(value, dict) else ''
+            raise ERRORS.get(error, WebDriverException)(message or f'HTTP {status}')
+
+        return self._unwrap_elements(value)
+
+
+    def _unwrap_elements(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._unwrap_elements(item) for item in value]
+
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+
+            return {key: self._unwrap_elements(item) for key, item in value.items()}
+
+        return value
+
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+
+        return value
@@ -0,0 +1,170 @@
+"""Load-tests the skribbling loop against the stub WebDriver server, with a thread per bot or one event loop for all.
+
+The 'threads' mode runs every Skribbler's loop on its own thread with Selenium's blocking client, as the app does.
+The 'async' mode runs every Skribbler's loop as a task on a single event loop with AsyncWebDriver. The stub server
+runs in its own process so that it does not compete with the bots for the interpreter.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.async_load --bots 50 --mode async`
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import socket
+import threading
+from multiprocessing import Process
+from time import perf_counter, sleep
+
+from async_webdriver import AsyncWebDriver
+from benchmarks.stub_webdriver import STUB_WORDS, run_stub_server
+from metrics import Metrics
+from skribbler import Skribbler
+
+# resource is Unix only, so peak memory is read with the optional psutil package on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def get_peak_rss() -> float | None:
+    """Returns the peak resident memory of this process in MB, or None if it cannot be measured."""
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    if psutil is not None:
+        # the peak working set, which is Windows' peak resident memory
+        return getattr(psutil.Process().memory_info(), 'peak_wset', 0) / 1024 / 1024 or None
+
+    return None
+
+
+def wait_for_server(port: int, timeout: float = 10) -> None:
+    start = perf_counter()
+    while perf_counter() - start < timeout:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            sleep(0.05)
+
+    raise TimeoutError('The stub WebDriver server did not start')
+
+
+def create_skribbler(metrics: Metrics, guess_delay: float) -> Skribbler:
+    skribbler = Skribbler('', '', STUB_WORDS)
+    skribbler.metrics = metrics
+    skribbler.element_cache.metrics = metrics
+    skribbler.get_guess_delay = lambda number_of_hints: guess_delay
+    return skribbler
+
+
+def run_threads(server_url: str, bots: int, duration: float, guess_delay: float, metrics: Metrics) -> int:
+    """Runs the bots on a thread each with Selenium drivers. Returns the peak number of threads."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+    skribblers = []
+    for _ in range(bots):
+        skribbler = create_skribbler(metrics, guess_delay)
+        skribbler.driver = webdriver.Remote(command_executor=server_url, options=ChromeOptions())
+        metrics.instrument_driver(skribbler.driver)
+        skribblers.append(skribbler)
+
+    for skribbler in skribblers:
+        skribbler.start_skribbling()
+
+    sleep(duration)
+    peak_threads = threading.active_count()
+
+    # Every loop is told to stop before any are waited for, so that they stop in parallel
+    for skribbler in skribblers:
+        skribbler.skribbling_is_enabled = False
+    for skribbler in skribblers:
+        skribbler.loop_thread.join()
+        skribbler.driver.quit()
+
+    return peak_threads
+
+
+async def run_async(server_url: str, bots: int, duration: float, guess_delay: float, metrics: Metrics) -> int:
+    """Runs the bots as tasks on the running event loop with async drivers. Returns the peak number of threads."""
+    skribblers = []
+    for _ in range(bots):
+        skribbler = create_skribbler(metrics, guess_delay)
+        skribbler.async_driver = AsyncWebDriver(server_url, metrics=metrics)
+        await skribbler.async_driver.start_session()
+        skribblers.append(skribbler)
+
+    for skribbler in skribblers:
+        skribbler.start_skribbling_async()
+
+    await asyncio.sleep(duration)
+    peak_threads = threading.active_count()
+
+    await asyncio.gather(*(skribbler.stop_skribbling_async() for skribbler in skribblers))
+    await asyncio.gather(*(skribbler.async_driver.quit() for skribbler in skribblers))
+
+    return peak_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Skribbling loop load test against a stub WebDriver server')
+    parser.add_argument('-b', '--bots', type=int, default=50, help='Number of Skribblers to run at once')
+    parser.add_argument('-m', '--mode', choices=['threads', 'async'], default='async', help='How to run the Skribblers')
+    parser.add_argument('-t', '--duration', type=float, default=20, help='Seconds to run for')
+    parser.add_argument('--latency', type=float, default=2, help='Artificial latency of every stub command, in milliseconds')
+    parser.add_argument('--guess-delay', type=float, default=0.5, help='Seconds every Skribbler waits between guesses')
+    args = parser.parse_args()
+
+    port = get_free_port()
+    server_url = f'http://127.0.0.1:{port}'
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        server_process = Process(target=run_stub_server, args=('127.0.0.1', port, args.latency / 1000, 3), daemon=True)
+        server_process.start()
+
+    try:
+        wait_for_server(port)
+
+        metrics = Metrics()
+
+        # The Skribblers print every guess, which would drown out the results
+        with contextlib.redirect_stdout(io.StringIO()):
+            if args.mode == 'threads':
+                peak_threads = run_threads(server_url, args.bots, args.duration, args.guess_delay, metrics)
+            else:
+                peak_threads = asyncio.run(run_async(server_url, args.bots, args.duration, args.guess_delay, metrics))
+    finally:
+        server_process.terminate()
+
+    timings = metrics.get_summary()['timings']
+    commands = sum(timing['count'] for name, timing in timings.items() if name.startswith('webdriver_command_seconds'))
+    guesses = timings.get('phase_seconds{phase="guess_submission"}', {}).get('count', 0)
+
+    print(f'{args.bots} bots ({args.mode}) for {args.duration:.0f} s:')
+    print(f'    WebDriver commands:  {commands} ({commands / args.duration:.0f}/s)')
+    print(f'    Guesses:             {guesses}')
+    for name in ['tick_seconds', 'phase_seconds{phase="snapshot"}', 'webdriver_command_seconds{command="executeScript"}', 'webdriver_command_seconds{command="w3cExecuteScript"}']:
+        timing = timings.get(name)
+        if timing is not None:
+            print(f'    {name + ":":54}p50 {timing["p50"] * 1000:.1f} ms, p95 {timing["p95"] * 1000:.1f} ms, p99 {timing["p99"] * 1000:.1f} ms')
+    print(f'    Peak threads:        {peak_threads}')
+    peak_rss = get_peak_rss()
+    print(f'    Peak RSS:            {f"{peak_rss:.0f} MB" if peak_rss is not None else "not measured (psutil is not installed)"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Compares the browser profiles by launch time, page-load time, memory and CPU use.
+
+Memory and CPU are measured across the whole browser process tree and need the optional psutil package.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.browser_profile -d ../lib/webdriver/msedgedriver.exe`
+"""
+
+import argparse
+import statistics
+from time import perf_counter, sleep
+
+from browser import BROWSER_PROFILES, create_driver
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+URL = 'https://skribbl.io/'
+
+NAVIGATION_TIMING_SCRIPT = '''
+const navigation = performance.getEntriesByType('navigation')[0];
+return [navigation.domContentLoadedEventEnd, navigation.loadEventEnd];
+'''
+
+
+def get_browser_processes(driver) -> list:
+    """Returns every process started by the driver service: the driver itself and the whole browser tree."""
+    service_process = psutil.Process(driver.service.process.pid)
+    return [service_process] + service_process.children(recursive=True)
+
+
+def measure_profile(driver_executable: str, profile: str, headless: bool, idle_time: float) -> dict[str, float]:
+    start = perf_counter()
+    driver = create_driver(driver_executable, profile=profile, headless=headless)
+    launched = perf_counter()
+
+    try:
+        driver.get(URL)
+        loaded = perf_counter()
+
+        dom_content_loaded, load_event_end = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+
+        result = {
+            'launch (s)': launched - start,
+            'get() (s)': loaded - launched,
+            'DOMContentLoaded (ms)': dom_content_loaded,
+            'load event (ms)': load_event_end,
+        }
+
+        if psutil is not None:
+            processes = get_browser_processes(driver)
+            cpu_before = sum(sum(process.cpu_times()[:2]) for process in processes)
+            sleep(idle_time)
+            processes = get_browser_processes(driver)
+            cpu_after = sum(sum(process.cpu_times()[:2]) for process in processes)
+
+            result['RSS (MB)'] = sum(process.memory_info().rss for process in processes) / 1024 / 1024
+            result['CPU on page (%)'] = (cpu_after - cpu_before) / idle_time * 100
+
+        return result
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Browser profile benchmark')
+    parser.add_argument('-d', '--driver', required=True, help='Path to the webdriver executable')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='Number of browsers to launch per profile')
+    parser.add_argument('--idle', type=float, default=10, help='Seconds to measure CPU use for once the page has loaded')
+    parser.add_argument('--headless', action='store_true', help='Run the browsers in headless mode')
+    args = parser.parse_args()
+
+    if psutil is None:
+        print('psutil is not installed, so memory and CPU use will not be measured')
+
+    for profile in BROWSER_PROFILES:
+        results = [measure_profile(args.driver, profile, args.headless, args.idle) for _ in range(args.runs)]
+
+        print(f'{profile}:')
+        for metric in results[0]:
+            print(f'    {metric + ":":24}{statistics.median(result[metric] for result in results):8.2f}')
+
+
+if __name__ == '__main__':
+    main()
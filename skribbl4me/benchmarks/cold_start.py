@@ -0,0 +1,82 @@
+"""Measures how long a fresh interpreter takes to load the dictionary and construct a Skribbler.
+
+Every measurement runs in a new Python process so that nothing is already imported or cached in memory.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.cold_start`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from os import path
+
+SKRIBBL4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..')
+SCRAPE4ME_PATH = path.join(SKRIBBL4ME_PATH, '..', 'scrape4me')
+
+WORD_DATA_JSON = path.join(SCRAPE4ME_PATH, 'word_data.json')
+WORD_STORE_DATABASE = path.join(SCRAPE4ME_PATH, 'word_data.sqlite3')
+WORD_ENCOUNTERS_TXT = path.join(SCRAPE4ME_PATH, 'word_encounters.txt')
+WORD_TABLE_BIN = path.join(SCRAPE4ME_PATH, 'word_table.bin')
+
+LOADERS = {
+    'json': f'''
+import json
+with open({WORD_DATA_JSON!r}, 'r', encoding='utf-8') as file:
+    word_data = json.load(file)
+word_frequencies = {{word['word']: word['frequency'] for word in word_data['words']}}
+''',
+    'word store': f'''
+from word_store import load_word_frequencies
+word_frequencies = load_word_frequencies({WORD_STORE_DATABASE!r}, {WORD_ENCOUNTERS_TXT!r})
+''',
+    'word table': f'''
+from word_table import load_word_table
+word_frequencies = load_word_table({WORD_TABLE_BIN!r}, {WORD_ENCOUNTERS_TXT!r})
+assert word_frequencies is not None, 'word table is missing or stale'
+''',
+}
+
+# Prints the time taken by the loader and by importing and constructing the Skribbler, in milliseconds
+TEMPLATE = '''
+from time import perf_counter
+start = perf_counter()
+{loader}
+loaded = perf_counter()
+from skribbler import Skribbler
+skribbler = Skribbler('', '', list(word_frequencies), word_frequencies)
+print((loaded - start) * 1000, (perf_counter() - start) * 1000)
+'''
+
+
+def measure(loader: str, runs: int) -> tuple[list[float], list[float]]:
+    load_times = []
+    total_times = []
+
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', TEMPLATE.format(loader=loader)], cwd=SKRIBBL4ME_PATH, capture_output=True, text=True, check=True).stdout
+        load_time, total_time = map(float, output.split())
+        load_times.append(load_time)
+        total_times.append(total_time)
+
+    return load_times, total_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start benchmark')
+    parser.add_argument('-n', '--runs', type=int, default=10, help='Number of fresh processes per loader')
+    args = parser.parse_args()
+
+    # Make sure the store and word table are built and up to date before timing them
+    sys.path.append(SKRIBBL4ME_PATH)
+    from word_store import load_word_frequencies
+    from word_table import build_word_table
+    build_word_table(WORD_TABLE_BIN, load_word_frequencies(WORD_STORE_DATABASE, WORD_ENCOUNTERS_TXT), WORD_ENCOUNTERS_TXT)
+
+    for name, loader in LOADERS.items():
+        load_times, total_times = measure(loader, args.runs)
+        print(f'{name + ":":12}load {statistics.median(load_times):6.1f} ms, load + import + Skribbler() {statistics.median(total_times):6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
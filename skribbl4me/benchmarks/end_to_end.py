@@ -0,0 +1,173 @@
+"""Benchmarks the skribbling loop and the scrapers end to end in headless browsers, against the local stand-in game.
+
+A Skribbler joins a public room of the stand-in and guesses the words a server-side drawer chooses, and a host/player
+Scraper pair hosts and plays private games, choosing and guessing words as they do on skribbl.io. The stand-in runs in
+its own process on a clock sped up by --time-scale, so that a benchmark of a few minutes plays many rounds.
+
+Reported are the loops' ticks per second, the reaction latency from a letter being revealed to the Skribbler's next
+guess, how long after the drawing starts each word is guessed, and the rounds played per hour (of real time).
+
+Run from the inner skribbl4me directory: `python -m benchmarks.end_to_end -d ../lib/webdriver/chromedriver --duration 120`
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import urllib.request
+from functools import partial
+from multiprocessing import Process
+from os import path
+from threading import Event, Thread
+from time import sleep
+
+from benchmarks.async_load import get_free_port, wait_for_server
+from benchmarks.standin_server import load_word_frequencies, run_standin_server
+from browser import BROWSER_PROFILES, create_driver, load_skribbl
+from driver_pool import DriverPool
+from metrics import Metrics
+from skribbler import Skribbler
+
+SCRAPE4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'scrape4me')
+
+PAGE_LOAD_TIMEOUT = 10
+
+
+def run_skribbler(driver_executable: str, profile: str, url: str, word_frequencies: dict[str, int], guess_delay: float, metrics: Metrics,
+                  stop_event: Event) -> None:
+    """Joins a public room of the stand-in with a Skribbler and skribbles until the stop event is set."""
+    skribbler = Skribbler(driver_executable, '', list(word_frequencies), word_frequencies, browser_profile=profile, skribbl_url=url)
+    skribbler.metrics = metrics
+    skribbler.element_cache.metrics = metrics
+    skribbler.get_guess_delay = lambda number_of_hints: guess_delay
+
+    # Launched without the AutoDraw extension, which the stand-in has no canvas for
+    skribbler.driver = create_driver(driver_executable, profile=profile, headless=True)
+    metrics.instrument_driver(skribbler.driver)
+    skribbler.driver_is_initialised = True
+    skribbler.element_cache.invalidate()
+
+    try:
+        load_skribbl(skribbler.driver, profile, PAGE_LOAD_TIMEOUT, 0, url)
+        skribbler.website_is_loaded = True
+        skribbler.element_cache.run(skribbler.driver, 'play_button', lambda play_button: play_button.click())
+
+        skribbler.start_skribbling()
+        stop_event.wait()
+        skribbler.stop_skribbling()
+    finally:
+        skribbler.driver.quit()
+
+
+def run_scrapers(driver_executable: str, profile: str, url: str, metrics: Metrics, stop_event: Event) -> None:
+    """Hosts and plays private games of the stand-in with a Scraper pair until the stop event is set."""
+    if SCRAPE4ME_PATH not in sys.path:
+        sys.path.append(SCRAPE4ME_PATH)
+    from scrape4me import recycle_driver, run_session, warm_up_driver
+
+    driver_pool = DriverPool(
+        partial(create_driver, driver_executable, profile=profile, headless=True, arguments=['--mute-audio']),
+        partial(warm_up_driver, browser_profile=profile, url=url),
+        size=2,
+        recycle=partial(recycle_driver, browser_profile=profile, url=url),
+    )
+    driver_pool.start()
+
+    try:
+        # The encounters are counted by the stand-in, so they are not logged
+        while not stop_event.is_set():
+            run_session(0, driver_executable, driver_pool, profile, stop_event, lambda words, round_number: None, metrics)
+    finally:
+        driver_pool.close()
+
+
+def get_stats(url: str) -> list[dict]:
+    with urllib.request.urlopen(url + 'api/stats') as response:
+        return json.load(response)['rooms']
+
+
+def print_latencies(name: str, latencies: list[float]) -> None:
+    if len(latencies) < 2:
+        print(f'    {name + ":":28}{len(latencies)} samples')
+        return
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f'    {name + ":":28}p50 {quantiles[49] * 1000:.0f} ms, p95 {quantiles[94] * 1000:.0f} ms ({len(latencies)} samples)')
+
+
+def print_results(name: str, metrics: Metrics, rooms: list[dict], duration: float) -> None:
+    summary = metrics.get_summary()
+    timings = summary['timings']
+    finds = sum(timing['count'] for timing_name, timing in timings.items() if timing_name.startswith('webdriver_command_seconds{command="findElement"'))
+    element_cache = {result: sum(count for counter_name, count in summary['counters'].items() if counter_name.startswith('element_cache{') and f'result="{result}"' in counter_name)
+                     for result in ['hits', 'misses', 're_resolves']}
+    ticks = sum(timing['count'] for timing_name, timing in timings.items() if timing_name.startswith('tick_seconds'))
+    rounds = sum(room['rounds_completed'] for room in rooms)
+    turns = sum(room['turns_completed'] for room in rooms)
+    solved = sum(room['turns_solved'] for room in rooms)
+
+    print(f'{name}:')
+    print(f'    {"Ticks:":28}{ticks} ({ticks / duration:.1f}/s)')
+    print(f'    {"Rounds:":28}{rounds} ({rounds * 3600 / duration:.0f}/hour)')
+    print(f'    {"Turns solved:":28}{solved} of {turns}')
+    print(f'    {"Element cache:":28}{element_cache["hits"]} hits, {element_cache["misses"]} misses, {element_cache["re_resolves"]} re-resolves ({finds} findElement commands)')
+    print_latencies('Reveal to next guess', [latency for room in rooms for latency in room['reaction_latencies']])
+    print_latencies('Drawing start to solve', [latency for room in rooms for latency in room['solve_latencies']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end benchmark against the local stand-in game')
+    parser.add_argument('-d', '--driver', required=True, help='Path to the Chrome or Edge webdriver executable')
+    parser.add_argument('-m', '--mode', choices=['skribbler', 'scraper', 'both'], default='both', help='Which bots to run')
+    parser.add_argument('-t', '--duration', type=float, default=120, help='Seconds to run for')
+    parser.add_argument('--time-scale', type=float, default=4, help='Game seconds that pass every real second')
+    parser.add_argument('--guess-delay', type=float, default=0.5, help='Seconds the Skribbler waits between guesses')
+    parser.add_argument('--profile', choices=BROWSER_PROFILES, default='performance', help='Browser profile to launch the browsers with')
+    args = parser.parse_args()
+
+    port = get_free_port()
+    url = f'http://127.0.0.1:{port}/'
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        server_process = Process(target=run_standin_server, args=('127.0.0.1', port, args.time_scale), daemon=True)
+        server_process.start()
+
+    stop_event = Event()
+    skribbler_metrics = Metrics()
+    scraper_metrics = Metrics('scrape4me')
+    threads = []
+
+    if args.mode in ('skribbler', 'both'):
+        threads.append(Thread(target=run_skribbler, args=(args.driver, args.profile, url, load_word_frequencies(), args.guess_delay, skribbler_metrics, stop_event)))
+    if args.mode in ('scraper', 'both'):
+        threads.append(Thread(target=run_scrapers, args=(args.driver, args.profile, url, scraper_metrics, stop_event)))
+
+    try:
+        wait_for_server(port)
+
+        # The bots print every state change and guess, which would drown out the results
+        with contextlib.redirect_stdout(io.StringIO()):
+            for thread in threads:
+                thread.start()
+
+            sleep(args.duration)
+            stop_event.set()
+
+            for thread in threads:
+                thread.join()
+
+        rooms = get_stats(url)
+    finally:
+        server_process.terminate()
+
+    print(f'{args.mode} for {args.duration:.0f} s at {args.time_scale:g}x game speed:')
+    if args.mode in ('skribbler', 'both'):
+        print_results('Skribbler (public room)', skribbler_metrics, [room for room in rooms if room['public']], args.duration)
+    if args.mode in ('scraper', 'both'):
+        print_results('Scrapers (private room)', scraper_metrics, [room for room in rooms if not room['public']], args.duration)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Replays rounds sampled from word_encounters.txt against the Skribbler guessing logic, without a browser.
+
+Each simulated round picks a word, reveals its letters on a configurable schedule and lets the Skribbler choose
+guesses exactly as its loop would, scheduling them with the same random guess delays in simulated time (brought
+forward when a letter is revealed, as its guess scheduler does). Unless disabled, the Skribbler is also told which
+guesses were close, as skribbl.io would announce in the chat, and rules out the words close to the guesses that were not.
+It plays around 1,200 rounds per second on a typical machine (about 1,400 without close feedback), most of which goes
+on ranking and filtering the thousands of candidates left early in each round.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.simulator`
+"""
+
+import argparse
+import json
+import random
+import statistics
+from bisect import bisect_right
+from dataclasses import dataclass
+from math import inf
+from os import path
+from time import perf_counter
+
+from edit_distance_index import is_within_one_edit
+from encounter_log import get_encounter_word
+from guess_scheduler import GuessScheduler
+from guess_selection import GUESS_SELECTIONS, GuessSelection
+from metrics import percentile
+from skribbler import Skribbler
+from word_index import is_word_character
+
+SCRAPE4ME_PATH = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'scrape4me')
+WORD_DATA_JSON = path.join(SCRAPE4ME_PATH, 'word_data.json')
+WORD_ENCOUNTERS_TXT = path.join(SCRAPE4ME_PATH, 'word_encounters.txt')
+
+
+@dataclass
+class RoundResult:
+    word: str
+    solved: bool
+    guesses: int
+    time_to_solve: float
+
+
+def make_word_hint(word: str, revealed_positions: set[int]) -> str:
+    """Builds the hint skribbl.io shows for a word with the given letter positions revealed."""
+    hint = ''
+    for position, char in enumerate(word):
+        if position in revealed_positions or not is_word_character(char):
+            hint += char
+        else:
+            hint += '_'
+
+    return hint
+
+
+def is_close(guess: str, word: str) -> bool:
+    """Returns whether skribbl.io would announce a wrong guess as close, i.e. it is one edit away from the word."""
+    return guess.lower() != word.lower() and is_within_one_edit(guess.lower(), word.lower())
+
+
+class GuessingSimulator:
+
+    def __init__(self, skribbler: Skribbler, encounters: list[str], draw_time: float, hint_count: int, close_feedback: bool = True):
+        self.skribbler = skribbler
+        self.close_feedback = close_feedback
+        self.encounters = encounters
+        self.draw_time = draw_time
+
+        # Hints are revealed evenly spaced through the drawing time
+        self.reveal_times = [draw_time * (hint_number + 1) / (hint_count + 1) for hint_number in range(hint_count)]
+
+        # The simulated time into the current round
+        self.time = 0.0
+        self.guess_scheduler = GuessScheduler(skribbler.get_guess_delay, clock=lambda: self.time)
+
+        self.candidate_latencies: list[float] = []
+        self.choice_latencies: list[float] = []
+        self.feedback_latencies: list[float] = []
+
+    def play_round(self, word: str) -> RoundResult:
+        self.skribbler.current_round_guessed_words = []
+        self.skribbler.unflagged_guesses = []
+        self.skribbler.round_candidates.reset()
+        self.guess_scheduler.reset()
+
+        letter_positions = [position for position, char in enumerate(word) if is_word_character(char)]
+        reveal_order = random.sample(letter_positions, len(letter_positions))
+
+        # The hint and its number of hints after each reveal, built once rather than on every step. skribbl.io never
+        # reveals the whole word.
+        hints = []
+        for revealed_count in range(max(min(len(self.reveal_times), len(letter_positions) - 1), 0) + 1):
+            word_hint = make_word_hint(word, set(reveal_order[:revealed_count]))
+            hints.append((word_hint, self.skribbler.get_number_of_hints_given(word_hint)))
+
+        self.time = 0.0
+        guesses = 0
+
+        while self.time < self.draw_time:
+            reveals = bisect_right(self.reveal_times, self.time)
+            word_hint, number_of_hints = hints[min(reveals, len(hints) - 1)]
+            next_reveal_time = self.reveal_times[reveals] if reveals < len(self.reveal_times) else None
+
+            self.guess_scheduler.update_hints(number_of_hints)
+            if not self.guess_scheduler.is_due():
+                # Wait for the next guess, or for the next hint to bring it forward
+                self.time = min(self.guess_scheduler.next_guess_time, next_reveal_time if next_reveal_time is not None else inf)
+                continue
+
+            if self.close_feedback:
+                # As the loop does once the next guess is due, having read the chat
+                start = perf_counter()
+                self.skribbler.rule_out_near_misses()
+                self.feedback_latencies.append(perf_counter() - start)
+
+            start = perf_counter()
+            possible_words = self.skribbler.round_candidates.update(word_hint)
+            middle = perf_counter()
+            word_to_guess = self.skribbler.choose_word_to_guess(possible_words, word_hint)
+            end = perf_counter()
+
+            self.candidate_latencies.append(middle - start)
+            self.choice_latencies.append(end - middle)
+
+            if not word_to_guess:
+                # Nothing left to guess, so wait for the next hint
+                if next_reveal_time is None:
+                    break
+                self.time = next_reveal_time
+                continue
+
+            guesses += 1
+            if word_to_guess == word:
+                return RoundResult(word, True, guesses, self.time)
+
+            self.skribbler.record_guess(word_to_guess)
+
+            if self.close_feedback and is_close(word_to_guess, word):
+                start = perf_counter()
+                self.skribbler.handle_close_guess(word_to_guess)
+                self.feedback_latencies.append(perf_counter() - start)
+
+            self.guess_scheduler.guessed(number_of_hints)
+
+        return RoundResult(word, False, guesses, self.draw_time)
+
+    def run(self, rounds: int) -> list[RoundResult]:
+        return [self.play_round(random.choice(self.encounters)) for _ in range(rounds)]
+
+
+def load_skribbler(guess_selection: GuessSelection = 'frequency') -> Skribbler:
+    with open(WORD_DATA_JSON, 'r', encoding='utf-8') as file:
+        word_data = json.load(file)
+
+    word_list = [word['word'] for word in word_data['words']]
+    word_frequencies = {word['word']: word['frequency'] for word in word_data['words']}
+
+    return Skribbler('', '', word_list, word_frequencies, guess_selection=guess_selection)
+
+
+def load_encounters() -> list[str]:
+    with open(WORD_ENCOUNTERS_TXT, 'r', encoding='utf-8') as file:
+        return [word for word in map(get_encounter_word, file) if word]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline guessing simulator')
+    parser.add_argument('-n', '--rounds', type=int, default=5000, help='Number of rounds to simulate')
+    parser.add_argument('-t', '--draw-time', type=float, default=80, help='Simulated drawing time per round, in seconds')
+    parser.add_argument('--hints', type=int, default=2, help='Number of letters revealed during a round')
+    parser.add_argument('--selection', choices=GUESS_SELECTIONS, default='frequency', help='How the Skribbler chooses its guesses')
+    parser.add_argument('--no-close-feedback', action='store_true', help='Do not tell the Skribbler when a guess is close')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    simulator = GuessingSimulator(load_skribbler(args.selection), load_encounters(), args.draw_time, args.hints, not args.no_close_feedback)
+
+    start = perf_counter()
+    results = simulator.run(args.rounds)
+    elapsed = perf_counter() - start
+
+    solved = [result for result in results if result.solved]
+
+    print(f'{len(results)} rounds in {elapsed:.2f} s ({len(results) / elapsed:.0f} rounds/s)')
+    print(f'Solved:             {len(solved)} ({len(solved) / len(results) * 100:.1f}%)')
+    if solved:
+        print(f'Guesses to solve:   mean {statistics.mean(result.guesses for result in solved):.2f}, median {statistics.median(result.guesses for result in solved):.0f}')
+        print(f'Time to solve:      mean {statistics.mean(result.time_to_solve for result in solved):.1f} s, median {statistics.median(result.time_to_solve for result in solved):.1f} s')
+
+    for name, latencies in [('Candidates', simulator.candidate_latencies), ('Choice', simulator.choice_latencies), ('Feedback', simulator.feedback_latencies)]:
+        if not latencies:
+            continue
+        print(f'{name + " latency:":20}p50 {percentile(latencies, 50) * 1e6:.1f} us, p95 {percentile(latencies, 95) * 1e6:.1f} us, p99 {percentile(latencies, 99) * 1e6:.1f} us')
+
+
+if __name__ == '__main__':
+    main()
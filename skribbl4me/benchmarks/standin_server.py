@@ -0,0 +1,677 @@
+"""A local stand-in for skribbl.io, for testing the bots end to end in a real browser without the real site.
+
+The stand-in serves a single page with the same element IDs and classes the bots read (#home, #load, #game, .room.show,
+#game-word .hints .hint, #game-canvas .overlay-content .words, #game-toolbar, .players-list .me, the settings dropdowns
+and the chat with its input), and plays the game on the server so that a host and a player in different browsers share a room.
+The page long-polls the server for its view of the room and only touches the elements whose content changed, so the
+bots' change observers see the same mutations they would on the real site.
+
+'Play' without an invite joins a new public room, where a server-side drawer chooses words and letters are revealed
+on a clock. 'Create Private Room' creates a room with settings, which the host starts once someone has joined through
+the invite link. Every duration is in game seconds, and time_scale game seconds pass every real second.
+
+/api/stats reports each room's completed rounds and turns, its guesses, and two latencies in real seconds: from a
+letter being revealed to each player's next guess, and from the drawing starting to each correct guess.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.standin_server --port 8080`
+"""
+
+import argparse
+import json
+import random
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import path
+from threading import Condition, Thread
+from time import monotonic, sleep
+from urllib.parse import parse_qs, urlsplit
+
+from edit_distance_index import is_within_one_edit
+
+WORD_DATA_JSON = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'scrape4me', 'word_data.json')
+FALLBACK_WORDS = {'apple': 1, 'banana': 1, 'cherry': 1, 'guitar': 1, 'house': 1, 'mouse': 1, 'pencil': 1, 'rocket': 1, 'sandwich': 1, 'tree': 1, 'ice cream': 1, 'hot dog': 1}
+
+# The same options as the real settings dropdowns
+SETTING_OPTIONS = {
+    'drawtime': ['15', '20', '30', '40', '50', '60', '70', '80', '90', '100', '110', '120', '130', '140', '150', '160', '170', '180', '190', '200', '210', '220', '230', '240'],
+    'rounds': [str(rounds) for rounds in range(2, 11)],
+    'wordcount': [str(word_count) for word_count in range(1, 6)],
+    'hints': [str(hints) for hints in range(0, 6)],
+    'mode': ['Normal', 'Hidden', 'Combination'],
+}
+DEFAULT_SETTINGS = {'drawtime': '80', 'rounds': '3', 'wordcount': '3', 'hints': '2', 'mode': 'Normal'}
+
+# How long the server-side drawer of a public room takes to choose a word, and how long players have to choose one
+BOT_CHOOSE_TIME = 2
+CHOOSE_TIME = 15
+TURN_END_TIME = 3
+GAME_END_TIME = 5
+# How often the server advances the rooms' clocks, in real seconds
+UPDATE_INTERVAL = 0.01
+# How long a state request waits for the room to change, in real seconds
+LONG_POLL_TIMEOUT = 1
+# How many of the latest chat messages a room keeps
+CHAT_HISTORY = 100
+
+
+def load_word_frequencies() -> dict[str, int]:
+    """Loads the scraped word frequencies if there are any, so that words come up as often as they do on skribbl.io."""
+    if not path.exists(WORD_DATA_JSON):
+        return FALLBACK_WORDS
+
+    with open(WORD_DATA_JSON, 'r', encoding='utf-8') as file:
+        return {word['word']: word['frequency'] for word in json.load(file)['words']}
+
+
+class StandInPlayer:
+
+    def __init__(self, name: str, is_bot: bool = False):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.is_bot = is_bot
+        self.guessed = False
+        # when the last letter was revealed (in real seconds), until the player's next guess
+        self.reveal_time: float | None = None
+
+
+class StandInRoom:
+    """A room and its game, advanced by update with the game clock."""
+
+    def __init__(self, is_public: bool, word_frequencies: dict[str, int], clock):
+        self.id = uuid.uuid4().hex[:8]
+        self.is_public = is_public
+        self.word_frequencies = word_frequencies
+        self.words = list(word_frequencies)
+        self.clock = clock
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.players: list[StandInPlayer] = []
+        self.version = 0
+
+        self.phase = 'lobby'
+        self.round = 0
+        self.turn = 0
+        self.drawer: StandInPlayer | None = None
+        self.choices: list[str] = []
+        self.chosen: list[str] = []
+        self.word = ''
+        self.revealed: set[int] = set()
+        self.reveal_times: list[float] = []
+        self.phase_end_time = 0.0
+
+        self.rounds_completed = 0
+        self.turns_completed = 0
+        self.turns_solved = 0
+        self.correct_guesses = 0
+        self.wrong_guesses = 0
+        self.reaction_latencies: list[float] = []
+        self.solve_latencies: list[float] = []
+        # when the drawing started, in real seconds
+        self.drawing_start_time = 0.0
+
+        # {'id', 'to' (a player's ID, or None for everyone), 'name' (None for the game's notices), 'text'}
+        self.messages: list[dict] = []
+        self.next_message_id = 0
+
+        if is_public:
+            self.settings['rounds'] = '10'
+            self.players.append(StandInPlayer('Drawer', is_bot=True))
+
+    def changed(self):
+        self.version += 1
+
+    def join(self, name: str) -> StandInPlayer:
+        player = StandInPlayer(name)
+        self.players.append(player)
+
+        if self.is_public and self.phase == 'lobby':
+            self.start_game()
+
+        self.changed()
+        return player
+
+    def set_setting(self, name: str, value: str):
+        if self.phase == 'lobby' and value in SETTING_OPTIONS.get(name, []):
+            self.settings[name] = value
+            self.changed()
+
+    def start_game(self) -> bool:
+        if self.phase != 'lobby' or len(self.players) < 2:
+            return False
+
+        self.round = 1
+        self.turn = 0
+        self.start_turn()
+        return True
+
+    def get_drawers(self) -> list[StandInPlayer]:
+        # the server-side drawer draws every turn of a public room
+        return [self.players[0]] if self.is_public else self.players
+
+    def start_turn(self):
+        drawers = self.get_drawers()
+
+        if self.turn >= len(drawers):
+            self.turn = 0
+            self.round += 1
+            self.rounds_completed += 1
+
+            if self.round > int(self.settings['rounds']):
+                self.phase = 'game_end'
+                self.phase_end_time = self.clock() + GAME_END_TIME
+                self.changed()
+                return
+
+        self.drawer = drawers[self.turn]
+        self.phase = 'choosing'
+        self.chosen = []
+
+        word_sets = 2 if self.settings['mode'] == 'Combination' else 1
+        word_count = int(self.settings['wordcount'])
+        sampled = []
+        while len(sampled) < min(word_count * word_sets, len(self.words)):
+            word = random.choices(self.words, weights=self.word_frequencies.values())[0]
+            if word not in sampled:
+                sampled.append(word)
+        # the sets are interlaced, like on skribbl.io
+        self.choices = [word for pair in zip(*(sampled[word_set::word_sets] for word_set in range(word_sets))) for word in pair]
+
+        self.phase_end_time = self.clock() + (BOT_CHOOSE_TIME if self.drawer.is_bot else CHOOSE_TIME)
+        self.changed()
+
+    def choose(self, player: StandInPlayer, index: int):
+        word_sets = 2 if self.settings['mode'] == 'Combination' else 1
+
+        if self.phase != 'choosing' or player is not self.drawer or not 0 <= index < len(self.choices) or index % word_sets != len(self.chosen):
+            return
+
+        self.chosen.append(self.choices[index])
+        if len(self.chosen) == word_sets:
+            self.start_drawing()
+        else:
+            self.changed()
+
+    def start_drawing(self):
+        self.word = '+'.join(self.chosen)
+        self.phase = 'drawing'
+        self.revealed = set()
+
+        draw_time = int(self.settings['drawtime'])
+        letter_positions = [position for position, char in enumerate(self.word) if char.isalnum()]
+        hints = min(int(self.settings['hints']), len(letter_positions) - 1)
+        self.reveal_order = random.sample(letter_positions, len(letter_positions))
+        self.reveal_times = [self.clock() + draw_time * (hint + 1) / (hints + 1) for hint in range(hints)]
+        self.phase_end_time = self.clock() + draw_time
+        self.drawing_start_time = monotonic()
+
+        for player in self.players:
+            player.guessed = False
+            player.reveal_time = None
+
+        self.changed()
+
+    def guess(self, player: StandInPlayer, text: str):
+        if self.phase != 'drawing' or player is self.drawer or player.guessed:
+            return
+
+        if player.reveal_time is not None:
+            self.reaction_latencies.append(monotonic() - player.reveal_time)
+            player.reveal_time = None
+
+        if text.strip().lower() != self.word.lower():
+            self.wrong_guesses += 1
+            self.post_message(player.name, text)
+
+            # only the guesser is told that a guess is one letter off
+            if is_within_one_edit(text.strip().lower(), self.word.lower()):
+                self.post_message(None, f"'{text}' is close!", to=player)
+            return
+
+        self.correct_guesses += 1
+        self.solve_latencies.append(monotonic() - self.drawing_start_time)
+        player.guessed = True
+        self.post_message(None, f'{player.name} guessed the word!')
+
+        if all(other.guessed for other in self.players if other is not self.drawer):
+            self.turns_solved += 1
+            self.end_turn()
+
+    def post_message(self, name: str | None, text: str, to: StandInPlayer | None = None):
+        self.messages.append({'id': self.next_message_id, 'to': to.id if to is not None else None, 'name': name, 'text': text})
+        self.next_message_id += 1
+        del self.messages[:-CHAT_HISTORY]
+        self.changed()
+
+    def end_turn(self):
+        self.turns_completed += 1
+        self.phase = 'turn_end'
+        self.phase_end_time = self.clock() + TURN_END_TIME
+        self.changed()
+
+    def update(self):
+        now = self.clock()
+
+        if self.phase == 'choosing' and now >= self.phase_end_time:
+            # too slow, so the first word of each set is chosen for them
+            while self.phase == 'choosing':
+                self.choose(self.drawer, len(self.chosen))
+
+        elif self.phase == 'drawing':
+            while self.reveal_times and now >= self.reveal_times[0]:
+                self.reveal_times.pop(0)
+                self.revealed.add(self.reveal_order[len(self.revealed)])
+                for player in self.players:
+                    player.reveal_time = monotonic()
+                self.changed()
+
+            if now >= self.phase_end_time:
+                self.end_turn()
+
+        elif self.phase == 'turn_end' and now >= self.phase_end_time:
+            self.turn += 1
+            self.start_turn()
+
+        elif self.phase == 'game_end' and now >= self.phase_end_time:
+            self.phase = 'lobby'
+            self.changed()
+
+            if self.is_public:
+                self.start_game()
+
+    def get_hints(self, player: StandInPlayer) -> list[str]:
+        if self.phase != 'drawing' and self.phase != 'turn_end':
+            return []
+
+        shows_word = self.phase == 'turn_end' or player is self.drawer or player.guessed
+        return ['' if char == ' ' else char if shows_word or position in self.revealed or not char.isalnum() else '_' for position, char in enumerate(self.word)]
+
+    def get_view(self, player: StandInPlayer) -> dict:
+        """Returns what the player's page shows."""
+        return {
+            'version': self.version,
+            'room': self.id,
+            'screen': 'lobby' if self.phase == 'lobby' else 'game',
+            'settings': self.settings,
+            'players': [{'name': other.name, 'guessed': other.guessed, 'me': other is player} for other in self.players],
+            'round': f'Round {self.round} of {self.settings["rounds"]}' if self.phase != 'lobby' else '',
+            'phase': self.phase,
+            'is_drawer': player is self.drawer,
+            'choices': self.choices if self.phase == 'choosing' and player is self.drawer else [],
+            'chosen': self.chosen if player is self.drawer else [],
+            'hints': self.get_hints(player),
+            'chat': [{'id': message['id'], 'name': message['name'], 'text': message['text']} for message in self.messages if message['to'] in (None, player.id)],
+        }
+
+    def get_stats(self) -> dict:
+        return {
+            'room': self.id,
+            'public': self.is_public,
+            'rounds_completed': self.rounds_completed,
+            'turns_completed': self.turns_completed,
+            'turns_solved': self.turns_solved,
+            'correct_guesses': self.correct_guesses,
+            'wrong_guesses': self.wrong_guesses,
+            'reaction_latencies': self.reaction_latencies,
+            'solve_latencies': self.solve_latencies,
+        }
+
+
+class StandInGame:
+    """Every room on the server, and the players in them."""
+
+    def __init__(self, word_frequencies: dict[str, int], time_scale: float = 1):
+        self.word_frequencies = word_frequencies
+        self.time_scale = time_scale
+        self.start_time = monotonic()
+        self.rooms: dict[str, StandInRoom] = {}
+        self.players: dict[str, tuple[StandInPlayer, StandInRoom]] = {}
+        # guards everything, and is notified whenever a room changes
+        self.condition = Condition()
+
+    def clock(self) -> float:
+        return (monotonic() - self.start_time) * self.time_scale
+
+    def run_updates(self):
+        while True:
+            sleep(UPDATE_INTERVAL)
+
+            with self.condition:
+                versions = [room.version for room in self.rooms.values()]
+                for room in list(self.rooms.values()):
+                    room.update()
+
+                if versions != [room.version for room in self.rooms.values()]:
+                    self.condition.notify_all()
+
+    def handle(self, action: str, query: dict, body: dict) -> dict | None:
+        with self.condition:
+            if action == 'create':
+                room = StandInRoom(False, self.word_frequencies, self.clock)
+                self.rooms[room.id] = room
+                return self.add_player(room, body.get('name', 'Host'))
+
+            if action == 'join':
+                room = self.rooms.get(body.get('room') or '')
+                if room is None:
+                    room = StandInRoom(True, self.word_frequencies, self.clock)
+                    self.rooms[room.id] = room
+                return self.add_player(room, body.get('name', 'Player'))
+
+            if action == 'stats':
+                return {'rooms': [room.get_stats() for room in self.rooms.values()]}
+
+            player, room = self.players.get(query.get('player', body.get('player', '')), (None, None))
+            if player is None:
+                return None
+
+            if action == 'state':
+                since = int(query.get('since', -1))
+                self.condition.wait_for(lambda: room.version != since, timeout=LONG_POLL_TIMEOUT)
+                return room.get_view(player)
+
+            versions = room.version
+            match action:
+                case 'settings':
+                    room.set_setting(body.get('name', ''), body.get('value', ''))
+                case 'start':
+                    room.start_game()
+                case 'choose':
+                    room.choose(player, int(body.get('index', -1)))
+                case 'guess':
+                    room.guess(player, body.get('text', ''))
+
+            if room.version != versions:
+                self.condition.notify_all()
+
+            return {'ok': True}
+
+    def add_player(self, room: StandInRoom, name: str) -> dict:
+        player = room.join(name)
+        self.players[player.id] = (player, room)
+        self.condition.notify_all()
+        return {'player': player.id, 'room': room.id}
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    game: StandInGame
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        if url.path == '/':
+            self.send(200, STANDIN_PAGE.encode('utf-8'), 'text/html; charset=utf-8')
+        elif url.path.startswith('/api/'):
+            self.send_api(url.path[len('/api/'):], {key: values[0] for key, values in parse_qs(url.query).items()}, {})
+        else:
+            self.send(404, b'Not found', 'text/plain')
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        content = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_api(url.path[len('/api/'):], {}, json.loads(content) if content else {})
+
+    def send_api(self, action: str, query: dict, body: dict):
+        response = self.game.handle(action, query, body)
+        if response is None:
+            self.send(404, b'{}', 'application/json')
+        else:
+            self.send(200, json.dumps(response).encode('utf-8'), 'application/json')
+
+    def send(self, status: int, content: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_standin_server(host: str, port: int, time_scale: float = 1) -> None:
+    """Runs the stand-in until interrupted."""
+    game = StandInGame(load_word_frequencies(), time_scale)
+    Thread(target=game.run_updates, daemon=True).start()
+
+    handler = type('Handler', (StandInRequestHandler,), {'game': game})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+
+    print(f'Stand-in skribbl.io listening on http://{host}:{port}/')
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def render_select(name: str) -> str:
+    options = ''.join(f'<option value="{option}">{option}</option>' for option in SETTING_OPTIONS[name])
+    return f'<select id="item-settings-{name}" data-setting="{name}">{options}</select>'
+
+
+STANDIN_PAGE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>skribbl - Free Multiplayer Drawing &amp; Guessing Game (stand-in)</title>
+<style>
+body { font-family: sans-serif; margin: 0; }
+#game-canvas { position: relative; width: 400px; height: 300px; overflow: hidden; border: 1px solid #888; }
+#game-canvas .overlay-content { position: absolute; left: 0; width: 100%; height: 100%; background: #eee; }
+.words { display: none; }
+.words.show { display: block; }
+.word { display: inline-block; margin: 4px; padding: 4px; border: 1px solid #444; cursor: pointer; }
+.room { display: none; }
+.room.show { display: block; }
+.hint { display: inline-block; min-width: 12px; margin: 0 2px; }
+.player.guessed { background: #8f8; }
+</style>
+</head>
+<body>
+<div id="home">
+    <button class="button-play">Play!</button>
+    <button class="button-create">Create Private Room</button>
+</div>
+<div id="load" style="display: none;">Loading...</div>
+<div id="game" style="display: none;">
+    <div id="game-bar">
+        <div id="game-round"><div class="text"></div></div>
+        <div id="game-word"><div class="hints"><div class="container"></div></div></div>
+    </div>
+    <div id="game-players"><div class="players-list"></div></div>
+    <div id="game-wrapper">
+        <div id="game-canvas">
+            <div class="overlay-content" style="top: -100%;">
+                <div class="text"></div>
+                <div class="words"></div>
+            </div>
+        </div>
+        <div id="game-toolbar" style="display: none;">Toolbar</div>
+        <div id="game-chat">
+            <div class="chat-container">
+                <div class="chat-content"></div>
+                <form><input type="text" autocomplete="off"></form>
+            </div>
+        </div>
+    </div>
+    <div class="room">
+        ''' + ''.join(render_select(name) for name in SETTING_OPTIONS) + '''
+        <input id="input-invite" readonly>
+        <button id="start-game">Start!</button>
+    </div>
+</div>
+<script>
+let playerId = null;
+let version = -1;
+let lastMessageId = -1;
+
+const byId = (id) => document.getElementById(id);
+const setDisplay = (element, shown) => {
+    const display = shown ? 'block' : 'none';
+    if (element.style.display !== display) {
+        element.style.display = display;
+    }
+};
+const setText = (element, text) => {
+    if (element.textContent !== text) {
+        element.textContent = text;
+    }
+};
+const setClass = (element, name, enabled) => {
+    if (element.classList.contains(name) !== enabled) {
+        element.classList.toggle(name, enabled);
+    }
+};
+// Makes a container have one child per item, only adding or removing children when the number of items changes
+const setChildren = (container, count, create) => {
+    while (container.children.length > count) {
+        container.lastElementChild.remove();
+    }
+    while (container.children.length < count) {
+        container.appendChild(create());
+    }
+    return Array.from(container.children);
+};
+const element = (tag, className, html) => {
+    const created = document.createElement(tag);
+    created.className = className;
+    created.innerHTML = html || '';
+    return created;
+};
+
+const api = async (action, body) => {
+    const response = await fetch('/api/' + action, {method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(Object.assign({player: playerId}, body))});
+    return response.json();
+};
+
+const render = (state) => {
+    setDisplay(byId('home'), false);
+    setDisplay(byId('load'), false);
+    setDisplay(byId('game'), true);
+
+    const room = document.querySelector('.room');
+    setClass(room, 'show', state.screen === 'lobby');
+    byId('input-invite').value = location.origin + '/?' + state.room;
+    for (const select of room.querySelectorAll('select')) {
+        if (document.activeElement !== select && select.value !== state.settings[select.dataset.setting]) {
+            select.value = state.settings[select.dataset.setting];
+        }
+    }
+
+    setText(document.querySelector('#game-round .text'), state.round);
+
+    const players = setChildren(document.querySelector('#game-players .players-list'), state.players.length,
+        () => element('div', 'player', '<div class="player-info"><div class="player-name"></div></div>'));
+    state.players.forEach((player, index) => {
+        const name = players[index].querySelector('.player-name');
+        setClass(players[index], 'guessed', player.guessed);
+        setClass(name, 'me', player.me);
+        setText(name, player.name);
+    });
+
+    const hints = setChildren(document.querySelector('#game-word .hints .container'), state.hints.length, () => element('div', 'hint'));
+    state.hints.forEach((hint, index) => setText(hints[index], hint));
+
+    const overlay = document.querySelector('#game-canvas .overlay-content');
+    const overlayShown = state.screen === 'game' && state.phase !== 'drawing';
+    const overlayStyle = overlayShown ? 'top: 0%;' : 'top: -100%;';
+    if (overlay.style.cssText !== overlayStyle) {
+        overlay.style.cssText = overlayStyle;
+    }
+    const overlayTexts = {choosing: state.is_drawer ? 'Choose a word' : 'Someone is choosing a word!', turn_end: 'The word was revealed', game_end: 'Game over!'};
+    setText(overlay.querySelector('.text'), overlayTexts[state.phase] || '');
+
+    const words = overlay.querySelector('.words');
+    setClass(words, 'show', state.choices.length > 0);
+    const wordButtons = setChildren(words, state.choices.length, () => {
+        const button = element('div', 'word');
+        button.addEventListener('click', () => api('choose', {index: Array.from(words.children).indexOf(button)}));
+        return button;
+    });
+    state.choices.forEach((choice, index) => {
+        // a set is hidden once a word has been chosen from it, like on skribbl.io
+        const chosenFromSet = index % 2 < state.chosen.length;
+        setText(wordButtons[index], choice);
+        const display = chosenFromSet ? 'none' : 'inline-block';
+        if (wordButtons[index].style.display !== display) {
+            wordButtons[index].style.display = display;
+        }
+    });
+
+    setDisplay(byId('game-toolbar'), state.is_drawer && state.phase === 'drawing');
+
+    // Messages are only ever added at the end, like on skribbl.io
+    const chat = document.querySelector('#game-chat .chat-content');
+    for (const message of state.chat.filter((message) => message.id > lastMessageId)) {
+        const paragraph = document.createElement('p');
+        if (message.name === null) {
+            paragraph.textContent = message.text;
+        } else {
+            paragraph.append(element('b', '', ''), element('span', '', ''));
+            paragraph.firstChild.textContent = message.name + ': ';
+            paragraph.lastChild.textContent = message.text;
+        }
+        chat.appendChild(paragraph);
+        lastMessageId = message.id;
+    }
+    while (chat.children.length > 100) {
+        chat.firstElementChild.remove();
+    }
+};
+
+const poll = async () => {
+    while (true) {
+        try {
+            const response = await fetch('/api/state?player=' + playerId + '&since=' + version);
+            const state = await response.json();
+            if (state.version !== version) {
+                version = state.version;
+                render(state);
+            }
+        } catch (error) {
+            await new Promise((resolve) => setTimeout(resolve, 500));
+        }
+    }
+};
+
+const enter = async (action, body) => {
+    setDisplay(byId('home'), false);
+    setDisplay(byId('load'), true);
+    playerId = (await api(action, body)).player;
+    poll();
+};
+
+document.querySelector('#home .button-play').addEventListener('click', () => enter('join', {room: location.search.slice(1), name: 'Player'}));
+document.querySelector('#home .button-create').addEventListener('click', () => enter('create', {name: 'Host'}));
+for (const select of document.querySelectorAll('.room select')) {
+    select.addEventListener('change', () => api('settings', {name: select.dataset.setting, value: select.value}));
+}
+byId('start-game').addEventListener('click', () => api('start', {}));
+document.querySelector('#game-chat form').addEventListener('submit', (event) => {
+    event.preventDefault();
+    const input = event.target.querySelector('input');
+    api('guess', {text: input.value});
+    input.value = '';
+});
+</script>
+</body>
+</html>
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stand-in skribbl.io server')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--time-scale', type=float, default=1, help='Game seconds that pass every real second')
+    args = parser.parse_args()
+
+    run_standin_server(args.host, args.port, args.time_scale)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""A stub W3C WebDriver server that plays skribbl.io rounds, for load-testing the bots without browsers.
+
+Each session pretends to be a browser in a game where the bot is guessing. A word is drawn from a small word list,
+one letter is revealed every few seconds, and typing the word into the chat input followed by RETURN guesses it. The
+page probes from dom_probe are answered with the session's state, the change observer wait resolves when the next
+letter is revealed, and every command can be given an artificial latency to stand in for the browser's work.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.stub_webdriver --port 9515`
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import uuid
+from time import monotonic
+
+from selenium.webdriver.common.keys import Keys
+
+from async_webdriver import ELEMENT_KEY
+from dom_probe import CHANGE_OBSERVER_INSTALL_SCRIPT, CHANGE_OBSERVER_WAIT_SCRIPT, STATE_SNAPSHOT_SCRIPT
+
+CHAT_INPUT_ID = 'chat-input'
+
+STUB_WORDS = ['apple', 'banana', 'cherry', 'guitar', 'house', 'mouse', 'pencil', 'rocket', 'sandwich', 'tree', 'ice cream', 'hot dog']
+
+ROUTE = re.compile(r'^/session(?:/(?P<session_id>[^/]+)(?P<command>/.*)?)?$')
+
+
+class StubSession:
+    """The state of the game a stub browser is in."""
+
+    def __init__(self, reveal_interval: float, guessed_time: float) -> None:
+        self.reveal_interval = reveal_interval
+        self.guessed_time = guessed_time
+        self.chat_input_value = ''
+        self.correct_guesses = 0
+        self.wrong_guesses = 0
+        self.start_round()
+
+    def start_round(self) -> None:
+        self.word = random.choice(STUB_WORDS)
+        letter_positions = [position for position, char in enumerate(self.word) if char != ' ']
+        self.reveal_order = random.sample(letter_positions, len(letter_positions) - 1)
+        self.round_start_time = monotonic()
+        self.guessed_at: float | None = None
+
+    def update(self) -> None:
+        if self.guessed_at is not None and monotonic() - self.guessed_at >= self.guessed_time:
+            self.start_round()
+
+    def get_revealed_count(self) -> int:
+        return min(int((monotonic() - self.round_start_time) / self.reveal_interval), len(self.reveal_order))
+
+    def get_time_to_next_change(self) -> float:
+        if self.guessed_at is not None:
+            return max(self.guessed_at + self.guessed_time - monotonic(), 0)
+
+        return self.reveal_interval - (monotonic() - self.round_start_time) % self.reveal_interval
+
+    def get_snapshot(self) -> dict:
+        self.update()
+
+        revealed_positions = set(self.reveal_order[:self.get_revealed_count()])
+        hints = ['' if char == ' ' else char if position in revealed_positions else '_' for position, char in enumerate(self.word)]
+
+        return {
+            'website': {'home': False, 'loading': False, 'game': True, 'room_shown': False, 'room_displayed': False},
+            'game': {'toolbar': False, 'overlay_style': 'top: -100%;', 'word_select_shown': False, 'guessed': self.guessed_at is not None},
+            'hints': hints,
+            'chat_input_value': self.chat_input_value,
+        }
+
+    def type(self, text: str) -> None:
+        for char in text:
+            if char != Keys.RETURN:
+                self.chat_input_value += char
+                continue
+
+            if self.guessed_at is None:
+                if self.chat_input_value.strip().lower() == self.word:
+                    self.correct_guesses += 1
+                    self.guessed_at = monotonic()
+                else:
+                    self.wrong_guesses += 1
+
+            self.chat_input_value = ''
+
+
+class StubWebDriverServer:
+    """Serves the stub sessions over HTTP/1.1 with keep-alive connections."""
+
+    def __init__(self, latency: float = 0.002, reveal_interval: float = 3, guessed_time: float = 2) -> None:
+        self.latency = latency
+        self.reveal_interval = reveal_interval
+        self.guessed_time = guessed_time
+        self.sessions: dict[str, StubSession] = {}
+        self.commands = 0
+
+    async def serve(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                content = await reader.readexactly(int(headers.get('content-length', 0)))
+                body = json.loads(content) if content else {}
+
+                status, value = await self.handle_request(method, target, body)
+
+                response = json.dumps({'value': value}).encode('utf-8')
+                head = (
+                    f'HTTP/1.1 {status} {"OK" if status == 200 else "Error"}\r\n'
+                    'Content-Type: application/json; charset=utf-8\r\n'
+                    f'Content-Length: {len(response)}\r\n'
+                    '\r\n'
+                )
+
+                writer.write(head.encode('ascii') + response)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, method: str, target: str, body: dict) -> tuple[int, object]:
+        self.commands += 1
+
+        route = ROUTE.match(target)
+        if route is None:
+            return 404, {'error': 'unknown command', 'message': f'{method} {target}'}
+
+        session_id, command = route['session_id'], route['command'] or ''
+
+        if session_id is None and method == 'POST':
+            session_id = uuid.uuid4().hex
+            self.sessions[session_id] = StubSession(self.reveal_interval, self.guessed_time)
+            return 200, {'sessionId': session_id, 'capabilities': {'browserName': 'stub'}}
+
+        session = self.sessions.get(session_id)
+        if session is None:
+            return 404, {'error': 'invalid session id', 'message': f'No session {session_id}'}
+
+        await asyncio.sleep(self.latency)
+
+        match (method, command):
+            case ('DELETE', ''):
+                del self.sessions[session_id]
+                return 200, None
+            case ('POST', '/url'):
+                return 200, None
+            case ('GET', '/title'):
+                return 200, 'skribbl - Free Multiplayer Drawing & Guessing Game'
+            case ('POST', '/execute/sync') | ('POST', '/execute/async'):
+                return 200, await self.execute_script(session, body['script'], body.get('args', []))
+            case ('POST', '/element'):
+                return 200, {ELEMENT_KEY: CHAT_INPUT_ID}
+            case ('POST', '/element/chat-input/value'):
+                session.type(body.get('text', ''))
+                return 200, None
+            case ('POST', '/element/chat-input/click'):
+                return 200, None
+            case ('GET', '/element/chat-input/property/value'):
+                return 200, session.chat_input_value
+
+        return 404, {'error': 'unknown command', 'message': f'{method} {target}'}
+
+    async def execute_script(self, session: StubSession, script: str, args: list) -> object:
+        if script == STATE_SNAPSHOT_SCRIPT:
+            return session.get_snapshot()
+
+        if script == CHANGE_OBSERVER_INSTALL_SCRIPT:
+            return True
+
+        if script == CHANGE_OBSERVER_WAIT_SCRIPT:
+            time_to_next_change = session.get_time_to_next_change()
+            await asyncio.sleep(min(args[0] / 1000, time_to_next_change))
+            return ['hints'] if time_to_next_change <= args[0] / 1000 else []
+
+        return None
+
+
+def run_stub_server(host: str, port: int, latency: float, reveal_interval: float) -> None:
+    """Runs a stub server until interrupted, reporting the commands served every ten seconds."""
+    server = StubWebDriverServer(latency, reveal_interval)
+
+    async def serve_forever():
+        await server.serve(host, port)
+        print(f'Stub WebDriver server listening on http://{host}:{port}')
+
+        while True:
+            await asyncio.sleep(10)
+            correct = sum(session.correct_guesses for session in server.sessions.values())
+            print(f'{len(server.sessions)} sessions, {server.commands} commands served, {correct} correct guesses')
+
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stub WebDriver server')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=9515, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=2, help='Artificial latency of every command, in milliseconds')
+    parser.add_argument('--reveal-interval', type=float, default=3, help='Seconds between letters being revealed')
+    args = parser.parse_args()
+
+    run_stub_server(args.host, args.port, args.latency / 1000, args.reveal_interval)
+
+
+if __name__ == '__main__':
+    main()
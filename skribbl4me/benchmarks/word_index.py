@@ -0,0 +1,88 @@
+"""Compares the WordIndex lookup against the linear regex scan it replaced, and against lookups through a HintCache.
+
+Run from the inner skribbl4me directory: `python -m benchmarks.word_index`
+"""
+
+import argparse
+import json
+import random
+import re
+from os import path
+from time import perf_counter
+
+from hint_cache import HintCache
+from skribbler import Skribbler
+from word_index import is_word_character
+
+WORD_DATA_JSON = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'scrape4me', 'word_data.json')
+
+
+def load_word_list() -> list[str]:
+    """Loads the bundled word list."""
+    with open(WORD_DATA_JSON, 'r', encoding='utf-8') as file:
+        word_data = json.load(file)
+
+    return [word['word'] for word in word_data['words']]
+
+
+def make_hint(word: str, revealed: int) -> str:
+    """Builds the hint skribbl.io would show for a word with a number of letters revealed."""
+    letter_positions = [position for position, char in enumerate(word) if is_word_character(char)]
+    revealed_positions = set(random.sample(letter_positions, min(revealed, len(letter_positions))))
+
+    hint = ''
+    for position, char in enumerate(word):
+        if position in revealed_positions or not is_word_character(char):
+            hint += char
+        else:
+            hint += '_'
+
+    return hint
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WordIndex micro-benchmark')
+    parser.add_argument('-n', '--hints', type=int, default=2000, help='Number of hints to look up')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    word_list = load_word_list()
+
+    start = perf_counter()
+    skribbler = Skribbler('', '', word_list)
+    index_build_time = perf_counter() - start
+
+    hints = [make_hint(random.choice(word_list), random.randint(0, 3)) for _ in range(args.hints)]
+
+    start = perf_counter()
+    linear_results = [[word for word in word_list if re.match(skribbler.generate_hint_regex(hint), word)] for hint in hints]
+    linear_time = perf_counter() - start
+
+    start = perf_counter()
+    index_results = [skribbler.word_index.lookup(hint) for hint in hints]
+    index_time = perf_counter() - start
+
+    hint_cache = HintCache()
+    start = perf_counter()
+    cached_results = [list(hint_cache.lookup(skribbler.word_index, hint)) for hint in hints]
+    cached_time = perf_counter() - start
+
+    mismatches = sum(1 for linear, indexed in zip(linear_results, index_results) if linear != indexed)
+    cache_mismatches = sum(1 for indexed, cached in zip(index_results, cached_results) if indexed != cached)
+    cache_stats = hint_cache.get_stats()
+
+    print(f'{len(word_list)} words, {len(hints)} hints')
+    print(f'Index build:   {index_build_time * 1000:.2f} ms')
+    print(f'Linear regex:  {linear_time / len(hints) * 1e6:.1f} us per lookup')
+    print(f'WordIndex:     {index_time / len(hints) * 1e6:.1f} us per lookup')
+    print(f'Speedup:       {linear_time / index_time:.1f}x')
+    print(f'HintCache:     {cached_time / len(hints) * 1e6:.1f} us per lookup ({cache_stats["hits"] / len(hints):.0%} hits, {cache_mismatches} mismatches)')
+    # The regex path is case-sensitive, lets a gap match punctuation (like the '-' in 'Notre-Dame') and treats punctuation
+    # such as the '.' in 'Dr. Watson' as a metacharacter, so it both misses and over-matches words
+    print(f'Mismatches:    {mismatches}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Creates the Selenium drivers used by skribbl4me and scrape4me, configured by a named browser profile.
+
+The 'default' profile launches the browser as it has always been launched. The 'performance' profile trims the
+browser down for unattended play: images, remote fonts, ads and the consent manager are blocked, background
+throttling and the GPU are disabled, pages are considered loaded once the DOM is ready, and the window is small.
+"""
+
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+SKRIBBL_URL = 'https://skribbl.io/'
+
+BrowserProfile = Literal['default', 'performance']
+BROWSER_PROFILES: tuple[BrowserProfile, ...] = ('default', 'performance')
+
+DEFAULT_WINDOW_SIZE = (1200, 800)
+PERFORMANCE_WINDOW_SIZE = (800, 600)
+
+# Ad, analytics and consent manager hosts that skribbl.io loads but the bots never need
+BLOCKED_HOSTS = [
+    'consentmanager.net',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googletagservices.com',
+    'googletagmanager.com',
+    'google-analytics.com',
+    'adservice.google.com',
+    'amazon-adsystem.com',
+    'adnxs.com',
+    'pubmatic.com',
+    'rubiconproject.com',
+    'criteo.com',
+    'criteo.net',
+]
+
+PERFORMANCE_ARGUMENTS = [
+    '--mute-audio',
+    '--disable-gpu',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-remote-fonts',
+    '--blink-settings=imagesEnabled=false',
+    '--host-resolver-rules=' + ', '.join(f'MAP {host} ~NOTFOUND, MAP *.{host} ~NOTFOUND' for host in BLOCKED_HOSTS),
+]
+
+PERFORMANCE_PREFERENCES = {
+    'profile.managed_default_content_settings.images': 2,
+}
+
+
+def get_window_size(profile: BrowserProfile) -> tuple[int, int]:
+    """Returns the window size used by a browser profile."""
+    return PERFORMANCE_WINDOW_SIZE if profile == 'performance' else DEFAULT_WINDOW_SIZE
+
+
+def blocks_consent_manager(profile: BrowserProfile) -> bool:
+    """Returns whether a browser profile blocks the cookie consent dialog from loading at all."""
+    return profile == 'performance'
+
+
+def create_driver(driver_executable: str, webdriver_is_on_path: bool = False, profile: BrowserProfile = 'default', headless: bool = False,
+                  extensions: list[str] | None = None, arguments: list[str] | None = None) -> 'WebDriver':
+    """Launches an Edge or Chrome driver, depending on the driver executable, configured by the browser profile."""
+    # The webdriver modules take a few hundred milliseconds to import, so they are only imported once needed
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    from selenium.webdriver.edge.service import Service as EdgeService
+
+    browser = 'edge' if 'edgedriver' in driver_executable else 'chrome'
+
+    options = EdgeOptions() if browser == 'edge' else ChromeOptions()
+
+    if headless:
+        options.add_argument('--headless=new')
+
+    for extension in extensions or []:
+        options.add_extension(extension)
+
+    for argument in arguments or []:
+        options.add_argument(argument)
+
+    if profile == 'performance':
+        for argument in PERFORMANCE_ARGUMENTS:
+            options.add_argument(argument)
+
+        options.add_experimental_option('prefs', PERFORMANCE_PREFERENCES)
+        options.page_load_strategy = 'eager'
+
+    if browser == 'edge':
+        if webdriver_is_on_path:
+            driver = webdriver.Edge(options=options)
+        else:
+            driver = webdriver.Edge(service=EdgeService(executable_path=driver_executable), options=options)
+    else:
+        if webdriver_is_on_path:
+            driver = webdriver.Chrome(options=options)
+        else:
+            driver = webdriver.Chrome(service=ChromeService(executable_path=driver_executable), options=options)
+
+    driver.set_window_size(*get_window_size(profile))
+
+    return driver
+
+
+def load_skribbl(driver: 'WebDriver', profile: BrowserProfile = 'default', page_load_timeout: float = 10, consent_timeout: float = 3, url: str = SKRIBBL_URL) -> None:
+    """Loads the skribbl.io home page (or a stand-in's, see benchmarks/standin_server.py) and accepts the cookie consent dialog if the profile lets it load."""
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.wait import WebDriverWait
+
+    driver.get(url)
+    WebDriverWait(driver, page_load_timeout).until(EC.presence_of_element_located((By.ID, 'home')))
+    assert 'skribbl' in driver.title
+
+    # The performance profile blocks the consent manager, so there is no dialog to wait for
+    if not blocks_consent_manager(profile):
+        try:
+            WebDriverWait(driver, consent_timeout).until(EC.presence_of_element_located((By.ID, 'cmpwelcomebtnyes')))
+            consent_button = driver.find_element(By.ID, 'cmpwelcomebtnyes')
+            consent_button.click()
+        except (NoSuchElementException, TimeoutException):
+            pass
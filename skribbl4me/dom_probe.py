@@ -0,0 +1,274 @@
+"""Contains the JavaScript probes used to read the skribbl.io page in a single WebDriver round trip."""
+
+import asyncio
+from time import monotonic, sleep
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from async_webdriver import AsyncWebDriver
+
+
+# Returns everything the bots need to know about the page in one execute_script call. Elements that do not exist are
+# reported as null rather than raising, so that a missing element costs nothing extra. The chat is only read if
+# arguments[0] is true, as every message is only ever reported once.
+STATE_SNAPSHOT_SCRIPT = '''
+const isDisplayed = (element) => {
+    if (!element) {
+        return null;
+    }
+    const style = window.getComputedStyle(element);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') {
+        return false;
+    }
+    return element.getClientRects().length > 0;
+};
+
+const room = document.querySelector('.room');
+const overlay = document.querySelector('#game-canvas .overlay-content');
+const wordSelect = overlay ? overlay.querySelector('.words') : null;
+const myPlayerName = document.querySelector('#game-players .players-list .me');
+const myPlayer = myPlayerName && myPlayerName.parentElement ? myPlayerName.parentElement.parentElement : null;
+const chatInput = document.querySelector('#game-wrapper #game-chat .chat-container form input');
+const chatContent = document.querySelector('#game-chat .chat-content');
+const gameRound = document.querySelector('#game-round .text');
+
+// Reads the chat messages added since the chat was last read, oldest first. Each message is remembered once read, so only
+// the new ones at the end of the chat are visited. Players' messages are '<b>name: </b><span>text</span>' and the
+// game's notices are just text, so they have no name.
+const readChat = () => {
+    if (!chatContent) {
+        return null;
+    }
+    const read = window.__skribbl4meChat || (window.__skribbl4meChat = new WeakSet());
+    const messages = [];
+    for (let message = chatContent.lastElementChild; message && !read.has(message); message = message.previousElementSibling) {
+        read.add(message);
+        const name = message.querySelector('b');
+        const text = message.querySelector('span');
+        messages.push({
+            name: name && text ? name.innerText.replace(/:\s*$/, '').trim() : null,
+            text: (text || message).innerText.trim(),
+        });
+    }
+    return messages.reverse();
+};
+
+return {
+    website: {
+        home: isDisplayed(document.getElementById('home')),
+        loading: isDisplayed(document.getElementById('load')),
+        game: isDisplayed(document.getElementById('game')),
+        room_shown: room ? room.classList.contains('show') : null,
+        room_displayed: isDisplayed(document.querySelector('.room.show')),
+    },
+    game: {
+        toolbar: isDisplayed(document.getElementById('game-toolbar')),
+        overlay_style: overlay ? overlay.style.cssText : null,
+        word_select_shown: wordSelect ? wordSelect.classList.contains('show') : null,
+        guessed: myPlayer ? myPlayer.classList.contains('guessed') : null,
+    },
+    hints: Array.from(document.querySelectorAll('#game-word .hints .container .hint'), (hint) => hint.innerText.trim()),
+    chat_input_value: chatInput ? chatInput.value : null,
+    chat: arguments[0] ? readChat() : null,
+    my_name: myPlayerName ? myPlayerName.innerText.trim() : null,
+    round: gameRound ? gameRound.innerText.trim() : null,
+};
+'''
+
+
+def take_snapshot(driver: 'WebDriver', read_chat: bool = False) -> dict | None:
+    """Returns a snapshot of the page state, or None if the page could not be read.
+
+    With read_chat, the snapshot's chat is the messages added since the chat was last read. A message read by one
+    snapshot is never in another, so only one reader of the page (the skribbling loop) should read the chat.
+    """
+    try:
+        return driver.execute_script(STATE_SNAPSHOT_SCRIPT, read_chat)
+    except WebDriverException:
+        return None
+
+
+# Installs a MutationObserver that records which parts of the page changed into an in-page queue. Returns false when
+# the page does not (yet) have the elements to observe, so the caller can fall back to polling.
+CHANGE_OBSERVER_INSTALL_SCRIPT = '''
+if (window.__skribbl4me) {
+    return true;
+}
+
+const targets = {
+    'hints': [document.querySelector('#game-word .hints'), {attributes: true, childList: true, characterData: true, subtree: true}],
+    'overlay': [document.querySelector('#game-canvas .overlay-content'), {attributes: true, childList: true, subtree: true}],
+    'players': [document.querySelector('#game-players'), {attributes: true, childList: true, subtree: true}],
+    'room': [document.querySelector('.room'), {attributes: true}],
+    'home': [document.getElementById('home'), {attributes: true}],
+    'load': [document.getElementById('load'), {attributes: true}],
+    'game': [document.getElementById('game'), {attributes: true}],
+    'chat': [document.querySelector('#game-chat .chat-content'), {childList: true}],
+};
+// The bots work without reading the chat, so it is observed if it is there
+const optionalTargets = ['chat'];
+
+if (Object.entries(targets).some(([name, [element]]) => !element && !optionalTargets.includes(name))) {
+    return false;
+}
+
+const state = {events: [], waiter: null};
+
+for (const [name, [element, options]] of Object.entries(targets)) {
+    if (!element) {
+        continue;
+    }
+    new MutationObserver(() => {
+        if (state.events[state.events.length - 1] !== name) {
+            state.events.push(name);
+        }
+        if (state.events.length > 1000) {
+            state.events.shift();
+        }
+        if (state.waiter) {
+            state.waiter();
+        }
+    }).observe(element, options);
+}
+
+window.__skribbl4me = state;
+return true;
+'''
+
+# Resolves as soon as the observer has recorded a change (or after the timeout in arguments[0] milliseconds) with the
+# drained event queue, or null if the observer is not installed on the current page.
+CHANGE_OBSERVER_WAIT_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const state = window.__skribbl4me;
+
+if (!state) {
+    done(null);
+    return;
+}
+
+const drain = () => {
+    clearTimeout(timer);
+    state.waiter = null;
+    const events = state.events;
+    state.events = [];
+    done(events);
+};
+
+const timer = setTimeout(drain, arguments[0]);
+
+if (state.events.length) {
+    drain();
+} else {
+    state.waiter = drain;
+}
+'''
+
+
+def install_change_observer(driver: 'WebDriver') -> bool:
+    """Installs the in-page change observer. Returns whether the observer is installed."""
+    try:
+        return bool(driver.execute_script(CHANGE_OBSERVER_INSTALL_SCRIPT))
+    except WebDriverException:
+        return False
+
+
+def wait_for_changes(driver: 'WebDriver', timeout: float) -> list[str] | None:
+    """Blocks until the page changes or the timeout (in seconds) passes and returns the names of the changed parts.
+
+    Returns None if the change observer is not installed, for example because the page has been reloaded.
+    """
+    try:
+        return driver.execute_async_script(CHANGE_OBSERVER_WAIT_SCRIPT, int(timeout * 1000))
+    except WebDriverException:
+        return None
+
+
+async def take_snapshot_async(driver: 'AsyncWebDriver', read_chat: bool = False) -> dict | None:
+    """Returns a snapshot of the page state, like take_snapshot but through the async driver."""
+    try:
+        return await driver.execute_script(STATE_SNAPSHOT_SCRIPT, read_chat)
+    except WebDriverException:
+        return None
+
+
+async def install_change_observer_async(driver: 'AsyncWebDriver') -> bool:
+    """Installs the in-page change observer. Returns whether the observer is installed."""
+    try:
+        return bool(await driver.execute_script(CHANGE_OBSERVER_INSTALL_SCRIPT))
+    except WebDriverException:
+        return False
+
+
+async def wait_for_changes_async(driver: 'AsyncWebDriver', timeout: float) -> list[str] | None:
+    """Waits until the page changes or the timeout (in seconds) passes and returns the names of the changed parts.
+
+    Returns None if the change observer is not installed, for example because the page has been reloaded.
+    """
+    try:
+        return await driver.execute_async_script(CHANGE_OBSERVER_WAIT_SCRIPT, int(timeout * 1000))
+    except WebDriverException:
+        return None
+
+
+class PageChangeWaiter:
+    """Waits for the page to change with the in-page change observer, installing the observer whenever it is missing.
+
+    The observer is installed before the first wait, and again after a wait finds it gone (because the page has been
+    reloaded, or the driver is busy). While it cannot be installed, installing is retried every retry_delay seconds and
+    each wait falls back to sleeping for poll_interval, or for the timeout if that is shorter.
+    """
+
+    def __init__(self, poll_interval: float, retry_delay: float) -> None:
+        """Initializes the PageChangeWaiter class. The intervals are in seconds."""
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+
+        self.is_installed = False
+        self.next_install_time = 0.0
+
+
+    def wait(self, driver: 'WebDriver', timeout: float) -> None:
+        """Blocks until the page changes or the timeout (in seconds) passes."""
+        if self._is_install_due():
+            self._set_installed(install_change_observer(driver))
+
+        if self.is_installed:
+            if wait_for_changes(driver, timeout) is not None:
+                return
+
+            self._set_lost()
+
+        sleep(min(timeout, self.poll_interval))
+
+
+    async def wait_async(self, driver: 'AsyncWebDriver', timeout: float) -> None:
+        """Waits until the page changes or the timeout (in seconds) passes, like wait but through the async driver."""
+        if self._is_install_due():
+            self._set_installed(await install_change_observer_async(driver))
+
+        if self.is_installed:
+            if await wait_for_changes_async(driver, timeout) is not None:
+                return
+
+            self._set_lost()
+
+        await asyncio.sleep(min(timeout, self.poll_interval))
+
+
+    def _is_install_due(self) -> bool:
+        return not self.is_installed and monotonic() >= self.next_install_time
+
+
+    def _set_installed(self, is_installed: bool) -> None:
+        self.is_installed = is_installed
+        self.next_install_time = monotonic() + self.retry_delay
+
+
+    def _set_lost(self) -> None:
+        # Reinstalled before the next wait rather than after the retry delay, as it was only just working
+        self.is_installed = False
+        self.next_install_time = 0.0
@@ -0,0 +1,138 @@
+"""Contains the DriverPool class."""
+
+from queue import Queue
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Callable
+
+from selenium.common.exceptions import WebDriverException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class DriverPool:
+    """Keeps browsers launched and warmed up (skribbl.io loaded, cookies accepted) so they can be handed out instantly.
+
+    Browsers are launched and warmed up on background threads. A released browser is recycled in the background and
+    returned to the pool rather than quit, and a browser that fails its health check is quit and replaced.
+    """
+
+    HEALTH_CHECK_SCRIPT = 'return document.readyState !== "loading" && !!document.getElementById("home");'
+
+
+    def __init__(self, create_driver: Callable[[], 'WebDriver'], warm_up: Callable[['WebDriver'], None], size: int,
+                 recycle: Callable[['WebDriver'], None] | None = None) -> None:
+        """Initializes the DriverPool class.
+
+        create_driver launches a browser, warm_up prepares a newly launched browser, and recycle (which defaults to
+        warm_up) prepares a released browser to be handed out again.
+        """
+        self.create_driver = create_driver
+        self.warm_up = warm_up
+        self.recycle = recycle or warm_up
+        self.size = size
+
+        self._ready_drivers: Queue['WebDriver'] = Queue()
+        self._drivers: set['WebDriver'] = set()
+        self._lock = Lock()
+        self._is_closed = False
+
+
+    def start(self) -> None:
+        """Starts launching the pool's browsers in the background."""
+        for _ in range(self.size):
+            self._launch_in_background()
+
+
+    def acquire(self, timeout: float | None = None) -> 'WebDriver':
+        """Returns a warm, healthy browser, waiting for one to become ready if necessary. Raises queue.Empty on timeout."""
+        while True:
+            driver = self._ready_drivers.get(timeout=timeout)
+
+            if self.is_healthy(driver):
+                return driver
+
+            self.discard(driver)
+
+
+    def release(self, driver: 'WebDriver') -> None:
+        """Returns a browser to the pool once it has been recycled."""
+        if self._is_closed:
+            self._quit(driver)
+            return
+
+        Thread(target=self._prepare, args=(driver, self.recycle), daemon=True).start()
+
+
+    def discard(self, driver: 'WebDriver') -> None:
+        """Quits a browser that is no longer usable and launches a replacement."""
+        self._quit(driver)
+
+        if not self._is_closed:
+            self._launch_in_background()
+
+
+    def close(self) -> None:
+        """Quits every browser belonging to the pool, including those that have been handed out."""
+        self._is_closed = True
+
+        with self._lock:
+            drivers = list(self._drivers)
+
+        for driver in drivers:
+            self._quit(driver)
+
+
+    def is_healthy(self, driver: 'WebDriver') -> bool:
+        """Returns whether a browser is still responding and showing the skribbl.io home page."""
+        try:
+            return bool(driver.execute_script(self.HEALTH_CHECK_SCRIPT))
+        except WebDriverException:
+            return False
+
+
+    def _launch_in_background(self) -> None:
+        Thread(target=self._launch, daemon=True).start()
+
+
+    def _launch(self) -> None:
+        try:
+            driver = self.create_driver()
+        except WebDriverException as e:
+            print(f'Could not launch a browser for the pool: {e.msg}')
+            return
+
+        with self._lock:
+            self._drivers.add(driver)
+
+        if self._is_closed:
+            self._quit(driver)
+            return
+
+        # Don't launch a replacement for a browser that could not be warmed up, as the next one would likely fail too
+        self._prepare(driver, self.warm_up, replace_on_failure=False)
+
+
+    def _prepare(self, driver: 'WebDriver', prepare: Callable[['WebDriver'], None], replace_on_failure: bool = True) -> None:
+        try:
+            prepare(driver)
+        except (WebDriverException, AssertionError) as e:
+            print(f'Could not prepare a browser for the pool: {e}')
+
+            if replace_on_failure:
+                self.discard(driver)
+            else:
+                self._quit(driver)
+            return
+
+        self._ready_drivers.put(driver)
+
+
+    def _quit(self, driver: 'WebDriver') -> None:
+        with self._lock:
+            self._drivers.discard(driver)
+
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
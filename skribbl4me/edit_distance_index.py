@@ -0,0 +1,83 @@
+"""Contains the EditDistanceIndex class."""
+
+
+def get_deletions(word: str) -> set[str]:
+    """Returns every string made by deleting one character from a word."""
+    return {word[:position] + word[position + 1:] for position in range(len(word))}
+
+
+def is_within_one_edit(first: str, second: str) -> bool:
+    """Returns whether two strings are at most one insertion, deletion or substitution apart."""
+    if len(first) > len(second):
+        first, second = second, first
+
+    if len(second) - len(first) > 1:
+        return False
+
+    # Everything after the first difference must match, skipping the substituted or inserted character
+    position = 0
+    while position < len(first) and first[position] == second[position]:
+        position += 1
+
+    if len(first) == len(second):
+        return first[position + 1:] == second[position + 1:]
+
+    return first[position:] == second[position + 1:]
+
+
+class EditDistanceIndex:
+    """A deletion-neighbourhood index over a word list for finding the words at most one edit away from a guess.
+
+    Two strings are at most one edit apart only if one of them, or one of its single-character deletions, equals the
+    other or one of its deletions. So every word is filed under its folded form and each of its deletions, and the
+    neighbours of a guess are the words filed under the guess or one of its deletions, checked with is_within_one_edit
+    to drop pairs that only share a deletion at different positions (like 'ab' and 'ba'). Case is ignored, as skribbl.io
+    ignores it when checking guesses. The index is built on first use, or ahead of time by calling build. The same
+    guesses come up round after round, so the neighbours of each guess are kept once found.
+    """
+
+    def __init__(self, word_list: list[str]) -> None:
+        """Initializes the EditDistanceIndex class."""
+        self.word_list = word_list
+
+        # folded word or deletion -> words filed under it
+        self._postings: dict[str, set[str]] | None = None
+        # folded guess -> its neighbours
+        self._neighbours: dict[str, frozenset[str]] = {}
+
+
+    def build(self) -> None:
+        """Builds the index, if it has not been built yet."""
+        if self._postings is not None:
+            return
+
+        postings: dict[str, set[str]] = {}
+
+        for word in self.word_list:
+            folded_word = word.lower()
+
+            for key in get_deletions(folded_word) | {folded_word}:
+                postings.setdefault(key, set()).add(word)
+
+        self._postings = postings
+
+
+    def get_neighbours(self, guess: str) -> frozenset[str]:
+        """Returns the words at most one edit away from the guess, ignoring case."""
+        folded_guess = guess.lower()
+
+        neighbours = self._neighbours.get(folded_guess)
+        if neighbours is not None:
+            return neighbours
+
+        self.build()
+
+        candidates: set[str] = set()
+
+        for key in get_deletions(folded_guess) | {folded_guess}:
+            candidates.update(self._postings.get(key, ()))
+
+        neighbours = frozenset(word for word in candidates if is_within_one_edit(folded_guess, word.lower()))
+        self._neighbours[folded_guess] = neighbours
+
+        return neighbours
@@ -0,0 +1,111 @@
+"""Contains the ElementCache class."""
+
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from async_webdriver import AsyncWebDriver, AsyncWebElement
+    from metrics import Metrics
+
+T = TypeVar('T')
+
+# The long-lived elements the bots act on, by name. Everything they only read is read by the state snapshot instead.
+PAGE_ELEMENTS = {
+    'play_button': '#home .button-play',
+    'create_room_button': '#home .button-create',
+    # #game > #game-wrapper #game-chat > .chat-container > form > input
+    'chat_input': '#game-wrapper #game-chat .chat-container form input',
+}
+
+
+class ElementCache:
+    """Resolves each of the page's long-lived elements once and reuses the handle for as long as it stays attached.
+
+    skribbl.io is a single-page app that keeps its elements across rounds, so an element only has to be found again
+    after the page is reloaded or re-renders it. Elements are acted on through run, which finds the element again and
+    retries once if the cached handle raises StaleElementReferenceException. Hits, misses (lookups that had to find the
+    element, including re-resolves) and re-resolves are counted, and also recorded as element_cache counters if
+    metrics are given.
+    """
+
+    def __init__(self, locators: dict[str, str] = PAGE_ELEMENTS, metrics: 'Metrics | None' = None) -> None:
+        """Initializes the ElementCache class. Locators are CSS selectors, by element name."""
+        self.locators = locators
+        self.metrics = metrics
+
+        self.hits = 0
+        self.misses = 0
+        self.re_resolves = 0
+
+        self._elements: dict[str, 'WebElement | AsyncWebElement'] = {}
+
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Forgets a cached element, or every cached element (e.g. for a new driver) if no name is given."""
+        if name is None:
+            self._elements.clear()
+        else:
+            self._elements.pop(name, None)
+
+
+    def get(self, driver: 'WebDriver', name: str) -> 'WebElement':
+        """Returns the cached element, finding it first if it is not cached."""
+        element = self._elements.get(name)
+
+        if element is not None:
+            self._count('hits', name)
+            return element
+
+        self._count('misses', name)
+        element = self._elements[name] = driver.find_element(By.CSS_SELECTOR, self.locators[name])
+        return element
+
+
+    def run(self, driver: 'WebDriver', name: str, action: Callable[['WebElement'], T]) -> T:
+        """Runs an action on an element, finding it again and retrying once if the cached handle has gone stale."""
+        try:
+            return action(self.get(driver, name))
+        except StaleElementReferenceException:
+            self._count('re_resolves', name)
+            self.invalidate(name)
+            return action(self.get(driver, name))
+
+
+    async def get_async(self, driver: 'AsyncWebDriver', name: str) -> 'AsyncWebElement':
+        """Returns the cached element, finding it first through the async driver if it is not cached."""
+        element = self._elements.get(name)
+
+        if element is not None:
+            self._count('hits', name)
+            return element
+
+        self._count('misses', name)
+        element = self._elements[name] = await driver.find_element(By.CSS_SELECTOR, self.locators[name])
+        return element
+
+
+    async def run_async(self, driver: 'AsyncWebDriver', name: str, action: Callable[['AsyncWebElement'], Awaitable[T]]) -> T:
+        """Runs an async action on an element, like run."""
+        try:
+            return await action(await self.get_async(driver, name))
+        except StaleElementReferenceException:
+            self._count('re_resolves', name)
+            self.invalidate(name)
+            return await action(await self.get_async(driver, name))
+
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns the number of cached elements and the hit, miss and re-resolve counts."""
+        return {'size': len(self._elements), 'hits': self.hits, 'misses': self.misses, 're_resolves': self.re_resolves}
+
+
+    def _count(self, result: str, name: str) -> None:
+        setattr(self, result, getattr(self, result) + 1)
+
+        if self.metrics is not None:
+            self.metrics.increment('element_cache', result=result, element=name)
@@ -0,0 +1,113 @@
+"""Contains the EncounterLog class.
+
+Each line of the raw word encounters log is one encounter: the word, followed by the room it was encountered in, the
+game round and a Unix timestamp, separated by tabs. Lines logged before the metadata was recorded are just the word.
+"""
+
+import os
+from queue import Empty, Queue
+from threading import Thread
+from time import monotonic, time
+from typing import Callable
+
+FIELD_SEPARATOR = '\t'
+
+
+def format_encounter(word: str, room: int | None = None, round_number: int | None = None, timestamp: float | None = None) -> str:
+    """Returns the log line for an encounter, without the newline."""
+    fields = [word, '' if room is None else str(room), '' if round_number is None else str(round_number), f'{time() if timestamp is None else timestamp:.3f}']
+    return FIELD_SEPARATOR.join(fields)
+
+
+def get_encounter_word(line: str) -> str:
+    """Returns the word from a log line, or '' if the line is blank."""
+    return line.split(FIELD_SEPARATOR, 1)[0].strip()
+
+
+class EncounterLog:
+    """Appends encounters to the log from a single background writer thread, so that recording one never waits on disk.
+
+    Encounters are put on a bounded queue and written in batches, once MAX_BATCH_SIZE lines are waiting or FLUSH_INTERVAL
+    seconds after the oldest waiting line was recorded. The file stays open between batches and is fsynced when the log
+    is closed. on_flush is called on the writer thread with the number of lines after every batch is written.
+    """
+
+    MAX_BATCH_SIZE = 200
+    FLUSH_INTERVAL = 2.0
+    QUEUE_SIZE = 10000
+
+
+    def __init__(self, encounters_path: str, on_flush: Callable[[int], None] | None = None) -> None:
+        """Initializes the EncounterLog class."""
+        self.encounters_path = encounters_path
+        self.on_flush = on_flush
+
+        self._queue: Queue[list[str] | None] = Queue(self.QUEUE_SIZE)
+        self._writer_thread = Thread(target=self._write_batches, daemon=True)
+        self._is_closed = False
+
+
+    def start(self) -> None:
+        """Starts the writer thread."""
+        self._writer_thread.start()
+
+
+    def record(self, words: list[str], room: int | None = None, round_number: int | None = None, timestamp: float | None = None) -> None:
+        """Queues the encounter of every word for writing. Blocks only if the writer has fallen QUEUE_SIZE batches behind."""
+        if self._is_closed:
+            raise ValueError('The encounter log is closed')
+
+        lines = [format_encounter(word, room, round_number, timestamp) for word in (word.strip() for word in words) if word]
+        if lines:
+            self._queue.put(lines)
+
+
+    def close(self) -> None:
+        """Writes every queued encounter, fsyncs the log and stops the writer thread."""
+        if self._is_closed:
+            return
+
+        self._is_closed = True
+        self._queue.put(None)
+        self._writer_thread.join()
+
+
+    def _write_batches(self) -> None:
+        with open(self.encounters_path, 'a', encoding='utf-8') as file:
+            batch: list[str] = []
+            flush_time = 0.0
+
+            while True:
+                try:
+                    lines = self._queue.get(timeout=max(flush_time - monotonic(), 0) if batch else None)
+                except Empty:
+                    lines = []
+
+                if lines is None:
+                    self._write_batch(file, batch)
+                    os.fsync(file.fileno())
+                    return
+
+                if lines and not batch:
+                    flush_time = monotonic() + self.FLUSH_INTERVAL
+
+                batch.extend(lines)
+
+                if len(batch) >= self.MAX_BATCH_SIZE or (batch and monotonic() >= flush_time):
+                    self._write_batch(file, batch)
+                    batch = []
+
+
+    def _write_batch(self, file, batch: list[str]) -> None:
+        if not batch:
+            return
+
+        file.write(''.join(line + '\n' for line in batch))
+        # Flushed to the OS so that readers of the log (like the word store) see whole batches straight away
+        file.flush()
+
+        if self.on_flush is not None:
+            try:
+                self.on_flush(len(batch))
+            except Exception as e:
+                print(f'Could not process the logged encounters: {e}')
@@ -0,0 +1,59 @@
+"""Contains the GuessRanker class."""
+
+import random
+from itertools import compress, repeat
+
+
+class GuessRanker:
+    """Orders candidate words by how often they have been encountered, as recorded in word_data.json.
+
+    A word's probability of being the answer, given the current hint, is its encounter count divided by the total count
+    of every word still matching the hint. Words that have never been encountered are given a small pseudo-count so
+    that they are still guessed eventually.
+    """
+
+    UNSEEN_WORD_FREQUENCY = 1
+
+
+    def __init__(self, word_frequencies: dict[str, int] | None = None) -> None:
+        """Initializes the GuessRanker class."""
+        self.word_frequencies = word_frequencies or {}
+
+        self._weights = {word: max(frequency, self.UNSEEN_WORD_FREQUENCY) for word, frequency in self.word_frequencies.items()}
+
+
+    def get_frequency(self, word: str) -> int:
+        """Returns the encounter count used to weight a word."""
+        return self._weights.get(word, self.UNSEEN_WORD_FREQUENCY)
+
+
+    def rank(self, candidates: list[str]) -> list[str]:
+        """Returns the candidates ordered from most to least likely."""
+        return sorted(candidates, key=self.get_frequency, reverse=True)
+
+
+    def get_probabilities(self, candidates: list[str]) -> dict[str, float]:
+        """Returns the probability of each candidate being the answer."""
+        total_frequency = sum(self.get_frequency(word) for word in candidates)
+        return {word: self.get_frequency(word) / total_frequency for word in candidates}
+
+
+    def get_expected_guesses(self, candidates: list[str]) -> float:
+        """Returns the expected number of guesses needed to guess correctly when guessing in ranked order."""
+        if not candidates:
+            return 0.0
+
+        total_frequency = sum(self.get_frequency(word) for word in candidates)
+        return sum(guess_number * self.get_frequency(word) for guess_number, word in enumerate(self.rank(candidates), start=1)) / total_frequency
+
+
+    def choose(self, candidates: list[str]) -> str:
+        """Returns the most likely candidate, choosing randomly between equally likely candidates."""
+        if not candidates:
+            return ''
+
+        # map and compress loop in C, which matters for the thousands of candidates early in a round
+        frequencies = list(map(self._weights.get, candidates, repeat(self.UNSEEN_WORD_FREQUENCY)))
+        highest_frequency = max(frequencies)
+
+        return random.choice(list(compress(candidates, map(highest_frequency.__eq__, frequencies))))
@@ -0,0 +1,62 @@
+"""Contains the GuessScheduler class."""
+
+from time import monotonic
+from typing import Callable
+
+
+class GuessScheduler:
+    """Decides when the next guess is due, so that the loop can keep watching the page between guesses instead of sleeping.
+
+    After each guess, the next one is due after a delay that depends on the number of hints given. If a letter is
+    revealed before then, the delay is drawn again for the new number of hints, still counted from the last guess, and
+    the next guess is brought forward if that makes it due sooner.
+    """
+
+    def __init__(self, get_guess_delay: Callable[[int], float], clock: Callable[[], float] = monotonic) -> None:
+        """Initializes the GuessScheduler class."""
+        self.get_guess_delay = get_guess_delay
+        self.clock = clock
+
+        self.last_guess_time: float | None = None
+        self.number_of_hints = 0
+        self.next_guess_time = 0.0
+
+
+    def reset(self) -> None:
+        """Makes the next guess due straight away, for a new round."""
+        self.last_guess_time = None
+        self.number_of_hints = 0
+        self.next_guess_time = 0.0
+
+
+    def guessed(self, number_of_hints: int) -> float:
+        """Schedules the next guess after one made with the given number of hints. Returns the delay until it is due."""
+        guess_delay = self.get_guess_delay(number_of_hints)
+
+        self.last_guess_time = self.clock()
+        self.number_of_hints = number_of_hints
+        self.next_guess_time = self.last_guess_time + guess_delay
+
+        return guess_delay
+
+
+    def update_hints(self, number_of_hints: int) -> None:
+        """Brings the next guess forward if more hints have been given since the last guess allow a shorter delay."""
+        if self.last_guess_time is None or number_of_hints <= self.number_of_hints:
+            return
+
+        self.number_of_hints = number_of_hints
+        self.next_guess_time = min(self.next_guess_time, self.last_guess_time + self.get_guess_delay(number_of_hints))
+
+
+    def is_due(self) -> bool:
+        """Returns whether the next guess can be made."""
+        return self.clock() >= self.next_guess_time
+
+
+    def get_wait_timeout(self, max_timeout: float) -> float:
+        """Returns how long the loop can wait for the page to change before it has to wake up to make the next guess."""
+        time_until_due = self.next_guess_time - self.clock()
+
+        # Once the guess is due, only a page change can lead to another one
+        return max_timeout if time_until_due <= 0 else min(time_until_due, max_timeout)
@@ -0,0 +1,84 @@
+"""Contains the ExpectedEliminationSelector class."""
+
+from typing import Literal
+
+from guess_ranking import GuessRanker
+from word_index import fold_character
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GuessSelection = Literal['frequency', 'elimination']
+GUESS_SELECTIONS: tuple[GuessSelection, ...] = ('frequency', 'elimination')
+
+
+class ExpectedEliminationSelector:
+    """Chooses the guess that is expected to leave the least candidate mass after the next hint is revealed.
+
+    A wrong guess still tells us something: skribbl.io announces when a guess is close (one letter away from the
+    answer), which splits the remaining candidates into those that are close to the guess and those that are not. The
+    next hint then reveals the answer's letter at a random unrevealed position, splitting each part again by letter.
+    Candidates are weighted by their encounter frequency, so a guess is scored by
+
+        sum over parts S and unrevealed positions p and letters c of mass(S, p, c) ** 2 / (total mass * positions)
+
+    which is the expected frequency mass still possible after the guess and the next reveal (a correct guess leaves
+    nothing). All guesses are scored at once with NumPy using a one-hot matrix of letters at the unrevealed positions.
+    """
+
+    # Only the most frequent candidates are scored as guesses, which bounds the work to MAX_SCORED_GUESSES x candidates
+    MAX_SCORED_GUESSES = 500
+
+
+    def __init__(self, guess_ranker: GuessRanker) -> None:
+        """Initializes the ExpectedEliminationSelector class."""
+        if np is None:
+            raise ImportError('NumPy is required for the elimination guess selection')
+
+        self.guess_ranker = guess_ranker
+
+
+    def score(self, candidates: list[str], word_hint: str) -> 'np.ndarray':
+        """Returns the expected remaining candidate mass after guessing each of the first MAX_SCORED_GUESSES candidates."""
+        unrevealed_positions = [position for position, char in enumerate(word_hint) if char == '_']
+
+        weights = np.array([self.guess_ranker.get_frequency(word) for word in candidates], dtype=np.float64)
+        total_weight = weights.sum()
+
+        # One column for every (unrevealed position, letter) pair that occurs in the candidates
+        columns: dict[tuple[int, str], int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, word in enumerate(candidates):
+            for position in unrevealed_positions:
+                rows.append(row)
+                cols.append(columns.setdefault((position, fold_character(word[position])), len(columns)))
+
+        letters = np.zeros((len(candidates), max(len(columns), 1)), dtype=np.float64)
+        letters[rows, cols] = 1
+
+        weighted_letters = letters * weights[:, None]
+        letter_mass = weights @ letters
+
+        guesses = letters[:self.MAX_SCORED_GUESSES]
+
+        # Every candidate matches the hint, so two candidates differ in one letter exactly when they agree on all but
+        # one of the unrevealed positions
+        matching_positions = guesses @ letters.T
+        close = (matching_positions == len(unrevealed_positions) - 1).astype(np.float64)
+
+        close_mass = close @ weighted_letters
+        far_mass = letter_mass - close_mass - weighted_letters[:len(guesses)]
+
+        return ((close_mass ** 2).sum(axis=1) + (far_mass ** 2).sum(axis=1)) / (total_weight * max(len(unrevealed_positions), 1))
+
+
+    def choose(self, candidates: list[str], word_hint: str) -> str:
+        """Returns the candidate expected to leave the fewest candidates, or '' if there are none."""
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else ''
+
+        ranked_candidates = self.guess_ranker.rank(candidates)
+        return ranked_candidates[int(np.argmin(self.score(ranked_candidates, word_hint)))]
@@ -1,7 +1,9 @@
 import tkinter as tk
+from queue import Empty, SimpleQueue
 from tkinter import ttk
 
 from gui.styles import *
+from gui.virtual_list import VirtualList
 from skribbler import Skribbler
 
 
@@ -9,6 +11,11 @@ class SkribblerWindow(tk.Toplevel):
 
     
     UI_UPDATE_INTERVAL = 100
+    # The loop's updates are drained in batches of at most this many per UI update, so a backlog can't stall the mainloop
+    MAX_UPDATES_PER_DRAIN = 1000
+    METRICS_UPDATE_INTERVAL = 1000
+    # Only the timings that took the most time overall are shown
+    METRICS_SHOWN_TIMINGS = 8
 
 
     def __init__(self, skribbler: Skribbler, *args, **kwargs):
@@ -18,6 +25,14 @@ class SkribblerWindow(tk.Toplevel):
         
         self.skribbler = skribbler
 
+        # The loop only ever puts updates on the queue, and only this window takes them off
+        self.updates = SimpleQueue()
+        self.skribbler.update_queue = self.updates
+        self.website_state = 'unknown'
+        self.game_state = None
+        self.word_hint = ''
+        self.guesses: list[str] = []
+
         self.protocol('WM_DELETE_WINDOW', self.master.destroy)
 
         self.title('skribbl4me : Skribbler')
@@ -25,6 +40,7 @@ class SkribblerWindow(tk.Toplevel):
         self._create_widgets()
 
         self.after(0, self._update_ui)
+        self.after(0, self._update_metrics)
     
 
     def _on_close(self):
@@ -91,6 +107,9 @@ class SkribblerWindow(tk.Toplevel):
         self.game_info_label = ttk.Label(self.game_info_frame, text='Game Info:')
         self.game_info_label.grid(row=0, column=0, sticky=tk.NSEW, **ELEMENT_PADDING)
 
+        self.game_info_metrics_label = ttk.Label(self.game_info_frame, text='', font=MONOSPACE_FONT, justify=tk.LEFT)
+        self.game_info_metrics_label.grid(row=1, column=0, sticky=tk.NSEW, **ELEMENT_PADDING)
+
 
     def _create_player_info_frame(self):
         self.player_info_frame = ttk.Frame(self.wrapper, style='PlayerInfo.TFrame')
@@ -108,11 +127,14 @@ class SkribblerWindow(tk.Toplevel):
         self.possible_words_frame.grid(row=1, column=1, sticky=tk.NSEW, **ELEMENT_PADDING)
 
         self.possible_words_frame.columnconfigure(0, weight=1)
-        self.possible_words_frame.rowconfigure(0, weight=1)
+        self.possible_words_frame.rowconfigure(1, weight=1)
 
         self.possible_words_label = ttk.Label(self.possible_words_frame, text='Possible Words:')
         self.possible_words_label.grid(row=0, column=0, sticky=tk.NSEW, **ELEMENT_PADDING)
 
+        self.possible_words_list = VirtualList(self.possible_words_frame)
+        self.possible_words_list.grid(row=1, column=0, sticky=tk.NSEW, **ELEMENT_PADDING)
+
     
     def _create_guesses_frame(self):
         self.guesses_frame = ttk.Frame(self.wrapper, style='Guesses.TFrame')
@@ -127,8 +149,8 @@ class SkribblerWindow(tk.Toplevel):
         self.guesses_label = ttk.Label(self.guesses_frame, text='Guesses:')
         self.guesses_label.grid(row=0, column=0, columnspan=2, sticky=tk.NSEW, **ELEMENT_PADDING)
 
-        self.guesses_text = ttk.Entry(self.guesses_frame, width=30, state='readonly')
-        self.guesses_text.grid(row=1, column=0, columnspan=2, sticky=tk.NSEW, **ELEMENT_PADDING)
+        self.guesses_list = VirtualList(self.guesses_frame)
+        self.guesses_list.grid(row=1, column=0, columnspan=2, sticky=tk.NSEW, **ELEMENT_PADDING)
 
         self.guesses_entry = ttk.Entry(self.guesses_frame)
         self.guesses_entry.grid(row=2, column=0, sticky=tk.NSEW, **ELEMENT_PADDING)
@@ -154,11 +176,11 @@ class SkribblerWindow(tk.Toplevel):
 
 
     def _on_guesses_entry_return(self, _):
-        self.skribbler.make_guess(self.guesses_entry.get())
+        self.skribbler.queue_guess(self.guesses_entry.get())
         self.guesses_entry.delete(0, tk.END)
     
     def _on_guesses_guess_button_click(self):
-        self.skribbler.make_guess(self.guesses_entry.get())
+        self.skribbler.queue_guess(self.guesses_entry.get())
         self.guesses_entry.delete(0, tk.END)
 
     def _on_start_button_click(self):
@@ -176,5 +198,66 @@ class SkribblerWindow(tk.Toplevel):
             self.start_button['state'] = 'normal'
             self.stop_button['state'] = 'disabled'
 
+        self._drain_updates()
+
         self.after(self.UI_UPDATE_INTERVAL, self._update_ui)
 
+
+    def _drain_updates(self):
+        # Only the latest of each kind of update is shown, so each list is redrawn at most once per batch
+        possible_words = None
+        guesses_changed = False
+
+        for _ in range(self.MAX_UPDATES_PER_DRAIN):
+            try:
+                kind, value = self.updates.get_nowait()
+            except Empty:
+                break
+
+            match kind:
+                case 'website_state':
+                    self.website_state = value
+                case 'game_state':
+                    self.game_state = value
+                case 'word_hint':
+                    self.word_hint = value
+                case 'possible_words':
+                    possible_words = value
+                case 'guess':
+                    # A new list rather than appended to (or cleared, below), as the guesses list draws from the old one
+                    self.guesses = [*self.guesses, value]
+                    guesses_changed = True
+                case 'new_round':
+                    self.word_hint = ''
+                    possible_words = []
+                    self.guesses = []
+                    guesses_changed = True
+
+        if possible_words is not None:
+            self.possible_words_label['text'] = f'Possible Words ({len(possible_words)}):'
+            self.possible_words_list.set_items(possible_words)
+
+        if guesses_changed:
+            self.guesses_list.set_items(self.guesses, scroll_to_end=True)
+
+        game_state = f' ({self.game_state})' if self.website_state == 'game' and self.game_state else ''
+        self.game_info_label['text'] = f'Game Info: {self.website_state}{game_state}    Hint: {self.word_hint or "-"}'
+
+
+    def _update_metrics(self):
+        summary = self.skribbler.metrics.get_summary()
+
+        timings = sorted(summary['timings'].items(), key=lambda item: item[1]['total'], reverse=True)[:self.METRICS_SHOWN_TIMINGS]
+
+        lines = [f'{"":56}{"p50":>10}{"p95":>10}{"p99":>10}{"count":>8}']
+        for name, timing in timings:
+            lines.append(f'{name:56.56}' + ''.join(f'{timing[quantile] * 1000:>8.1f}ms' for quantile in ('p50', 'p95', 'p99')) + f'{timing["count"]:>8}')
+
+        counters = summary['counters']
+        transitions = sum(value for name, value in counters.items() if name.startswith('state_transitions'))
+        exceptions = sum(value for name, value in counters.items() if name.startswith('exceptions'))
+        lines.append(f'State transitions: {transitions}    Exceptions: {exceptions}')
+
+        self.game_info_metrics_label['text'] = '\n'.join(lines)
+
+        self.after(self.METRICS_UPDATE_INTERVAL, self._update_metrics)
@@ -4,6 +4,7 @@ TITLE_FONT = ('Segoe UI Variable Display', 24)
 HEADING_FONT = ('Segoe UI Variable Text', 14)
 LABEL_FONT = ('Segoe UI Variable Text', 12)
 BUTTON_FONT = ('Segoe UI Variable Text Semibold', 12)
+MONOSPACE_FONT = ('Cascadia Mono', 10)
 
 WRAPPER_PADDING = {'padx': 10, 'pady': 10}
 ELEMENT_PADDING = {'padx': 5, 'pady': 5}
@@ -0,0 +1,98 @@
+"""Contains the VirtualList class."""
+
+import tkinter as tk
+from collections.abc import Sequence
+from tkinter import ttk
+from tkinter.font import Font
+
+from gui.styles import *
+
+
+class VirtualList(ttk.Frame):
+    """A scrollable list of strings that only draws the rows in view, so that it stays fast with thousands of items.
+
+    The canvas keeps one text item per row that fits, and a redraw only rewrites their text, so replacing or scrolling
+    the list costs the same whether it has ten items or ten thousand. The items are not copied, so the sequence must not
+    be changed after it is passed to set_items.
+    """
+
+    ROW_PADDING = 2
+    TEXT_INDENT = 4
+
+
+    def __init__(self, master, font=LABEL_FONT, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.font = Font(font=font)
+        self.row_height = self.font.metrics('linespace') + self.ROW_PADDING
+
+        self.items: Sequence[str] = ()
+        self.first_row = 0
+
+        style = ttk.Style(self)
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0, background=style.lookup('TFrame', 'background'))
+        self.text_color = style.lookup('TLabel', 'foreground') or 'black'
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+
+        self.canvas.grid(row=0, column=0, sticky=tk.NSEW)
+        self.scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        # one canvas text item per row that fits, reused for whichever items are in view
+        self._row_texts: list[int] = []
+
+        self.canvas.bind('<Configure>', lambda _: self._draw())
+        self.canvas.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.canvas.bind('<Button-4>', lambda _: self.yview('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda _: self.yview('scroll', 1, 'units'))
+
+
+    def set_items(self, items: Sequence[str], scroll_to_end: bool = False):
+        self.items = items
+
+        if scroll_to_end:
+            self.first_row = len(items)
+
+        self._draw()
+
+
+    # The scrollbar's command, which scrolls the list
+    def yview(self, *args):
+        match args:
+            case ('moveto', fraction):
+                self.first_row = int(float(fraction) * len(self.items))
+            case ('scroll', amount, 'pages'):
+                self.first_row += int(amount) * self._get_visible_rows()
+            case ('scroll', amount, _):
+                self.first_row += int(amount)
+
+        self._draw()
+
+
+    def _get_visible_rows(self) -> int:
+        return max(self.canvas.winfo_height() // self.row_height, 1)
+
+
+    def _on_mouse_wheel(self, event):
+        # Windows reports multiples of 120 per notch and macOS reports single steps
+        self.yview('scroll', -(event.delta // 120 or event.delta), 'units')
+
+
+    def _draw(self):
+        visible_rows = self._get_visible_rows()
+        self.first_row = max(min(self.first_row, len(self.items) - visible_rows), 0)
+
+        # a partially visible row at the bottom is drawn too
+        while len(self._row_texts) < visible_rows + 1:
+            row = len(self._row_texts)
+            self._row_texts.append(self.canvas.create_text(self.TEXT_INDENT, row * self.row_height, anchor=tk.NW, font=self.font, fill=self.text_color))
+
+        for row, row_text in enumerate(self._row_texts):
+            index = self.first_row + row
+            self.canvas.itemconfigure(row_text, text=self.items[index] if index < len(self.items) else '')
+
+        if self.items:
+            self.scrollbar.set(self.first_row / len(self.items), min((self.first_row + visible_rows) / len(self.items), 1))
+        else:
+            self.scrollbar.set(0, 1)
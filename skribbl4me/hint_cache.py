@@ -0,0 +1,86 @@
+"""Contains the HintCache class."""
+
+from collections import OrderedDict
+from threading import Lock
+
+from word_index import WordIndex
+
+
+class HintCache:
+    """A bounded, thread-safe LRU cache of word index lookups, keyed by word list and hint.
+
+    The same hints recur constantly across rounds (and across Skribblers sharing a process), so the words matching
+    each one are kept as a tuple and handed out again without touching the index. Entries are keyed by the word
+    index's fingerprint as well as the hint, so indexes over different word lists can share a cache without mixing up
+    their results. Once max_size hints are cached, the least recently used one is evicted.
+    """
+
+    MAX_SIZE = 4096
+
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        """Initializes the HintCache class."""
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = Lock()
+        self._entries: OrderedDict[tuple[int, str], tuple[str, ...]] = OrderedDict()
+
+
+    @staticmethod
+    def normalize_hint(word_hint: str) -> str:
+        """Returns the form of a hint used as its key, so that hints differing only in surrounding whitespace share an entry."""
+        return word_hint.strip()
+
+
+    def lookup(self, word_index: WordIndex, word_hint: str) -> tuple[str, ...]:
+        """Returns the words in the index that match the hint, in word list order."""
+        word_hint = self.normalize_hint(word_hint)
+        key = (word_index.fingerprint, word_hint)
+
+        with self._lock:
+            words = self._entries.get(key)
+
+            if words is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return words
+
+            self.misses += 1
+
+        # Looked up outside the lock so that a miss does not hold up other threads; racing misses store the same words
+        words = tuple(word_index.lookup(word_hint))
+
+        with self._lock:
+            self._entries[key] = words
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return words
+
+
+    def invalidate(self, word_index: WordIndex | None = None) -> None:
+        """Forgets the cached lookups of a word index, for when its word list has been replaced, or every lookup if no index is given."""
+        with self._lock:
+            if word_index is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == word_index.fingerprint]:
+                del self._entries[key]
+
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns the number of cached hints and the hit, miss and eviction counts."""
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+# Shared by every Skribbler in the process
+shared_hint_cache = HintCache()
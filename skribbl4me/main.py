@@ -1,22 +1,55 @@
+import argparse
 import json
+from os import path
 
+from browser import BROWSER_PROFILES, SKRIBBL_URL
+from guess_selection import GUESS_SELECTIONS
 from gui.app import App
 from gui.main_window import MainWindow
 from gui.skribbler_window import SkribblerWindow
 from skribbler import Skribbler
+from word_store import load_word_frequencies
+from word_table import build_word_table, load_word_table
 
 if __name__ == '__main__':
 
+    parser = argparse.ArgumentParser(description='skribbl4me')
+    parser.add_argument('--profile', choices=BROWSER_PROFILES, default='default', help='Browser profile to launch the browser with')
+    parser.add_argument('--guess-selection', choices=GUESS_SELECTIONS, default='frequency', help='How to choose between the possible words (elimination needs NumPy)')
+    parser.add_argument('--prewarm', action='store_true', help='Launch the browser and load skribbl.io in the background while the main window is open')
+    parser.add_argument('--url', default=SKRIBBL_URL, help='Address of the game to play, e.g. a local stand-in for testing')
+    parser.add_argument('--metrics-file', help='File to periodically write loop timings and counters to, as JSON if it ends in .json and as Prometheus text otherwise')
+    args = parser.parse_args()
+
     word_data_json = '../scrape4me/word_data.json'
+    word_store_database = '../scrape4me/word_data.sqlite3'
+    word_encounters_txt = '../scrape4me/word_encounters.txt'
+    word_table_bin = '../scrape4me/word_table.bin'
+
+    word_frequencies = load_word_table(word_table_bin, word_encounters_txt)
+
+    if word_frequencies is None:
+        if path.exists(word_encounters_txt):
+            # Only the encounters logged since the store was last synced are counted
+            word_frequencies = load_word_frequencies(word_store_database, word_encounters_txt)
+
+            # Rebuild the word table so that the next launch can skip the store
+            build_word_table(word_table_bin, word_frequencies, word_encounters_txt)
+        else:
+            with open(word_data_json, 'r', encoding='utf-8') as file:
+                word_data = json.load(file)
 
-    with open(word_data_json, 'r', encoding='utf-8') as file:
-        word_data = json.load(file)
-    
-    word_list = [word['word'] for word in word_data['words']]
+            word_frequencies = {word['word']: word['frequency'] for word in word_data['words']}
+
+    word_list = list(word_frequencies)
 
     print(f'Loaded {len(word_list)} unique words!')
 
-    skribbler = Skribbler('../lib/webdriver/msedgedriver.exe', '../lib/autodraw/autodraw.crx', word_list)
+    skribbler = Skribbler('../lib/webdriver/msedgedriver.exe', '../lib/autodraw/autodraw.crx', word_list, word_frequencies, browser_profile=args.profile, guess_selection=args.guess_selection,
+                          metrics_path=args.metrics_file, skribbl_url=args.url)
+
+    if args.prewarm:
+        skribbler.prewarm_driver()
 
     app = App()
     app.withdraw()
@@ -25,4 +58,7 @@ if __name__ == '__main__':
 
     app.mainloop()
 
-    skribbler.stop_skribbling()
\ No newline at end of file
+    skribbler.stop_skribbling()
+
+    # Otherwise a pre-warmed browser that was never launched would stay open after the app closes
+    skribbler.close_driver_pool()
\ No newline at end of file
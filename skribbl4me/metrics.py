@@ -0,0 +1,191 @@
+"""Contains the Metrics class."""
+
+import json
+import os
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of the samples."""
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def format_metric_name(name: str, labels: Labels) -> str:
+    """Formats a metric name and its labels the way Prometheus does, e.g. phase_seconds{phase="snapshot"}."""
+    if not labels:
+        return name
+
+    return name + '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+class Timing:
+    """A rolling window of the most recent durations of something, along with its all-time count and total."""
+
+    def __init__(self, window: int) -> None:
+        """Initializes the Timing class."""
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+
+    def observe(self, seconds: float) -> None:
+        """Records a duration."""
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+
+class Metrics:
+    """Collects timings and counters from the skribbling and scraping loops.
+
+    Timings keep a rolling window of their most recent WINDOW samples for the p50/p95/p99 percentiles, and an all-time
+    count and total. Every metric can be given labels, e.g. metrics.time('phase_seconds', phase='snapshot'). The
+    collected metrics can be read with get_summary or written to a JSON or Prometheus text file with dump.
+    """
+
+    WINDOW = 1000
+    QUANTILES = (50, 95, 99)
+
+
+    def __init__(self, prefix: str = 'skribbl4me') -> None:
+        """Initializes the Metrics class."""
+        self.prefix = prefix
+
+        self._timings: dict[tuple[str, Labels], Timing] = {}
+        self._counters: dict[tuple[str, Labels], int] = {}
+        self._lock = Lock()
+
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Records a duration in seconds."""
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = Timing(self.WINDOW)
+
+            timing.observe(seconds)
+
+
+    def increment(self, name: str, amount: int = 1, **labels: str) -> None:
+        """Adds to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """Times the body of a with statement, counting any exception raised out of it in 'exceptions'."""
+        start = perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.increment('exceptions', type=type(e).__name__, metric=name, **labels)
+            raise
+        finally:
+            self.observe(name, perf_counter() - start, **labels)
+
+
+    def instrument_driver(self, driver: 'WebDriver') -> None:
+        """Times every WebDriver command the driver sends, as webdriver_command_seconds{command=...}."""
+        if getattr(driver, '_skribbl4me_metrics', None) is self:
+            return
+
+        execute = getattr(driver, '_skribbl4me_execute', driver.execute)
+
+        def timed_execute(driver_command: str, params: dict | None = None):
+            with self.time('webdriver_command_seconds', command=driver_command):
+                return execute(driver_command, params)
+
+        driver._skribbl4me_execute = execute
+        driver._skribbl4me_metrics = self
+        driver.execute = timed_execute
+
+
+    def get_summary(self) -> dict[str, dict]:
+        """Returns the timings (in seconds) and counters, keyed by their formatted names."""
+        timings, counters = self._copy()
+
+        summary: dict[str, dict] = {'timings': {}, 'counters': {}}
+
+        for (name, labels), (samples, count, total) in sorted(timings.items()):
+            summary['timings'][format_metric_name(name, labels)] = {
+                'count': count,
+                'total': total,
+                **{f'p{quantile}': percentile(samples, quantile) for quantile in self.QUANTILES},
+            }
+
+        for (name, labels), value in sorted(counters.items()):
+            summary['counters'][format_metric_name(name, labels)] = value
+
+        return summary
+
+
+    def to_json(self) -> str:
+        """Returns the summary as JSON."""
+        return json.dumps(self.get_summary(), indent=4)
+
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format, with timings as summaries."""
+        timings, counters = self._copy()
+
+        lines: list[str] = []
+        typed_names: set[str] = set()
+
+        for (name, labels), (samples, count, total) in sorted(timings.items()):
+            metric_name = f'{self.prefix}_{name}'
+            if metric_name not in typed_names:
+                typed_names.add(metric_name)
+                lines.append(f'# TYPE {metric_name} summary')
+
+            for quantile in self.QUANTILES:
+                lines.append(f'{format_metric_name(metric_name, labels + (("quantile", str(quantile / 100)),))} {percentile(samples, quantile)}')
+            lines.append(f'{format_metric_name(metric_name + "_sum", labels)} {total}')
+            lines.append(f'{format_metric_name(metric_name + "_count", labels)} {count}')
+
+        for (name, labels), value in sorted(counters.items()):
+            metric_name = f'{self.prefix}_{name}_total'
+            if metric_name not in typed_names:
+                typed_names.add(metric_name)
+                lines.append(f'# TYPE {metric_name} counter')
+
+            lines.append(f'{format_metric_name(metric_name, labels)} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+    def dump(self, file_path: str) -> None:
+        """Writes the metrics to a file, as JSON if it ends in .json and as Prometheus text otherwise."""
+        content = self.to_json() if file_path.endswith('.json') else self.to_prometheus()
+
+        # Written to a temporary file first so that readers never see a half-written dump
+        temporary_path = file_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        os.replace(temporary_path, file_path)
+
+
+    def _copy(self) -> tuple[dict[tuple[str, Labels], tuple[list[float], int, float]], dict[tuple[str, Labels], int]]:
+        with self._lock:
+            timings = {key: (list(timing.samples), timing.count, timing.total) for key, timing in self._timings.items()}
+            counters = dict(self._counters)
+
+        return timings, counters
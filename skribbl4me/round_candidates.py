@@ -0,0 +1,115 @@
+"""Contains the RoundCandidates class."""
+
+from collections.abc import Iterable, Set
+
+from hint_cache import HintCache
+from word_index import WordIndex, fold_character
+
+
+class RoundCandidates:
+    """Tracks the words that are still possible within a single round.
+
+    Hints only ever reveal more letters during a round, so once the round's candidates have been taken from the word
+    index, each new hint only needs to filter the current survivors by the newly revealed letters. Excluding a word
+    looks up its case variants in the word index, rather than folding every candidate.
+    """
+
+    def __init__(self, word_index: WordIndex, hint_cache: HintCache | None = None) -> None:
+        """Initializes the RoundCandidates class. If a hint cache is given, the round's first lookup goes through it."""
+        self.word_index = word_index
+        self.hint_cache = hint_cache
+
+        self.word_hint: str | None = None
+        self.possible_words: list[str] = []
+
+        self._survivors: list[str] = []
+        self._constraints: set[tuple[int, str]] = set()
+        # folded, as skribbl.io ignores case when checking guesses
+        self._excluded_words: set[str] = set()
+        # the words in the word list whose folded form is excluded
+        self._excluded_variants: set[str] = set()
+
+
+    def reset(self) -> None:
+        """Forgets the current round."""
+        self.word_hint = None
+        self.possible_words = []
+
+        self._survivors = []
+        self._constraints = set()
+        self._excluded_words = set()
+        self._excluded_variants = set()
+
+
+    def update(self, word_hint: str) -> list[str]:
+        """Narrows the candidates to those matching the word hint and returns the words that are still possible."""
+        if word_hint == self.word_hint:
+            return self.possible_words
+
+        constraints = set(WordIndex.get_hint_constraints(word_hint))
+
+        if self.word_hint is None or WordIndex.get_hint_shape(word_hint) != WordIndex.get_hint_shape(self.word_hint) or not self._constraints <= constraints:
+            # A new round (or a hint that does not follow from the previous one), so start again from the index
+            self._survivors = list(self.hint_cache.lookup(self.word_index, word_hint)) if self.hint_cache is not None else self.word_index.lookup(word_hint)
+        else:
+            for position, char in constraints - self._constraints:
+                # Only the few distinct characters at the position are folded, rather than one for every survivor
+                matching_chars = {word_char for word_char in {word[position] for word in self._survivors} if fold_character(word_char) == char}
+                self._survivors = [word for word in self._survivors if word[position] in matching_chars]
+
+        self.word_hint = word_hint
+        self._constraints = constraints
+        self.possible_words = [word for word in self._survivors if word not in self._excluded_variants]
+
+        return self.possible_words
+
+
+    def exclude(self, word: str) -> None:
+        """Removes a word (in any case) from the possible words for the rest of the round."""
+        folded_word = word.lower()
+
+        if folded_word in self._excluded_words:
+            return
+
+        self._excluded_words.add(folded_word)
+        self._exclude_variants(self.word_index.get_case_variants(folded_word))
+
+
+    def exclude_all(self, words: Iterable[str]) -> None:
+        """Removes every given word (in any case) from the possible words for the rest of the round, in a single pass."""
+        folded_words = {word.lower() for word in words} - self._excluded_words
+
+        if not folded_words:
+            return
+
+        self._excluded_words |= folded_words
+        self._exclude_variants([variant for folded_word in folded_words for variant in self.word_index.get_case_variants(folded_word)])
+
+
+    def restrict(self, words: Set[str]) -> None:
+        """Removes every word that is not in the given set from the possible words for the rest of the round."""
+        self._survivors = [word for word in self._survivors if word in words]
+        self.possible_words = [word for word in self.possible_words if word in words]
+
+
+    def _exclude_variants(self, variants: Iterable[str]) -> None:
+        # The possible words are replaced rather than changed, as the GUI may still be showing the old list
+        variants = set(variants) - self._excluded_variants
+
+        if not variants:
+            return
+
+        self._excluded_variants |= variants
+
+        if len(variants) == 1:
+            # Usually the guess itself, which is found by scans in C rather than by filtering the list
+            variant = next(iter(variants))
+            match self.possible_words.count(variant):
+                case 0:
+                    return
+                case 1:
+                    index = self.possible_words.index(variant)
+                    self.possible_words = self.possible_words[:index] + self.possible_words[index + 1:]
+                    return
+
+        self.possible_words = [possible_word for possible_word in self.possible_words if possible_word not in variants]
@@ -1,21 +1,35 @@
 """Contains the Skribbler class."""
 
+import asyncio
 import random
 import re
+from functools import partial
+from queue import Empty, SimpleQueue
 from threading import Thread
-from time import sleep
-from selenium import webdriver
-from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException, ElementNotInteractableException, TimeoutException)
-from selenium.webdriver.common.by import By
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from time import monotonic
+from typing import TYPE_CHECKING
+from selenium.common.exceptions import (StaleElementReferenceException, ElementNotInteractableException, NoSuchElementException)
 from selenium.webdriver.common.keys import Keys
 
+if TYPE_CHECKING:
+    from async_webdriver import AsyncWebDriver
+
+from browser import SKRIBBL_URL, BrowserProfile, create_driver, load_skribbl
+from dom_probe import PageChangeWaiter, take_snapshot, take_snapshot_async
+from driver_pool import DriverPool
+from edit_distance_index import EditDistanceIndex
+from element_cache import ElementCache
+from guess_ranking import GuessRanker
+from guess_scheduler import GuessScheduler
+from guess_selection import ExpectedEliminationSelector, GuessSelection
+from hint_cache import shared_hint_cache
+from metrics import Metrics
+from round_candidates import RoundCandidates
+from word_index import WordIndex
+
+
+# The chat notice skribbl.io shows only to a player whose guess was one letter off, e.g. "'apple' is close!"
+CLOSE_GUESS_PATTERN = re.compile(r"^'?(.+?)'? is close!?$", re.IGNORECASE)
 
 
 def clamp(value, min_value, max_value):
@@ -28,8 +42,15 @@ class Skribbler:
 
     PAGE_LOAD_TIMEOUT = 10
     COOKIE_CONSENT_TIMEOUT = 3
+    # How long to wait for the pre-warmed browser before launching one the slow way
+    PREWARMED_DRIVER_TIMEOUT = 30
 
     LOOP_DELAY = 0.1
+    # How long to block waiting for the page to change before re-checking anyway, and how often to retry installing the
+    # change observer while falling back to polling every LOOP_DELAY
+    CHANGE_WAIT_TIMEOUT = 0.5
+    CHANGE_OBSERVER_RETRY_DELAY = 2
+    METRICS_DUMP_INTERVAL = 5
     GUESS_DELAY_RANGES = {
         0: (4, 8),
         1: (3, 6),
@@ -37,36 +58,87 @@ class Skribbler:
     }
 
 
-    def __init__(self, driver_executable: str, autodraw_extension: str, word_list: list[str]) -> None:
+    def __init__(self, driver_executable: str, autodraw_extension: str, word_list: list[str], word_frequencies: dict[str, int] | None = None, browser_profile: BrowserProfile = 'default',
+                 guess_selection: GuessSelection = 'frequency', metrics_path: str | None = None, skribbl_url: str = SKRIBBL_URL) -> None:
         """Initializes the Skribbler class."""
         self.word_list = word_list
+        self.word_index = WordIndex(word_list)
+        self.hint_cache = shared_hint_cache
+        self.guess_ranker = GuessRanker(word_frequencies)
+        self.guess_selector = ExpectedEliminationSelector(self.guess_ranker) if guess_selection == 'elimination' else None
+        self.expected_guesses_to_correct = 0.0
+        # get_guess_delay is looked up on every call, so that it can be replaced on the instance
+        self.guess_scheduler = GuessScheduler(lambda number_of_hints: self.get_guess_delay(number_of_hints))
+        self.round_candidates = RoundCandidates(self.word_index, self.hint_cache)
+        self.edit_distance_index = EditDistanceIndex(word_list)
         self.driver_is_initialised = False
         self.website_is_loaded = False
         self.skribbling_is_enabled = False
         self.driver_executable = driver_executable
         self.autodraw_extension = autodraw_extension
+        self.browser_profile = browser_profile
+        self.skribbl_url = skribbl_url
+        self.driver_pool: DriverPool | None = None
+        self.metrics = Metrics()
+        self.element_cache = ElementCache(metrics=self.metrics)
+        self.metrics_path = metrics_path
+        self.async_driver: 'AsyncWebDriver | None' = None
+        self.reset_loop_state()
         self.current_round_guessed_words = []
+        # This round's guesses that skribbl.io has not (yet) said were close, see rule_out_near_misses
+        self.unflagged_guesses: list[str] = []
+        # If set (by the GUI), every change of the loop's state is put on it as a (kind, value) tuple, see publish_update
+        self.update_queue: SimpleQueue | None = None
+        # Guesses typed into the GUI while the loop is running, which the loop makes on its next tick, see queue_guess
+        self.manual_guesses: SimpleQueue[str] = SimpleQueue()
+        self.published_word_hint: str | None = None
+        self.published_possible_words: list[str] | None = None
+        self.page_change_waiter = PageChangeWaiter(self.LOOP_DELAY, self.CHANGE_OBSERVER_RETRY_DELAY)
 
         self.loop_thread: Thread
+        self.loop_task: asyncio.Task
 
 
-    def init_driver(self) -> None:
-        """Initializes the Selenium driver."""
-        browser = 'edge' if 'edgedriver' in self.driver_executable else 'chrome'
+    def prewarm_driver(self) -> None:
+        """Starts launching the browser and loading the website in the background, ready for init_driver."""
+        if self.driver_pool is not None:
+            return
 
-        if browser == 'edge':
-            options = EdgeOptions()
-            options.add_extension(self.autodraw_extension)
-            service = EdgeService(executable_path=self.driver_executable)
-            self.driver = webdriver.Edge(service=service, options=options)
+        self.driver_pool = DriverPool(
+            partial(create_driver, self.driver_executable, profile=self.browser_profile, extensions=[self.autodraw_extension]),
+            partial(load_skribbl, profile=self.browser_profile, page_load_timeout=self.PAGE_LOAD_TIMEOUT, consent_timeout=self.COOKIE_CONSENT_TIMEOUT,
+                    url=self.skribbl_url),
+            size=1,
+        )
+        self.driver_pool.start()
 
-        else:
-            options = ChromeOptions()
-            options.add_extension(self.autodraw_extension)
-            service = ChromeService(executable_path=self.driver_executable)
-            self.driver = webdriver.Chrome(service=service, options=options)
 
-        self.driver.set_window_size(1200, 800)
+    def close_driver_pool(self) -> None:
+        """Quits the pre-warmed browser, if there is one, along with the driver if it was taken from the pool."""
+        if self.driver_pool is None:
+            return
+
+        self.driver_pool.close()
+        self.driver_pool = None
+
+
+    def init_driver(self) -> None:
+        """Initializes the Selenium driver, taking the pre-warmed browser if there is one."""
+        driver = None
+
+        if self.driver_pool is not None:
+            try:
+                driver = self.driver_pool.acquire(timeout=self.PREWARMED_DRIVER_TIMEOUT)
+                self.website_is_loaded = True
+            except Empty:
+                print('The pre-warmed browser is not ready, launching a new one...')
+                # Otherwise the pre-warmed browser would be left open once it is ready
+                self.close_driver_pool()
+
+        self.driver = driver or create_driver(self.driver_executable, profile=self.browser_profile, extensions=[self.autodraw_extension])
+        self.element_cache.invalidate()
+
+        self.metrics.instrument_driver(self.driver)
         self.driver.set_window_position(0, 0)
 
         self.driver_is_initialised = True
@@ -74,16 +146,7 @@ class Skribbler:
 
     def load_website(self) -> None:
         """Loads the skribbl.io website and accepts cookies."""
-        self.driver.get('https://skribbl.io')
-        WebDriverWait(self.driver, self.PAGE_LOAD_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'home')))
-        assert 'skribbl' in self.driver.title
-
-        try:
-            WebDriverWait(self.driver, self.COOKIE_CONSENT_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'cmpwelcomebtnyes')))
-            consent_button = self.driver.find_element(By.ID, 'cmpwelcomebtnyes')
-            consent_button.click()
-        except (NoSuchElementException, TimeoutException):
-            pass
+        load_skribbl(self.driver, self.browser_profile, self.PAGE_LOAD_TIMEOUT, self.COOKIE_CONSENT_TIMEOUT, self.skribbl_url)
 
         self.website_is_loaded = True
 
@@ -99,158 +162,375 @@ class Skribbler:
         self.loop_thread.start()
 
 
+    def start_skribbling_async(self) -> asyncio.Task:
+        """Starts the skribbling loop as a task on the running event loop, driving the browser through the async driver."""
+        if not self.skribbling_is_enabled:
+            self.skribbling_is_enabled = True
+            self.loop_task = asyncio.ensure_future(self.loop_async())
+
+        return self.loop_task
+
+
+    async def stop_skribbling_async(self) -> None:
+        """Stops the skribbling loop task."""
+        if not self.skribbling_is_enabled:
+            return
+
+        self.skribbling_is_enabled = False
+        await self.loop_task
+
+
     def stop_skribbling(self) -> None:
         """Stops the skribbling loop."""
         if not self.skribbling_is_enabled:
             return
 
+        # The loop never waits longer than CHANGE_WAIT_TIMEOUT, so it stops within a tick
         self.skribbling_is_enabled = False
         self.loop_thread.join()
 
 
     def loop(self) -> None:
         """The main loop."""
-        print('Starting skribbling loop...')
+        self.start_loop()
+
+        while self.skribbling_is_enabled:
+            # Rather than sleeping between guesses, the loop keeps watching the page until the next guess is due
+            with self.metrics.time('phase_seconds', phase='page_wait'):
+                self.page_change_waiter.wait(self.driver, self.guess_scheduler.get_wait_timeout(self.CHANGE_WAIT_TIMEOUT))
+
+            self.dump_metrics_if_due()
+
+            with self.metrics.time('tick_seconds'):
+                with self.metrics.time('phase_seconds', phase='snapshot'):
+                    snapshot = self.get_snapshot()
+
+                guess = self.process_snapshot(snapshot) if snapshot is not None else None
+
+                for word in self.get_manual_guesses():
+                    self.make_guess(word, snapshot)
+
+                if guess is not None:
+                    with self.metrics.time('phase_seconds', phase='guess_submission'):
+                        self.make_guess(guess[0], snapshot)
+
+            self.schedule_next_guess(guess)
 
-        previous_website_state: str = 'unknown'
-        previous_game_state: str = 'unknown'
+        # Guesses typed in just before stopping are made now, while the loop is still the only one driving the browser
+        for word in self.get_manual_guesses():
+            self.make_guess(word)
+
+        self.finish_loop()
+
+
+    async def loop_async(self) -> None:
+        """The main loop, driving the browser through the async driver as a task on the running event loop."""
+        self.start_loop()
 
         while self.skribbling_is_enabled:
-            sleep(self.LOOP_DELAY)
-                
-            website_state = self.get_website_state()
+            with self.metrics.time('phase_seconds', phase='page_wait'):
+                await self.page_change_waiter.wait_async(self.async_driver, self.guess_scheduler.get_wait_timeout(self.CHANGE_WAIT_TIMEOUT))
 
-            match website_state:
-                case w_state if w_state in ['home', 'lobby', 'loading']:
-                    if previous_website_state == w_state:
-                        continue
-                    previous_website_state = w_state
+            self.dump_metrics_if_due()
 
-                    print(f'Website state: {w_state}')
-                
-                case 'game':
-                    # Do not break if previous state was game, as the game requires multiple checks to be done
-                    if previous_website_state != 'game':
-                        print('Website state: game')
+            with self.metrics.time('tick_seconds'):
+                with self.metrics.time('phase_seconds', phase='snapshot'):
+                    snapshot = await take_snapshot_async(self.async_driver, read_chat=True)
 
-                    previous_website_state = 'game'
+                guess = self.process_snapshot(snapshot) if snapshot is not None else None
 
-                    game_state = self.get_game_state()
-                    
-                    match game_state:
-                        case g_state if g_state in ['drawing', 'waiting_for_round', 'guessed']:
-                            if previous_game_state == g_state:
-                                continue
-                            previous_game_state = g_state
+                for word in self.get_manual_guesses():
+                    await self.make_guess_async(word, snapshot)
 
-                            print(f'Game state: {g_state}')
-                            self.current_round_guessed_words = []
-                        
-                        case 'guessing':
-                            # Do not break if previous state was guessing, as guessing requires multiple checks to be done
-                            if previous_game_state != 'guessing':
-                                print('Guessing!')
-                            previous_game_state = 'guessing'
+                if guess is not None:
+                    with self.metrics.time('phase_seconds', phase='guess_submission'):
+                        await self.make_guess_async(guess[0], snapshot)
 
-                            word_hint = self.extract_word_hint()
-                            hint_regex = self.generate_hint_regex(word_hint)
+            self.schedule_next_guess(guess)
 
-                            number_of_hints = self.get_number_of_hints_given(word_hint)
+        for word in self.get_manual_guesses():
+            await self.make_guess_async(word)
 
-                            possible_words = self.get_possible_words(hint_regex)
-                            possible_words = list(set(possible_words) - set(self.current_round_guessed_words))
-                            word_to_guess = self.choose_word_to_guess(possible_words)
+        self.finish_loop()
 
-                            if word_to_guess:
-                                print(f'Guessing "{word_to_guess}". One of {len(possible_words)} possible words from the hint "{word_hint}".')
-                                self.make_guess(word_to_guess)
 
-                                # Wait a random amount of time before guessing again
-                                guess_delay = random.randint(*self.GUESS_DELAY_RANGES[clamp(number_of_hints, 0, len(self.GUESS_DELAY_RANGES) - 1)])
-                                print(f'Waiting {guess_delay} seconds before guessing again...')
-                                sleep(guess_delay)
-                            
-                            print('Done')
+    def start_loop(self) -> None:
+        """Prepares for the first tick of the loop."""
+        print('Starting skribbling loop...')
 
+        self.reset_loop_state()
+        # Built before the first tick, so that even the first close guess narrows the candidates straight away
+        self.edit_distance_index.build()
 
 
+    def finish_loop(self) -> None:
+        """Cleans up after the last tick of the loop."""
+        self.dump_metrics_if_due(force=True)
 
         print('Stopping skribbling loop...')
 
 
-    def get_website_state(self) -> str:
-        """Detects the current website state."""
-        displayed: list[str] = []
+    def schedule_next_guess(self, guess: tuple[str, int] | None) -> None:
+        """Schedules the next guess after a tick that made the given guess, if it made one."""
+        if guess is None:
+            return
+
+        # Wait a random amount of time before guessing again
+        guess_delay = self.guess_scheduler.guessed(guess[1])
+        print(f'Waiting up to {guess_delay} seconds before guessing again...')
+
+
+    def reset_loop_state(self) -> None:
+        """Resets the states remembered between ticks of the loop."""
+        self.previous_website_state = 'unknown'
+        self.previous_game_state = 'unknown'
+        # Unlike previous_website_state, this is also updated for the unknown and multiple states
+        self.last_website_state = 'unknown'
+        self.next_metrics_dump_time = 0.0
+        self.guess_scheduler.reset()
+        self.published_word_hint = None
+        self.published_possible_words = None
+
+
+    def process_snapshot(self, snapshot: dict) -> tuple[str, int] | None:
+        """Advances the loop's state machine with a snapshot. Returns the word to guess and the number of hints given, if it is time to guess."""
+        with self.metrics.time('phase_seconds', phase='state_detection'):
+            website_state = self.get_website_state(snapshot)
+            game_state = self.get_game_state(snapshot) if website_state == 'game' else None
+
+        if website_state != self.last_website_state:
+            self.metrics.increment('state_transitions', kind='website', state=website_state)
+            self.publish_update('website_state', website_state)
+            self.last_website_state = website_state
+
+        match website_state:
+            case w_state if w_state in ['home', 'lobby', 'loading']:
+                if self.previous_website_state == w_state:
+                    return None
+                self.previous_website_state = w_state
+
+                print(f'Website state: {w_state}')
+
+            case 'game':
+                # Do not break if previous state was game, as the game requires multiple checks to be done
+                if self.previous_website_state != 'game':
+                    print('Website state: game')
+
+                self.previous_website_state = 'game'
+
+                if game_state != self.previous_game_state:
+                    self.metrics.increment('state_transitions', kind='game', state=game_state)
+                    self.publish_update('game_state', game_state)
+
+                match game_state:
+                    case g_state if g_state in ['drawing', 'waiting_for_round', 'guessed']:
+                        if self.previous_game_state == g_state:
+                            return None
+                        self.previous_game_state = g_state
+
+                        print(f'Game state: {g_state}')
+                        self.current_round_guessed_words = []
+                        self.unflagged_guesses = []
+                        self.round_candidates.reset()
+                        self.guess_scheduler.reset()
+                        self.published_word_hint = None
+                        self.published_possible_words = None
+                        self.publish_update('new_round', None)
+
+                    case 'guessing':
+                        # Do not break if previous state was guessing, as guessing requires multiple checks to be done
+                        if self.previous_game_state != 'guessing':
+                            print('Guessing!')
+                        self.previous_game_state = 'guessing'
+
+                        with self.metrics.time('phase_seconds', phase='hint_extraction'):
+                            word_hint = self.extract_word_hint(snapshot)
+
+                        number_of_hints = self.get_number_of_hints_given(word_hint)
+                        self.guess_scheduler.update_hints(number_of_hints)
+
+                        with self.metrics.time('phase_seconds', phase='chat_feedback'):
+                            chat = snapshot.get('chat')
+                            self.process_chat(chat or [], snapshot.get('my_name'))
+
+                            # By the time the next guess is due, a close notice for the last one would have been read
+                            if chat is not None and self.guess_scheduler.is_due():
+                                self.rule_out_near_misses()
+
+                        with self.metrics.time('phase_seconds', phase='candidate_filtering'):
+                            possible_words = self.round_candidates.update(word_hint)
+
+                        if word_hint != self.published_word_hint:
+                            self.published_word_hint = word_hint
+                            self.publish_update('word_hint', word_hint)
+
+                        # The candidates are replaced rather than changed, so a new list is a change and can be sent as is
+                        if possible_words is not self.published_possible_words:
+                            self.published_possible_words = possible_words
+                            self.publish_update('possible_words', possible_words)
+
+                        if not self.guess_scheduler.is_due():
+                            return None
+
+                        with self.metrics.time('phase_seconds', phase='guess_choice'):
+                            word_to_guess = self.choose_word_to_guess(possible_words, word_hint)
+
+                        if word_to_guess:
+                            self.expected_guesses_to_correct = self.guess_ranker.get_expected_guesses(possible_words)
+                            print(f'Guessing "{word_to_guess}". One of {len(possible_words)} possible words from the hint "{word_hint}" (expecting to need {self.expected_guesses_to_correct:.1f} guesses).')
+                            return word_to_guess, number_of_hints
+
+        return None
+
+
+    def publish_update(self, kind: str, value: object) -> None:
+        """Puts a change of the loop's state on the update queue, if there is one. Putting never blocks the loop."""
+        if self.update_queue is not None:
+            self.update_queue.put((kind, value))
+
+
+    def process_chat(self, messages: list[dict], my_name: str | None) -> None:
+        """Narrows the round's candidates with the chat messages read since the last tick."""
+        for message in messages:
+            if message['name'] is None:
+                close_guess = CLOSE_GUESS_PATTERN.match(message['text'])
+                if close_guess is not None:
+                    self.handle_close_guess(close_guess.group(1))
 
+            elif message['name'] != my_name:
+                # Correct guesses are never shown in the chat, so any other player's guess is wrong
+                self.metrics.increment('chat_feedback', kind='other_guess')
+                self.round_candidates.exclude(message['text'])
+
+
+    def handle_close_guess(self, guess: str) -> None:
+        """Narrows the round's candidates to the words one edit away from a guess that skribbl.io said was close."""
+        self.metrics.increment('chat_feedback', kind='close_guess')
+        neighbours = self.edit_distance_index.get_neighbours(guess)
+
+        # A notice that rules out every candidate was not about this round's word, so it is ignored rather than giving up
+        if any(word in neighbours for word in self.round_candidates.possible_words):
+            self.round_candidates.restrict(neighbours)
+
+        # A close guess is still a wrong one
+        self.round_candidates.exclude(guess)
+
+        folded_guess = guess.lower()
+        self.unflagged_guesses = [unflagged_guess for unflagged_guess in self.unflagged_guesses if unflagged_guess.lower() != folded_guess]
+
+
+    def rule_out_near_misses(self) -> None:
+        """Removes the words one edit away from each of this round's guesses that skribbl.io did not say was close."""
+        for guess in self.unflagged_guesses:
+            self.round_candidates.exclude_all(self.edit_distance_index.get_neighbours(guess))
+
+        self.unflagged_guesses = []
+
+
+    def record_guess(self, word: str) -> None:
+        """Records a guess that has been made, which was wrong if the round is still going."""
+        self.current_round_guessed_words.append(word)
+        self.unflagged_guesses.append(word)
+        self.round_candidates.exclude(word)
+        self.publish_update('guess', word)
+
+
+    def dump_metrics_if_due(self, force: bool = False) -> None:
+        """Writes the metrics to the metrics file every METRICS_DUMP_INTERVAL seconds, if there is one."""
+        if self.metrics_path is None or (not force and monotonic() < self.next_metrics_dump_time):
+            return
+
+        self.metrics.dump(self.metrics_path)
+        self.next_metrics_dump_time = monotonic() + self.METRICS_DUMP_INTERVAL
+
+
+    def get_snapshot(self) -> dict | None:
+        """Reads the current page state, and the chat messages added since the last snapshot, in a single WebDriver round trip."""
+        return take_snapshot(self.driver, read_chat=True)
+
+
+    def get_chat_input_value(self) -> str | None:
+        """Returns what is typed into the chat input, or None if there is no chat input."""
         try:
-            if self.driver.find_element(By.ID, 'home').is_displayed():
-                displayed.append('home')
-            
-            if 'show' in self.driver.find_element(By.CSS_SELECTOR, '.room').get_attribute('class'):
-                displayed.append('lobby')
-            
-            if self.driver.find_element(By.ID, 'load').is_displayed():
-                displayed.append('loading')
-            
-            if self.driver.find_element(By.ID, 'game').is_displayed() and ('show' not in self.driver.find_element(By.CSS_SELECTOR, '.room').get_attribute('class')):
-                displayed.append('game')
-
-            match len(displayed):
-                case 1:
-                    return displayed[0]
-                case 2:
-                    return 'multiple'
-                case 0 | _:
-                    return 'unknown'
-        
+            return self.element_cache.run(self.driver, 'chat_input', lambda chat_input: chat_input.get_property('value'))
         except NoSuchElementException:
+            return None
+
+
+    def queue_guess(self, word: str) -> None:
+        """Makes a guess typed into the GUI, on the loop's thread if it is running, so that only one thread drives the browser."""
+        if self.skribbling_is_enabled:
+            self.manual_guesses.put(word)
+        else:
+            self.make_guess(word)
+
+
+    def get_manual_guesses(self) -> list[str]:
+        """Takes the guesses typed into the GUI since the last tick."""
+        words = []
+
+        while True:
+            try:
+                words.append(self.manual_guesses.get_nowait())
+            except Empty:
+                return words
+
+
+    def get_website_state(self, snapshot: dict) -> str:
+        """Detects the current website state."""
+        website = snapshot['website']
+
+        if None in (website['home'], website['room_shown'], website['loading'], website['game']):
             return 'unknown'
 
+        displayed: list[str] = []
 
-    def get_game_state(self) -> str:
-        """Detects the current game state."""
+        if website['home']:
+            displayed.append('home')
 
-        try:
-            game_toolbar = self.driver.find_element(By.ID, 'game-toolbar')
-            if game_toolbar.is_displayed():
-                return 'drawing'
-        except NoSuchElementException:
-            pass
+        if website['room_shown']:
+            displayed.append('lobby')
 
-        try:
-            # #game-canvas > .overlay-content. but it is never hidden - its hidden when "top: -100%" and shown when "top: 0%"
-            overlay = self.driver.find_element(By.ID, 'game-canvas').find_element(By.CLASS_NAME, 'overlay-content')
-            # if 'top: 0' in overlay.get_attribute('style'):
-            #     return 'waiting_for_round'
-            if 'top: -100%' not in overlay.get_attribute('style'):
-                return 'waiting_for_round'
-        except NoSuchElementException:
-            pass
+        if website['loading']:
+            displayed.append('loading')
 
-        try:
-            # #game-players > .players-list > .player [.guessed] > .player-info > .player-name [.me]
-            my_player = self.driver.find_element(By.ID, 'game-players').find_element(By.CLASS_NAME, 'players-list').find_element(By.CLASS_NAME, 'me')
+        if website['game'] and not website['room_shown']:
+            displayed.append('game')
 
-            if 'guessed' in my_player.find_element(By.XPATH, '..').find_element(By.XPATH, '..').get_attribute('class'):
-                return 'guessed'
-        except NoSuchElementException:
-            pass
+        match len(displayed):
+            case 1:
+                return displayed[0]
+            case 2:
+                return 'multiple'
+            case 0 | _:
+                return 'unknown'
 
 
+    def get_game_state(self, snapshot: dict) -> str:
+        """Detects the current game state."""
+        game = snapshot['game']
+
+        if game['toolbar']:
+            return 'drawing'
+
+        # #game-canvas > .overlay-content. but it is never hidden - its hidden when "top: -100%" and shown when "top: 0%"
+        if game['overlay_style'] is not None and 'top: -100%' not in game['overlay_style']:
+            return 'waiting_for_round'
+
+        # #game-players > .players-list > .player [.guessed] > .player-info > .player-name [.me]
+        if game['guessed']:
+            return 'guessed'
+
         # TODO: Sometimes the app thinks we are guessing when in reality the round is over (but the overlay hasn't quite been hidden yet)
         return 'guessing'
 
 
-    def extract_word_hint(self) -> str:
-        """Extracts the word hint from the website."""
+    def extract_word_hint(self, snapshot: dict) -> str:
+        """Extracts the word hint from the snapshot."""
         word_hint = ''
 
-        parent = self.driver.find_element(By.ID, 'game-word')
-        hint_container = parent.find_element(By.CLASS_NAME, 'hints').find_element(By.CLASS_NAME, 'container')
-        hints = hint_container.find_elements(By.CLASS_NAME, 'hint')
-
-        for hint in hints:
-            word_hint += ' ' if hint.text == '' else hint.text
+        for hint in snapshot['hints']:
+            word_hint += ' ' if hint == '' else hint
 
         return word_hint.strip()
 
@@ -261,45 +541,74 @@ class Skribbler:
         return len([letter for letter in word_hint if letter != ' ' and letter != '_'])
 
 
+    def get_guess_delay(self, number_of_hints: int) -> int:
+        """Returns a random number of seconds to wait before guessing again."""
+        return random.randint(*self.GUESS_DELAY_RANGES[clamp(number_of_hints, 0, len(self.GUESS_DELAY_RANGES) - 1)])
+
+
     def generate_hint_regex(self, word_hint: str) -> str:
         """Generates a regex pattern from the word hint."""
         return '^' + ''.join(['\\w' if char == '_' else '\\W' if char == ' ' else char for char in word_hint]) + '$'
 
 
-    def get_possible_words(self, hint_regex: str) -> list[str]:
-        """Returns a list of possible words that match the hint regex."""
-        return [word for word in self.word_list if re.match(hint_regex, word)]
+    def get_possible_words(self, word_hint: str) -> list[str]:
+        """Returns a list of possible words that match the word hint."""
+        return list(self.hint_cache.lookup(self.word_index, word_hint))
 
 
-    def choose_word_to_guess(self, possible_words: list[str]) -> str:
-        """Chooses a word to guess from the list of possible words."""
-        return random.choice(possible_words) if possible_words else ''
+    def set_word_list(self, word_list: list[str]) -> None:
+        """Replaces the word list, rebuilding the word index and dropping the old list's cached hint lookups."""
+        self.hint_cache.invalidate(self.word_index)
 
-
-    def make_guess(self, word: str) -> None:
-        """Makes a guess."""
-        # #game > #game-wrapper #game-chat > .chat-container > form > input
-        guess_input = self.driver.find_element(By.ID, 'game-wrapper').find_element(By.ID, 'game-chat').find_element(By.CLASS_NAME, 'chat-container').find_element(By.TAG_NAME, 'form').find_element(By.TAG_NAME, 'input')
-
-        if guess_input.get_attribute('value'):
-            # user is typing, wait for them to finish
-            return
-        
-        try:
-            guess_input.send_keys(word)
-            guess_input.send_keys(Keys.RETURN)
-            self.current_round_guessed_words.append(word)
-        except ElementNotInteractableException:
-            pass
+        self.word_list = word_list
+        self.word_index = WordIndex(word_list)
+        self.round_candidates = RoundCandidates(self.word_index, self.hint_cache)
+        self.edit_distance_index = EditDistanceIndex(word_list)
 
 
+    def choose_word_to_guess(self, possible_words: list[str], word_hint: str) -> str:
+        """Chooses a word to guess from the list of possible words, using the guess selector if there is one or the most frequently encountered word otherwise."""
+        if self.guess_selector is not None:
+            return self.guess_selector.choose(possible_words, word_hint)
 
+        return self.guess_ranker.choose(possible_words)
 
 
+    def make_guess(self, word: str, snapshot: dict | None = None) -> None:
+        """Makes a guess, unless the user is typing into the chat. The chat input is checked in the snapshot if one is given."""
+        chat_input_value = snapshot['chat_input_value'] if snapshot is not None else self.get_chat_input_value()
 
+        # The chat input's value is only null when there is no chat input
+        if chat_input_value is None:
+            return
 
+        if chat_input_value:
+            # user is typing, wait for them to finish
+            return
 
+        try:
+            # Typed and submitted in one round trip
+            self.element_cache.run(self.driver, 'chat_input', lambda guess_input: guess_input.send_keys(word + Keys.RETURN))
+            self.record_guess(word)
+        except (ElementNotInteractableException, NoSuchElementException):
+            pass
 
 
+    async def make_guess_async(self, word: str, snapshot: dict | None = None) -> None:
+        """Makes a guess through the async driver, like make_guess."""
+        if snapshot is not None:
+            chat_input_value = snapshot['chat_input_value']
+        else:
+            try:
+                chat_input_value = await self.element_cache.run_async(self.async_driver, 'chat_input', lambda chat_input: chat_input.get_property('value'))
+            except NoSuchElementException:
+                chat_input_value = None
 
+        if chat_input_value is None or chat_input_value:
+            return
 
+        try:
+            await self.element_cache.run_async(self.async_driver, 'chat_input', lambda guess_input: guess_input.send_keys(word + Keys.RETURN))
+            self.record_guess(word)
+        except (ElementNotInteractableException, NoSuchElementException):
+            pass
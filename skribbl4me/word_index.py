@@ -0,0 +1,142 @@
+"""Contains the WordIndex class."""
+
+import re
+
+
+WORD_CHARACTER = re.compile(r'\w')
+
+# Hint cells: '_' is an unrevealed letter and ' ' is the gap between the words of a phrase
+HIDDEN_CELL = '_'
+GAP_CELL = ' '
+
+
+def is_word_character(char: str) -> bool:
+    """Returns whether a character is matched by the regex class \\w."""
+    return WORD_CHARACTER.fullmatch(char) is not None
+
+
+def fold_character(char: str) -> str:
+    """Returns the case-insensitive form of a character, which is always a single character."""
+    folded = char.lower()
+    return folded if len(folded) == 1 else char
+
+
+def split_segments(text: str) -> list[tuple[int, str]]:
+    """Splits a word (or hint) at its gaps into the start position and text of each segment."""
+    segments = []
+    start = 0
+    for segment in text.split(GAP_CELL):
+        segments.append((start, segment))
+        start += len(segment) + 1
+
+    return segments
+
+
+class WordIndex:
+    """A precomputed index over a word list for resolving word hints without a full regex scan.
+
+    Words and hints are split at their gaps into segments, so a phrase like 'ice cream' is matched segment by segment.
+    Each segment has a mask: its length and the positions and characters of its punctuation (anything that is not a
+    letter, digit or underscore, like the '/' in 'AC/DC'), which skribbl.io shows from the start of the round. For each
+    segment number of each segment count, every mask has a posting set of the words whose segment has that mask, and
+    every revealed (offset, letter) pair within it has a posting set of the words whose segment has that letter there,
+    ignoring case. A hint is resolved by intersecting the posting sets of its segments, smallest first.
+    """
+
+    def __init__(self, word_list: list[str]) -> None:
+        """Initializes the WordIndex class."""
+        self.word_list = word_list
+        # Identifies the word list, so that lookups cached for one index are not used for an index over another list
+        self.fingerprint = hash(tuple(word_list))
+
+        # (segment count, segment number, mask) -> indices into word_list, in word_list order
+        self._segments: dict[tuple, list[int]] = {}
+        # (segment count, segment number, mask) -> indices into word_list
+        self._segment_postings: dict[tuple, set[int]] = {}
+        # (segment count, segment number, mask, offset, folded letter) -> indices into word_list
+        self._letter_postings: dict[tuple, set[int]] = {}
+        # folded word -> the words in word_list with that folded form
+        self._case_variants: dict[str, list[str]] = {}
+
+        for word_index, word in enumerate(word_list):
+            self._case_variants.setdefault(word.lower(), []).append(word)
+
+            segments = split_segments(word)
+
+            for segment_number, (_, segment) in enumerate(segments):
+                segment_key = (len(segments), segment_number, self.get_segment_mask(segment))
+
+                self._segments.setdefault(segment_key, []).append(word_index)
+                self._segment_postings.setdefault(segment_key, set()).add(word_index)
+
+                for offset, char in enumerate(segment):
+                    if is_word_character(char):
+                        self._letter_postings.setdefault((*segment_key, offset, fold_character(char)), set()).add(word_index)
+
+
+    @staticmethod
+    def get_segment_mask(segment: str) -> tuple[int, tuple[tuple[int, str], ...]]:
+        """Returns the mask of a word or hint segment: its length and the offsets and characters of its punctuation."""
+        return len(segment), tuple((offset, char) for offset, char in enumerate(segment) if char != HIDDEN_CELL and not is_word_character(char))
+
+
+    @staticmethod
+    def get_word_shape(word: str) -> tuple:
+        """Returns the shape of a word: the mask of each of its segments."""
+        return tuple(WordIndex.get_segment_mask(segment) for _, segment in split_segments(word))
+
+
+    @staticmethod
+    def get_hint_shape(word_hint: str) -> tuple:
+        """Returns the shape that every word matching the hint must have."""
+        return WordIndex.get_word_shape(word_hint)
+
+
+    @staticmethod
+    def get_hint_constraints(word_hint: str) -> list[tuple[int, str]]:
+        """Returns the (position, folded letter) pairs revealed by the hint. Punctuation is part of the hint's shape instead."""
+        return [(position, fold_character(char)) for position, char in enumerate(word_hint) if char != HIDDEN_CELL and is_word_character(char)]
+
+
+    @staticmethod
+    def matches_constraint(word: str, constraint: tuple[int, str]) -> bool:
+        """Returns whether a word of the hint's shape has the revealed letter of a constraint."""
+        position, char = constraint
+        return fold_character(word[position]) == char
+
+
+    def get_bucket(self, word_hint: str) -> list[str]:
+        """Returns every word with the same shape as the hint, ignoring revealed letters."""
+        return self._lookup(word_hint, with_letters=False)
+
+
+    def get_case_variants(self, word: str) -> list[str]:
+        """Returns the words in the word list that are the same as a word, ignoring case."""
+        return self._case_variants.get(word.lower(), [])
+
+
+    def lookup(self, word_hint: str) -> list[str]:
+        """Returns the words that match the hint, in word list order."""
+        return self._lookup(word_hint, with_letters=True)
+
+
+    def _lookup(self, word_hint: str, with_letters: bool) -> list[str]:
+        segments = split_segments(word_hint)
+        segment_keys = [(len(segments), segment_number, self.get_segment_mask(segment)) for segment_number, (_, segment) in enumerate(segments)]
+        letter_keys = [
+            (*segment_key, offset, fold_character(char))
+            for segment_key, (_, segment) in zip(segment_keys, segments)
+            for offset, char in enumerate(segment) if char != HIDDEN_CELL and is_word_character(char)
+        ] if with_letters else []
+
+        if len(segment_keys) == 1 and not letter_keys:
+            # A blank single-word hint, which has the most matches, so they are taken in order rather than sorted
+            return [self.word_list[word_index] for word_index in self._segments.get(segment_keys[0], [])]
+
+        posting_sets = [self._segment_postings.get(key, set()) for key in segment_keys] + [self._letter_postings.get(key, set()) for key in letter_keys]
+        posting_sets.sort(key=len)
+
+        if not posting_sets[0]:
+            return []
+
+        return [self.word_list[word_index] for word_index in sorted(posting_sets[0].intersection(*posting_sets[1:]))]
@@ -0,0 +1,98 @@
+"""Contains the WordStore class."""
+
+import sqlite3
+from os import path
+from threading import Lock
+
+from encounter_log import get_encounter_word
+
+
+class WordStore:
+    """An SQLite table of word encounter counts, kept up to date incrementally from the raw word encounters log.
+
+    The store remembers the byte offset it has read the log up to, so syncing only reads the lines appended since the
+    last sync rather than recounting the whole log.
+    """
+
+    def __init__(self, database_path: str, encounters_path: str) -> None:
+        """Initializes the WordStore class."""
+        self.database_path = database_path
+        self.encounters_path = encounters_path
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS words (word TEXT PRIMARY KEY, frequency INTEGER NOT NULL)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS checkpoint (id INTEGER PRIMARY KEY CHECK (id = 0), offset INTEGER NOT NULL, total_word_encounters INTEGER NOT NULL)')
+            self._connection.execute('INSERT OR IGNORE INTO checkpoint VALUES (0, 0, 0)')
+
+
+    def sync(self) -> int:
+        """Counts the lines appended to the encounters log since the last sync. Returns the number of new encounters."""
+        with self._lock:
+            offset, total_word_encounters = self._connection.execute('SELECT offset, total_word_encounters FROM checkpoint').fetchone()
+
+            if not path.exists(self.encounters_path):
+                return 0
+
+            if path.getsize(self.encounters_path) < offset:
+                # The log has been replaced, so count it again from the start
+                offset, total_word_encounters = 0, 0
+                self._connection.execute('DELETE FROM words')
+
+            with open(self.encounters_path, 'rb') as file:
+                file.seek(offset)
+                data = file.read()
+
+            # Leave any partially written final line for the next sync
+            data = data[:data.rfind(b'\n') + 1]
+
+            word_encounters: dict[str, int] = {}
+            for line in data.decode('utf-8').splitlines():
+                word = get_encounter_word(line)
+                if word:
+                    word_encounters[word] = word_encounters.get(word, 0) + 1
+
+            new_word_encounters = sum(word_encounters.values())
+
+            with self._connection:
+                self._connection.executemany(
+                    'INSERT INTO words VALUES (?, ?) ON CONFLICT (word) DO UPDATE SET frequency = frequency + excluded.frequency',
+                    word_encounters.items()
+                )
+                self._connection.execute(
+                    'UPDATE checkpoint SET offset = ?, total_word_encounters = ?',
+                    (offset + len(data), total_word_encounters + new_word_encounters)
+                )
+
+            return new_word_encounters
+
+
+    def get_word_frequencies(self) -> dict[str, int]:
+        """Returns the encounter count of every word, sorted alphabetically."""
+        with self._lock:
+            return dict(self._connection.execute('SELECT word, frequency FROM words ORDER BY word'))
+
+
+    def get_total_word_encounters(self) -> int:
+        """Returns the number of encounters counted so far."""
+        with self._lock:
+            return self._connection.execute('SELECT total_word_encounters FROM checkpoint').fetchone()[0]
+
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def load_word_frequencies(database_path: str, encounters_path: str) -> dict[str, int]:
+    """Brings the store at database_path up to date with the encounters log and returns every word's encounter count."""
+    word_store = WordStore(database_path, encounters_path)
+
+    try:
+        word_store.sync()
+        return word_store.get_word_frequencies()
+    finally:
+        word_store.close()
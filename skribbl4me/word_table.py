@@ -0,0 +1,93 @@
+"""Reads and writes the compact word table used to load the dictionary quickly at startup.
+
+The word table is a single binary file that is memory-mapped when loaded. All fields are little-endian:
+
+    header       magic, version, word count, and the size and modification time of the encounters log it was built from
+    offsets      word count + 1 unsigned 32-bit character offsets into the string table
+    frequencies  word count unsigned 32-bit encounter counts
+    strings      every word concatenated as UTF-8, sorted by length and then alphabetically
+
+A table is stale when the encounters log no longer has the size and modification time recorded in its header.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from os import path, replace, stat
+
+MAGIC = b'S4MW'
+VERSION = 1
+HEADER = struct.Struct('<4sIIQQ')
+
+
+def get_source_signature(source_path: str) -> tuple[int, int]:
+    """Returns the size and modification time used to detect a stale word table."""
+    source_stat = stat(source_path)
+    return source_stat.st_size, source_stat.st_mtime_ns
+
+
+def build_word_table(table_path: str, word_frequencies: dict[str, int], source_path: str) -> None:
+    """Writes a word table for the given word frequencies, built from the encounters log at source_path."""
+    words = sorted(word_frequencies, key=lambda word: (len(word), word))
+
+    offsets = array('I', [0])
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+
+    frequencies = array('I', [word_frequencies[word] for word in words])
+
+    if offsets.itemsize != 4 or frequencies.itemsize != 4:
+        raise RuntimeError('array type code I is not 32 bits on this platform')
+
+    # array uses the machine's byte order, and the table is little-endian
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+        frequencies.byteswap()
+
+    source_size, source_mtime_ns = get_source_signature(source_path)
+
+    # Write to a temporary file first so that a reader never sees a half-written table
+    temporary_path = table_path + '.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(words), source_size, source_mtime_ns))
+        file.write(offsets.tobytes())
+        file.write(frequencies.tobytes())
+        file.write(''.join(words).encode('utf-8'))
+
+    replace(temporary_path, table_path)
+
+
+def load_word_table(table_path: str, source_path: str) -> dict[str, int] | None:
+    """Returns the word frequencies stored in the word table, in table order, or None if it is missing or stale."""
+    if not path.exists(table_path) or not path.exists(source_path):
+        return None
+
+    with open(table_path, 'rb') as file:
+        try:
+            table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return None
+
+    with table:
+        if len(table) < HEADER.size:
+            return None
+
+        magic, version, word_count, source_size, source_mtime_ns = HEADER.unpack_from(table)
+        if magic != MAGIC or version != VERSION or (source_size, source_mtime_ns) != get_source_signature(source_path):
+            return None
+
+        offsets_start = HEADER.size
+        frequencies_start = offsets_start + (word_count + 1) * 4
+        strings_start = frequencies_start + word_count * 4
+
+        offsets = array('I', table[offsets_start:frequencies_start])
+        frequencies = array('I', table[frequencies_start:strings_start])
+        strings = table[strings_start:].decode('utf-8')
+
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+        frequencies.byteswap()
+
+    return {strings[offsets[index]:offsets[index + 1]]: frequencies[index] for index in range(word_count)}